@@ -0,0 +1,262 @@
+import asyncio
+import ssl
+import time
+import weakref
+from collections import deque
+from urllib.parse import urlparse
+
+from IPC.Config import Config
+from IPC.HttpResponseParser import HttpResponseParser
+from IPC.IPC_ConnectionException import IPC_ConnectionException
+from IPC.Tracer import Tracer
+
+
+class AsyncConnection(object):
+    """
+ * Single HTTP/1.1 keep-alive connection to the IPC host built on asyncio streams
+    """
+    __reader: asyncio.StreamReader
+    __writer: asyncio.StreamWriter
+    __lastUsed: float
+    __timeout = None
+    """
+    * @var bool Writing of the current request started
+    """
+    __sent = False
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, timeout = None):
+        """
+    * Use AsyncConnection.open() to create connection\n
+    * @param asyncio.StreamReader reader
+    * @param asyncio.StreamWriter writer
+    * @param float timeout Seconds to wait for every read, None waits forever
+        """
+        self.__reader = reader
+        self.__writer = writer
+        self.__timeout = timeout
+        self.__parser = HttpResponseParser()
+        self.__lastUsed = time.monotonic()
+
+    @staticmethod
+    async def open(host: str, port: int, sslContext = None, timeout = None):
+        """
+    * @param string host
+    * @param int port
+    * @param ssl.SSLContext sslContext TLS context, None for plain HTTP
+    * @param float timeout Seconds to wait for connecting and for every read, None waits forever\n
+    * @return AsyncConnection
+    * @raises OSError
+        """
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port, ssl=sslContext), timeout)
+        except asyncio.TimeoutError as ex:
+            raise TimeoutError('Timed out connecting IPC host') from ex
+
+        return AsyncConnection(reader, writer, timeout)
+
+    def isStale(self, idleTimeout: float):
+        """
+    * Health check for idle connection.
+    * Connection is stale if it was idle too long or the server closed it\n
+    * @param float idleTimeout Seconds\n
+    * @return boolean
+        """
+        if time.monotonic() - self.__lastUsed > idleTimeout:
+            return True
+
+        return self.__reader.at_eof() or self.__writer.is_closing()
+
+    def touch(self):
+        """
+    * Mark connection as used right now
+        """
+        self.__lastUsed = time.monotonic()
+
+    async def send(self, data):
+        """
+    * @param bytes|tuple data Raw HTTP request, or its parts e.g. (head, body)
+    * @raises OSError
+        """
+        self.__sent = False
+        if self.__reader.at_eof() or self.__writer.is_closing():
+            raise ConnectionResetError('Connection closed by IPC host')
+        self.__sent = True
+        if isinstance(data, (bytes, bytearray)):
+            self.__writer.write(data)
+        else:
+            self.__writer.writelines(data)
+        await self.__writer.drain()
+
+    def hasSent(self):
+        """
+    * Whether writing of the last request started. Until then the request may be safely repeated\n
+    * @return boolean
+        """
+        return self.__sent
+
+    async def getResponse(self):
+        """
+    * Read one HTTP response\n
+    * @return tuple (int status, dict headers with lower-case names, bytearray body, bool keepAlive)
+    * @raises IPC_Exception
+    * @raises OSError
+        """
+        parser = self.__parser
+        parser.reset()
+        reader = self.__reader
+        while not parser.isComplete():
+            try:
+                data = await asyncio.wait_for(reader.read(HttpResponseParser.BUFFER_SIZE), self.__timeout)
+            except asyncio.TimeoutError as ex:
+                raise TimeoutError('Timed out reading IPC response') from ex
+            if not data:
+                parser.feedEof()
+                break
+            parser.feed(data)
+
+        return parser.getStatus(), parser.getHeaders(), parser.getBody(), parser.isKeepAlive()
+
+    def close(self):
+        """
+    * Close underlying transport
+        """
+        self.__writer.close()
+
+
+class AsyncConnectionPool(object):
+    """
+ * Per-origin pool of keep-alive asyncio connections to the IPC API.
+ * Pools are bound to the event loop they were created in
+    """
+    __pools = weakref.WeakKeyDictionary()
+
+    __host: str
+    __port: int
+    __maxSize: int
+    __idleTimeout: float
+    __timeout = None
+
+    def __init__(self, url: str, maxSize: int, idleTimeout: float, timeout = None):
+        """
+    * @param string url IPC API URL, only the origin is used
+    * @param int maxSize Max count of idle connections kept open
+    * @param float idleTimeout Seconds an idle connection is considered reusable
+    * @param float timeout Seconds to wait for connecting and for every read, None waits forever
+        """
+        parsed = urlparse(url)
+        secure = parsed.scheme == 'https'
+        self.__host = parsed.hostname
+        self.__port = parsed.port or (443 if secure else 80)
+        self.__sslContext = ssl.create_default_context() if secure else None
+        self.__maxSize = maxSize
+        self.__idleTimeout = idleTimeout
+        self.__timeout = timeout
+        self.__idle = deque()
+
+    @staticmethod
+    def getInstance(cnf: Config):
+        """
+    * Return connection pool of the running event loop for the IPC URL origin and connection settings of given config.
+    * Configs with different pool size or timeouts get separate pools\n
+    * @param cnf: Config\n
+    * @return AsyncConnectionPool
+        """
+        url = cnf.getIpcURL()
+        parsed = urlparse(url)
+        settings = (cnf.getConnectionPoolSize(), cnf.getConnectionIdleTimeout(), cnf.getConnectionTimeout())
+        key = (parsed.scheme, parsed.hostname, parsed.port) + settings
+        pools = AsyncConnectionPool.__pools.setdefault(asyncio.get_running_loop(), {})
+        pool = pools.get(key)
+        if pool is None:
+            pool = pools[key] = AsyncConnectionPool(url, *settings)
+
+        return pool
+
+    def setMaxSize(self, maxSize: int):
+        """
+    * @param int maxSize Max count of idle connections kept open
+        """
+        self.__maxSize = maxSize
+
+    def setIdleTimeout(self, idleTimeout: float):
+        """
+    * @param float idleTimeout Seconds
+        """
+        self.__idleTimeout = idleTimeout
+
+    async def acquire(self):
+        """
+    * Return healthy idle connection or open a new one\n
+    * @return tuple (AsyncConnection, bool reused)
+    * @raises IPC_ConnectionException
+        """
+        while self.__idle:
+            conn = self.__idle.pop()
+            if not conn.isStale(self.__idleTimeout):
+                return conn, True
+            conn.close()
+
+        try:
+            return await AsyncConnection.open(self.__host, self.__port, self.__sslContext, self.__timeout), False
+        except (OSError, ssl.SSLError) as ex:
+            raise IPC_ConnectionException(f'Error connecting IPC URL: {ex}') from ex
+
+    def release(self, conn: AsyncConnection):
+        """
+    * Return connection to the pool for reuse
+    * @param conn: AsyncConnection
+        """
+        conn.touch()
+        if len(self.__idle) < self.__maxSize:
+            self.__idle.append(conn)
+        else:
+            conn.close()
+
+    def clear(self):
+        """
+    * Close all idle connections
+        """
+        while self.__idle:
+            self.__idle.pop().close()
+
+    async def request(self, data, stages = None):
+        """
+    * Send raw HTTP request on a pooled connection and read the response.
+    * A reused connection found closed before the request was written is dropped and the request is retried
+    * on another one. Once writing started the request is never repeated, API methods like IPCRefund are not idempotent\n
+    * @param bytes|tuple data Raw HTTP request or its parts
+    * @param list stages Trace stages, connect, send and receive timings are appended to it\n
+    * @return tuple (int status, dict headers, bytes body)
+    * @raises IPC_ConnectionException if connection failed, with the stage it failed in
+    * @raises IPC_Exception if response is not valid HTTP
+        """
+        if stages is None:
+            stages = []
+        while True:
+            start = time.perf_counter_ns()
+            conn, reused = await self.acquire()
+            stage = Tracer.STAGE_SEND
+            try:
+                connected = time.perf_counter_ns()
+                stages.append((Tracer.STAGE_CONNECT, start, connected))
+                await conn.send(data)
+                sent = time.perf_counter_ns()
+                stages.append((Tracer.STAGE_SEND, connected, sent))
+                stage = Tracer.STAGE_RECEIVE
+                status, headers, body, keepAlive = await conn.getResponse()
+                stages.append((Tracer.STAGE_RECEIVE, sent, time.perf_counter_ns()))
+            except OSError as ex:
+                conn.close()
+                if reused and not conn.hasSent():
+                    continue
+                raise IPC_ConnectionException(f'Error connecting IPC URL: {ex}', stage, conn.hasSent()) from ex
+            except BaseException:
+                conn.close()
+                raise
+
+            if keepAlive:
+                self.release(conn)
+            else:
+                conn.close()
+
+            return status, headers, body
@@ -1,8 +1,9 @@
-from IPC.Card import Card
 from IPC.Base import Base
+from IPC.Card import Card
 from IPC.Config import Config
 from IPC.Helper import Helper
 from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
 class Authorization(Base):
@@ -10,6 +11,15 @@ class Authorization(Base):
 * Process IPC method: IPCAuthorization.
 * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCAuthorization', (
+        ParamSchema.field('OrderID', 'getOrderID'),
+        ParamSchema.field('ItemName', 'getItemName', str, 'Empty or invalid item name.'),
+        ParamSchema.field('Amount', 'getAmount', Helper.isValidAmount, 'Empty or invalid amount'),
+        ParamSchema.field('Currency', 'getCurrency', error='Invalid currency'),
+        ParamSchema.field('CardToken', 'getCard.getCardToken'),
+        ParamSchema.field('Note', 'getNote'),
+        ParamSchema.field('OutputFormat', 'getOutputFormat'),
+    ), minVersion='1.4')
     __card: Card
     __currency = 'EUR'
     __amount: float
@@ -92,29 +102,7 @@ class Authorization(Base):
     * @return Response
     * @raises IPC_Exception
         """
-        self.validate()
-
-        self._addPostParam('IPCmethod', 'IPCAuthorization')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
-
-        self._addPostParam('OrderID', self.getOrderID())
-
-        self._addPostParam('ItemName', self.getItemName())
-
-        self._addPostParam('Amount', self.getAmount())
-        self._addPostParam('Currency', self.getCurrency())
-
-        self._addPostParam('CardToken', self.getCard().getCardToken())
-
-        self._addPostParam('Note', self.getNote())
-        self._addPostParam('OutputFormat', self.getOutputFormat())
-
-        return self._processPost()
+        return self._process()
 
     def validate(self):
         """
@@ -122,22 +110,7 @@ class Authorization(Base):
     * @return boolean
     * @raises IPC_Exception
         """
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
-
-        if not Helper.versionCheck(self._getCnf().getVersion(), '1.4'):
-            raise IPC_Exception('IPCVersion ' + self._getCnf().getVersion() + ' does not support IPCAuthorization method. Please use 1.4 or above.')
-
-        if self.getItemName() == None or not isinstance(self.getItemName(), str):
-            raise IPC_Exception('Empty or invalid item name.')
-
-        if self.getCurrency() == None:
-            raise IPC_Exception('Invalid currency')
-
-        if self.getAmount() == None or not Helper.isValidAmount(self.getAmount()):
-            raise IPC_Exception('Empty or invalid amount')
+        self._schema.validate(self)
 
         if self.getCard() == None:
             raise IPC_Exception('Missing card details')
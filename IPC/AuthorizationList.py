@@ -1,7 +1,6 @@
 from IPC.Base import Base
 from IPC.Config import Config
-from IPC.Helper import Helper
-from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
 class AuthorizationList(Base):
@@ -9,6 +8,9 @@ class AuthorizationList(Base):
  * Process IPC method: IPCAuthorizationList.
  * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCAuthorizationList', (
+        ParamSchema.field('OutputFormat', 'getOutputFormat'),
+    ), minVersion='1.4')
     def __init__(self, cnf: Config):
         """
     * Return purchase object\n
@@ -22,19 +24,7 @@ class AuthorizationList(Base):
     * @return Response
     * @raises IPC_Exception
         """
-        self.validate()
-
-        self._addPostParam('IPCmethod', 'IPCAuthorizationList')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
-
-        self._addPostParam('OutputFormat', self.getOutputFormat())
-
-        return self._processPost()
+        return self._process()
 
     def validate(self):
         """
@@ -42,12 +32,6 @@ class AuthorizationList(Base):
     * @return boolean
     * @raises IPC_Exception
         """
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
-
-        if not Helper.versionCheck(self._getCnf().getVersion(), '1.4'):
-            raise IPC_Exception('IPCVersion ' + self._getCnf().getVersion() + ' does not support IPCAuthorizationList method. Please use 1.4 or above.')
+        self._schema.validate(self)
 
         return True
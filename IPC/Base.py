@@ -1,17 +1,22 @@
 import abc
-import socket
-import ssl
-from urllib.parse import urlencode
+import time
 # from Crypto.Hash import SHA256
 # from Crypto.PublicKey import RSA
 # from Crypto.Signature import PKCS1_v1_5 as Signature_pkcs1_v1_5
 from base64 import b64encode, b64decode
 from IPC.Config import Config
+from IPC.ConnectionPool import ConnectionPool
 from IPC.Defines import Defines
+from IPC.FormRenderer import FormRenderer
 from IPC.Helper import Helper
 from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
+from IPC.PostParams import PostParams
 from IPC.Response import Response
-from urllib.parse import urlparse, parse_qsl
+from IPC.Signer import Signer
+from IPC.Trace import Trace
+from IPC.Tracer import Tracer
+from urllib.parse import urlparse
 
 from IPC import Crypto
 
@@ -26,9 +31,18 @@ class Base(metaclass=abc.ABCMeta):
     _outputFormat = Defines.COMMUNICATION_FORMAT_JSON
     __cnf: Config
     """
-    *  @var array Params for API Request
+    *  @var PostParams Params of the API Request being built, created per request on first _addPostParam()
     """
-    __params = {}
+    __params = None
+    """
+    *  @var ParamSchema API params of the IPCmethod. Classes collecting params in their own _prepare() describe only
+    *  the IPCmethod, whose header params they add with _addHeaderParams()
+    """
+    _schema: ParamSchema
+    """
+    *  @var Tracer No-op tracer of requests sent with Config without tracer
+    """
+    __nullTracer = Tracer()
 
     @staticmethod
     def isValidSignature(data: str, signature: str, pubKey: str):
@@ -36,7 +50,7 @@ class Base(metaclass=abc.ABCMeta):
     *  Verify signature of API Request params against the API public key\n
     *  @param string data Signed data
     *  @param string signature Signature in base64 format
-    *  @param string pubKey API public key\n
+    *  @param string|RsaKey pubKey API public key\n
     *  @return boolean
         """
         res = Crypto.verify(data, b64decode(signature), pubKey, Defines.SIGNATURE_ALGO)
@@ -68,7 +82,24 @@ class Base(metaclass=abc.ABCMeta):
         """
         if not isinstance(paramValue, str):
             paramValue = str(paramValue)
-        self.__params[paramName] = self.__encryptData(paramValue) if encrypt else Helper.escape(Helper.unescape(paramValue))
+        if self.__params is None:
+            self.__params = PostParams()
+        if encrypt:
+            encrypted = self.__encryptData(paramValue)
+            self.__params.set(paramName, encrypted, encrypted)
+        else:
+            self.__params.set(paramName, *self._encodePostParam(paramValue))
+
+    @staticmethod
+    def _encodePostParam(paramValue):
+        """
+    *  Values of API request param used for signature and sent to API\n
+    *  @param string paramValue\n
+    *  @return tuple (string raw, string escaped)
+        """
+        raw = Helper.unescape(paramValue if isinstance(paramValue, str) else str(paramValue))
+
+        return raw, Helper.escape(raw)
 
     def __encryptData(self, data: str):
         """
@@ -76,9 +107,24 @@ class Base(metaclass=abc.ABCMeta):
     *  @param string data\n
     *  @return string base64 encoded signature
         """
-        crypted = Crypto.encrypt(data, self._getCnf().getEncryptPublicKey())
+        crypted = Crypto.encrypt(data.encode('utf-8'), self._getCnf().getEncryptPublicKeyObject())
 
-        return b64encode(crypted)
+        return b64encode(crypted).decode('ascii')
+
+    def _addHeaderParams(self):
+        """
+    *  Add IPCmethod and Config params of _schema heading every API request
+        """
+        if self.__params is None:
+            self.__params = PostParams()
+        self.__params.update(self._schema.getHeader(self._getCnf()))
+
+    def _setPostParams(self, params: PostParams):
+        """
+    *  Replace API request params with params collected at once\n
+    *  @param params: PostParams
+        """
+        self.__params = params
 
     def _getCnf(self):
         """
@@ -98,30 +144,184 @@ class Base(metaclass=abc.ABCMeta):
         """
     *  Generate HTML form with POST params and auto-submit it
         """
-        #Add request signature
-        self.__params['Signature'] = self.__createSignature()
+        print(FormRenderer.toString(self._getCnf().getIpcURL(), self.__takePostParams()))
+
+    def _renderHtmlPost(self, compress = False):
+        """
+    *  Sign API Request params and render auto-submit HTML form\n
+    *  @param bool compress Return gzip compressed page, to be sent with Content-Encoding: gzip\n
+    *  @return bytes
+        """
+        return FormRenderer.render(self._getCnf().getIpcURL(), self.__takePostParams(), compress)
+
+    def _streamHtmlPost(self, write):
+        """
+    *  Sign API Request params and write auto-submit HTML form into response writer\n
+    *  @param callable write Called with bytes
+        """
+        FormRenderer.stream(self._getCnf().getIpcURL(), self.__takePostParams(), write)
+
+    def __takePostParams(self):
+        """
+    *  Sign collected API Request params and detach them from the object,
+    *  so the next request built by the same object starts with empty params\n
+    *  @return PostParams
+        """
+        return self._signPostParams(self._detachPostParams())
+
+    def _signPostParams(self, params: PostParams):
+        """
+    *  Add Signature to API Request params\n
+    *  @param params: PostParams\n
+    *  @return PostParams
+        """
+        signature = self.__createSignature(params)
+        params.set('Signature', signature, signature)
+
+        return params
+
+    def _detachPostParams(self):
+        """
+    *  Take collected API Request params, unsigned, and detach them from the object\n
+    *  @return PostParams
+        """
+        params = self.__params if self.__params is not None else PostParams()
+        self.__params = None
+
+        return params
+
+    @staticmethod
+    def __getSignDigest(params: PostParams):
+        """
+    *  @param params: PostParams\n
+    *  @return Hash object of request sign data
+        """
+        digest = Crypto.newDigest(Defines.SIGNATURE_ALGO)
+        params.updateDigest(digest)
 
-        c = '<body onload="document.ipcForm.submit()">'
-        c += '<form id="ipcForm" name="ipcForm" action="' + self._getCnf().getIpcURL() + '" method="post">'
-        for k, v in self.__params.items():
-            c += f'<input type="hidden" name="{k}" value="{v}" />\n'
-        c += '</form></body>'
-        print (c)
-        exit
+        return digest
 
-    def __createSignature(self):
+    def __createSignature(self, params: PostParams):
         """
     *  Create signature of API Request params against the SID private key\n
+    *  @param params: PostParams\n
     *  @return string base64 encoded signature
         """
-        __params = dict()
-        for k, v in self.__params.items():
-            __params[k] = Helper.unescape(v)
-        concData = b64encode('-'.join(str(x) for x in __params.values()).encode('utf-8'))
-        privKey = self._getCnf().getPrivateKey()
-        signature = Crypto.sign(concData, privKey, Defines.SIGNATURE_ALGO)
+        digest = self.__getSignDigest(params)
+        signer = self._getCnf().getSigner()
+        if signer is not None:
+            signature = signer.sign(digest, self._getCnf().getPrivateKeyObject())
+        else:
+            signature = Crypto.signDigest(digest, self._getCnf().getPrivateKeyObject())
+
+        return b64encode(signature).decode('ascii')
+
+    @staticmethod
+    def signBatch(requests):
+        """
+    *  Validate, collect and sign params of many requests at once.
+    *  Requests sharing a Config are signed with one Config signer call, so ProcessPoolSigner spreads them over all cores.
+    *  Send the result with processBatch(), or post the params from a HTML form\n
+    *  @param iterable requests Base objects with all details set\n
+    *  @return list of PostParams with Signature, in input order
+    *  @raises IPC_Exception
+        """
+        batch = []
+        groups = {}
+        for req in requests:
+            req._prepare()
+            params = req._detachPostParams()
+            batch.append(params)
+            cnf = req._getCnf()
+            groups.setdefault(id(cnf), (cnf, []))[1].append(params)
+
+        for cnf, group in groups.values():
+            signer = cnf.getSigner()
+            if signer is None:
+                signer = Signer()
+            signatures = signer.signMany([Base.__getSignDigest(params) for params in group], cnf.getPrivateKeyObject())
+            for params, signature in zip(group, signatures):
+                signature = b64encode(signature).decode('ascii')
+                params.set('Signature', signature, signature)
+
+        return batch
+
+    @staticmethod
+    def processBatch(requests):
+        """
+    *  Sign params of many API requests with signBatch() and send them one by one\n
+    *  @param iterable requests Base objects with all details set\n
+    *  @return list of Response, in input order
+    *  @raises IPC_Exception
+        """
+        requests = list(requests)
+
+        return [req.__processSigned(params) for req, params in zip(requests, Base.signBatch(requests))]
+
+    def __processSigned(self, params: PostParams):
+        """
+    *  Send already signed API Request params\n
+    *  @param params: PostParams\n
+    *  @return Response
+    *  @raises IPC_Exception
+        """
+        return self.__post(Trace(self._outputFormat), params)
+
+    def _buildPostRequest(self):
+        """
+    *  Sign API Request params and build raw HTTP POST request\n
+    *  @return tuple (bytes head, bytearray body)
+        """
+        return self._encodePostRequest(self.__takePostParams())
 
-        return b64encode(signature)
+    def _encodePostRequest(self, params: PostParams):
+        """
+    *  Build raw HTTP POST request of signed API Request params.
+    *  Body is encoded once into a bytearray and sent after the head without joining them\n
+    *  @param params: PostParams\n
+    *  @return tuple (bytes head, bytearray body)
+        """
+        url = urlparse(self._getCnf().getIpcURL())
+        body = params.encodeBody()
+
+        eol = "\r\n"
+        path = (url.path or '/') + ('?' + url.query if url.query else '')
+        head = f"POST {path} HTTP/1.1{eol}"
+        head += f"Host: {url.hostname}{eol}"
+        head += f"Content-type: application/x-www-form-urlencoded{eol}"
+        head += f"Content-length: {len(body)}{eol}"
+        head += f"Connection: keep-alive{eol}{eol}"
+
+        return head.encode('utf-8'), body
+
+    def _buildResponse(self, cont: bytes, stages = None):
+        """
+    *  Parse and verify raw API response body\n
+    *  @param bytes cont
+    *  @param list stages Optional, Trace.getStages() list to append parse and verify timings to\n
+    *  @return Response
+    *  @raises IPC_Exception
+        """
+        cont = cont.decode('utf-8').strip()
+
+        return Response.getInstance(self._getCnf(), cont, self._outputFormat, stages)
+
+    def _process(self):
+        """
+    *  Validate and collect API params, send POST Request to API and return Response object with validated response data.
+    *  Stage timings are passed to the tracer of Config\n
+    *  @return Response
+    *  @raises IPC_Exception
+        """
+        trace = Trace(self._outputFormat)
+        try:
+            self._prepare()
+        except Exception as ex:
+            self.__finishTrace(trace, ex)
+            raise
+        trace.addStage(Tracer.STAGE_PREPARE, trace.getStart(), time.perf_counter_ns())
+
+        return self.__post(trace)
 
     def _processPost(self):
         """
@@ -129,99 +329,131 @@ class Base(metaclass=abc.ABCMeta):
     *  @return Response
     *  @raises IPC_Exception
         """
-        self.__params['Signature'] = self.__createSignature()
-        url = urlparse(self._getCnf().getIpcURL())
-        secure = False # JSON.parse({"url": ""})
-        if not url.port:
-            if url.scheme == 'https':
-                url.port = 443
-                secure = True
+        return self.__post(Trace(self._outputFormat))
+
+    def __post(self, trace: Trace, params = None):
+        """
+    *  Sign collected API Request params, send them and verify the response, timing each stage\n
+    *  @param trace: Trace
+    *  @param PostParams params Already signed params, default is to sign the collected ones\n
+    *  @return Response
+    *  @raises IPC_Exception
+        """
+        try:
+            if params is None:
+                params = self._detachPostParams()
+                trace.setMethod(params.get('IPCmethod'))
+                start = time.perf_counter_ns()
+                req = self._encodePostRequest(self._signPostParams(params))
+                trace.addStage(Tracer.STAGE_SIGN, start, time.perf_counter_ns())
             else:
-                url.port = 80
-        postData = urlencode(self.__params)
-        # TODO mayby add try catch construction
-        # TODO: add ssl
-        if secure:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM) #tcp socket
-        else:
-            raw_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock = ssl.wrap_socket(raw_sock, ssl_version=ssl.PROTOCOL_TLSv1, ciphers="ADH-AES256-SHA")
-
-        sock.connect((url.hostname, url.port))
-        fp = sock.makefile()
-        # fsockopen(f"{ssl}{url.hostname}", url.port, errno, errstr, 10)
-        if not fp:
-            raise IPC_Exception('Error connecting IPC URL')
-        else:
-            eol = "\r\n"
-            path = url.path + ('' if (bool(url.query)) else ('?' + url.query))
-            req = f"POST {path} HTTP/1.1{eol}"
-            req += f"Host: {url.hostname}{eol}"
-            req += f"Content-type: application/x-www-form-urlencoded{eol}"
-            req += f"Content-length: {len(postData)}{eol}"
-            req += f"Connection: close{eol}{eol}"
-            req += f"{postData}{eol}{eol}"
-
-            sock.send(req.encode('utf-8'))
-
-            result = ''
-            line = sock.recv(1024)
-            while line:
-                result += line
-                line = sock.recv(1024)
-
-            fp.close()
-            sock.close()
-
-            result = result.split("{eol}{eol}", 2)[:-2]
-            header = result[0] if len(result) > 0 else ''
-            cont = result[1] if len(result) > 1 else ''
-
-            #Check Transfer-Encoding: chunked
-            if bool(cont) and 'Transfer-Encoding: chunked' in header:
-                check = self.__httpChunkedDecode(cont)
-                if check:
-                    cont = check
-            if cont:
-                cont = cont.strip()
-
-            return Response.getInstance(self._getCnf(), cont, self._outputFormat)
-
-    def __httpChunkedDecode(self, chunk: str):
-        """
-    *  Alternative of php http-chunked-decode function\n
-    *  @param string chunk\n
-    *  @return mixed
-        """
-        pos = 0
-        len = len(chunk)
-        dechunk = None
-        newlineAt = chunk.find("\n", pos + 1)
-
-        while pos < len and newlineAt:
-            chunkLenHex = chunk[pos:pos + newlineAt - pos]
-            if self.__is_hex(chunkLenHex):
-                return False
-
-            pos = newlineAt + 1
-            chunkLen = int(chunkLenHex.rstrip("\r\n"), 16)
-            dechunk += chunk[pos:pos + chunkLen]
-            pos = chunk.find("\n", pos + chunkLen) + 1
-            newlineAt = chunk.find("\n", pos + 1)
-
-
-        return dechunk
-
-    def __is_hex(_self, hex: str):
-        """
-    *  determine if a string can represent a number in hexadecimal\n
-    *  @param string hex\n
-    *  @return boolean True if the string is a hex, otherwise False
-        """
-        # regex is for weenies
-        hex = hex.lstrip("0").strip().lower()
-        if not bool(hex):
-            hex = "0"
-        dec = int(hex, 16)
-
-        return hex == "%x" % dec
+                trace.setMethod(params.get('IPCmethod'))
+                req = self._encodePostRequest(params)
+
+            pool = ConnectionPool.getInstance(self._getCnf())
+            status, header, cont = pool.request(req, trace.getStages())
+
+            response = self._buildResponse(cont, trace.getStages())
+            trace.setStatus(self.__getTraceStatus(response))
+        except Exception as ex:
+            self.__finishTrace(trace, ex)
+            raise
+        self.__finishTrace(trace)
+
+        return response
+
+    @staticmethod
+    def __getTraceStatus(response: Response):
+        """
+    *  @param response: Response\n
+    *  @return int None if response has no valid Status
+        """
+        try:
+            return response.getStatusCode()
+        except IPC_Exception:
+            return None
+
+    def __finishTrace(self, trace: Trace, error = None):
+        """
+    *  Pass timings of finished request to tracer of Config, or to the no-op Tracer when none is set.
+    *  Tracer errors do not fail the request\n
+    *  @param trace: Trace
+    *  @param Exception error
+        """
+        trace.finish()
+        if error is not None:
+            trace.setError(error)
+        tracer = self._getCnf().getTracer()
+        try:
+            (tracer if tracer is not None else Base.__nullTracer).finish(trace)
+        except Exception:
+            pass
+
+    def _prepare(self):
+        """
+    *  Validate all set details and collect API request params described by _schema
+    *  @raises IPC_Exception
+        """
+        self.validate()
+        if self.__params is None:
+            self.__params = PostParams()
+        self.__params.update(self._schema.entries(self, self.__encryptData))
+
+    async def process_async(self):
+        """
+    *  Asyncio counterpart of process(). Await it instead of calling process() inside event loop\n
+    *  @return Response
+    *  @raises IPC_Exception
+        """
+        # asyncio support is imported on first async call, so sync-only users do not load it
+        import asyncio
+
+        trace = Trace(self._outputFormat)
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._prepare)
+        except Exception as ex:
+            self.__finishTrace(trace, ex)
+            raise
+        trace.addStage(Tracer.STAGE_PREPARE, trace.getStart(), time.perf_counter_ns())
+
+        return await self.__postAsync(trace)
+
+    async def _processPostAsync(self):
+        """
+    *  Asyncio counterpart of _processPost()\n
+    *  @return Response
+    *  @raises IPC_Exception
+        """
+        return await self.__postAsync(Trace(self._outputFormat))
+
+    async def __postAsync(self, trace: Trace):
+        """
+    *  Asyncio counterpart of __post().
+    *  Signing and response verification run in the default executor, network I/O runs on the event loop.
+    *  Sign stage includes the wait for a free executor thread, parse and verify stages are timed inside it\n
+    *  @param trace: Trace\n
+    *  @return Response
+    *  @raises IPC_Exception
+        """
+        import asyncio
+        from IPC.AsyncConnectionPool import AsyncConnectionPool
+
+        loop = asyncio.get_running_loop()
+        try:
+            params = self._detachPostParams()
+            trace.setMethod(params.get('IPCmethod'))
+            start = time.perf_counter_ns()
+            req = await loop.run_in_executor(None, lambda: self._encodePostRequest(self._signPostParams(params)))
+            trace.addStage(Tracer.STAGE_SIGN, start, time.perf_counter_ns())
+
+            pool = AsyncConnectionPool.getInstance(self._getCnf())
+            status, header, cont = await pool.request(req, trace.getStages())
+
+            response = await loop.run_in_executor(None, self._buildResponse, cont, trace.getStages())
+            trace.setStatus(self.__getTraceStatus(response))
+        except Exception as ex:
+            self.__finishTrace(trace, ex)
+            raise
+        self.__finishTrace(trace)
+
+        return response
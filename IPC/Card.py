@@ -11,16 +11,16 @@ class Card(object):
     CARD_TYPE_VPAY = 5
     CARD_TYPE_JCB = 6
 
-    __cardType: int
-    __cardNumber: str
-    __cardHolder: str
-    __expMM: str
-    __expYY: str
-    __cvc: str
-    __eci: str
-    __avv: str
-    __xid: str
-    __cardToken: str
+    __cardType = None
+    __cardNumber = None
+    __cardHolder = None
+    __expMM = None
+    __expYY = None
+    __cvc = None
+    __eci = None
+    __avv = None
+    __xid = None
+    __cardToken = None
 
     def getCardType(self):
         """
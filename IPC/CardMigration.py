@@ -0,0 +1,265 @@
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from IPC.Card import Card
+from IPC.Config import Config
+from IPC.Defines import Defines
+from IPC.IAStoreCard import IAStoreCard
+from IPC.IAStoredCardUpdate import IAStoredCardUpdate
+from IPC.IPC_ConnectionException import IPC_ConnectionException
+from IPC.IPC_Exception import IPC_Exception
+from IPC.IPC_GeneralErrorException import IPC_GeneralErrorException
+
+
+class CardMigration(object):
+    """
+ * Bulk migration of stored cards to myPOS card tokens with IPCIAStoreCard, or bulk IPCIAStoredCardUpdate.
+ * Each card is validated, encrypted, signed and sent by a bounded pool of worker threads over the pooled
+ * keep-alive connections, RSA operations of pycryptodome run outside of the GIL.
+ * Every finished card is appended to a journal, so an interrupted migration resumes with cards
+ * not stored yet, and the journal is turned into a token mapping file.
+ * A card whose request reached IPC without a response is journaled as unknown, it may be stored already
+    """
+    """
+    * Card fields, as CSV columns or keys of card dicts. Only reference, the card ID in the old vault, is required
+    """
+    FIELD_REFERENCE = 'reference'
+    FIELD_CARD_NUMBER = 'cardNumber'
+    FIELD_CARD_TOKEN = 'cardToken'
+    FIELD_CARD_TYPE = 'cardType'
+    FIELD_CARD_HOLDER = 'cardHolder'
+    FIELD_EXP_MM = 'expMM'
+    FIELD_EXP_YY = 'expYY'
+    FIELD_CVC = 'cvc'
+
+    RESULT_STORED = 'stored'
+    RESULT_FAILED = 'failed'
+    RESULT_UNKNOWN = 'unknown'
+
+    __cnf: Config
+    __journalPath: str
+    __concurrency: int
+    __retries: int
+    __backoff: float
+    __retryUnknown: bool
+
+    def __init__(self, cnf: Config, journalPath: str, requestClass = IAStoreCard, concurrency = None, retries = 3, backoff = 0.5,
+                 cardVerification = IAStoreCard.CARD_VERIFICATION_NO, amount = None, currency = None, retryUnknown = False):
+        """
+    * @param cnf: Config Connection pool size of the config should be at least concurrency
+    * @param string journalPath Append-only journal, one JSON line per finished card. Card details are not written to it
+    * @param type requestClass IAStoreCard|IAStoredCardUpdate
+    * @param int concurrency Max count of cards in flight, default is Config connection pool size
+    * @param int retries Max count of retries per card on STATUS_IPC_ERROR or on connection failed before the request was sent
+    * @param float backoff Seconds before first retry, doubled on each next retry
+    * @param int cardVerification CARD_VERIFICATION_NO|CARD_VERIFICATION_YES
+    * @param float amount Verification amount, with CARD_VERIFICATION_YES
+    * @param string currency Verification currency, with CARD_VERIFICATION_YES
+    * @param bool retryUnknown Send again cards journaled as unknown, which may create a second token for the same card
+        """
+        if concurrency is None:
+            concurrency = cnf.getConnectionPoolSize()
+        if concurrency < 1:
+            raise IPC_Exception('Invalid concurrency')
+        if requestClass not in (IAStoreCard, IAStoredCardUpdate):
+            raise IPC_Exception('Invalid request class')
+        self.__cnf = cnf
+        self.__journalPath = journalPath
+        self.__requestClass = requestClass
+        self.__concurrency = concurrency
+        self.__retries = retries
+        self.__backoff = backoff
+        self.__cardVerification = cardVerification
+        self.__amount = amount
+        self.__currency = currency
+        self.__retryUnknown = retryUnknown
+
+    def migrateCsv(self, path: str, onResult = None):
+        """
+    * Migrate cards from CSV file with header of FIELD_* names\n
+    * @param string path
+    * @param callable onResult\n
+    * @return dict Counts of stored, failed, unknown and skipped cards
+    * @raises IPC_Exception
+        """
+        with open(path, newline='', encoding='utf-8') as file:
+            return self.migrate(csv.DictReader(file), onResult)
+
+    def migrate(self, cards, onResult = None):
+        """
+    * Migrate cards, skipping cards already stored according to the journal.
+    * Cards failed in previous run are tried again, cards with unknown result only with retryUnknown.
+    * Cards without reference are failed\n
+    * @param iterable cards Dicts with FIELD_* keys
+    * @param callable onResult Called with (string reference, Response|IPC_Exception result) for each finished card\n
+    * @return dict Counts of stored, failed, unknown and skipped cards
+    * @raises IPC_Exception
+        """
+        try:
+            self.__cnf.validate()
+        except Exception as ex:
+            raise IPC_Exception(f'Invalid Config details: {ex}')
+
+        skip = (self.RESULT_STORED,) if self.__retryUnknown else (self.RESULT_STORED, self.RESULT_UNKNOWN)
+        done = set(reference for reference, entry in self.__readEntries().items() if entry['result'] in skip)
+        stats = {self.RESULT_STORED: 0, self.RESULT_FAILED: 0, self.RESULT_UNKNOWN: 0, 'skipped': 0}
+
+        def pending(cards):
+            seen = set()
+            for card in cards:
+                reference = card.get(self.FIELD_REFERENCE)
+                if not reference:
+                    # failed by __store, there is no reference to tell duplicates apart
+                    yield card
+                    continue
+                if reference in done or reference in seen:
+                    stats['skipped'] += 1
+                    continue
+                seen.add(reference)
+                yield card
+
+        cards = pending(cards)
+        with open(self.__journalPath, 'ab+') as journal:
+            # do not continue a line cut by interrupted run
+            if journal.seek(0, os.SEEK_END) > 0:
+                journal.seek(-1, os.SEEK_END)
+                if journal.read(1) != b'\n':
+                    journal.write(b'\n')
+            with ThreadPoolExecutor(max_workers=self.__concurrency) as executor:
+                futures = set(executor.submit(self.__store, card) for card in itertools.islice(cards, self.__concurrency))
+                while futures:
+                    finished, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        for card in itertools.islice(cards, 1):
+                            futures.add(executor.submit(self.__store, card))
+                        reference, result = future.result()
+                        entry = self.__journalEntry(reference, result)
+                        journal.write((json.dumps(entry) + '\n').encode('utf-8'))
+                        journal.flush()
+                        stats[entry['result']] += 1
+                        if onResult is not None:
+                            onResult(reference, result)
+
+        return stats
+
+    def readJournal(self):
+        """
+    * Card tokens of cards stored according to the journal, later entries of the same card win\n
+    * @return dict reference => card token
+        """
+        return {reference: entry.get('cardToken') for reference, entry in self.__readEntries().items()
+                if entry['result'] == self.RESULT_STORED}
+
+    def __readEntries(self):
+        """
+    * Last journal entry of every card with reference\n
+    * @return dict reference => dict entry
+        """
+        entries = {}
+        if not os.path.exists(self.__journalPath):
+            return entries
+        with open(self.__journalPath, encoding='utf-8') as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # last line may be cut by interrupted run
+                    continue
+                if isinstance(entry, dict) and entry.get('reference') and 'result' in entry:
+                    entries[entry['reference']] = entry
+
+        return entries
+
+    def writeMapping(self, path: str):
+        """
+    * Write CSV file with reference and cardToken of every stored card\n
+    * @param string path\n
+    * @return int Count of written cards
+        """
+        tokens = self.readJournal()
+        temp = path + '.tmp'
+        with open(temp, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow([self.FIELD_REFERENCE, self.FIELD_CARD_TOKEN])
+            writer.writerows(tokens.items())
+        os.replace(temp, path)
+
+        return len(tokens)
+
+    def __store(self, card: dict):
+        """
+    * Store single card with retry and exponential backoff.
+    * Only STATUS_IPC_ERROR and connections failed before the request was sent are retried,
+    * a request that reached IPC may have stored the card already.
+    * Card details are validated by process()\n
+    * @param dict card\n
+    * @return tuple (string reference, Response|IPC_Exception result)
+        """
+        reference = card.get(self.FIELD_REFERENCE)
+        attempt = 0
+        while True:
+            try:
+                req = self.__newRequest(card)
+            except Exception as ex:
+                return reference, ex if isinstance(ex, IPC_Exception) else IPC_Exception(str(ex))
+            try:
+                result = req.process()
+                if result.getStatusCode() != Defines.STATUS_IPC_ERROR:
+                    return reference, result
+            except (IPC_ConnectionException, IPC_GeneralErrorException) as ex:
+                if isinstance(ex, IPC_ConnectionException) and ex.isSent():
+                    return reference, ex
+                result = ex
+            except IPC_Exception as ex:
+                return reference, ex
+
+            if attempt >= self.__retries:
+                return reference, result
+            time.sleep(self.__backoff * (2 ** attempt))
+            attempt += 1
+
+    def __newRequest(self, fields: dict):
+        """
+    * @param dict fields\n
+    * @return IAStoreCard|IAStoredCardUpdate
+        """
+        if not fields.get(self.FIELD_REFERENCE):
+            raise IPC_Exception('Missing card reference')
+
+        card = Card()
+        card.setCardNumber(fields.get(self.FIELD_CARD_NUMBER))
+        card.setCardToken(fields.get(self.FIELD_CARD_TOKEN))
+        card.setCardHolder(fields.get(self.FIELD_CARD_HOLDER))
+        card.setExpMM(fields.get(self.FIELD_EXP_MM))
+        card.setExpYY(fields.get(self.FIELD_EXP_YY))
+        card.setCvc(fields.get(self.FIELD_CVC))
+        cardType = fields.get(self.FIELD_CARD_TYPE)
+        card.setCardType(int(cardType) if cardType else None)
+
+        req = self.__requestClass(self.__cnf)
+        req.setCard(card)
+        req.setCardVerification(self.__cardVerification)
+        if self.__amount is not None:
+            req.setAmount(self.__amount)
+        if self.__currency is not None:
+            req.setCurrency(self.__currency)
+
+        return req
+
+    def __journalEntry(self, reference, result):
+        """
+    * @param string reference
+    * @param Response|IPC_Exception result\n
+    * @return dict
+        """
+        if isinstance(result, IPC_ConnectionException) and result.isSent():
+            return {'reference': reference, 'result': self.RESULT_UNKNOWN, 'error': str(result)}
+        if isinstance(result, IPC_Exception):
+            return {'reference': reference, 'result': self.RESULT_FAILED, 'error': str(result)}
+        if result.getStatusCode() != Defines.STATUS_SUCCESS:
+            return {'reference': reference, 'result': self.RESULT_FAILED, 'status': result.getStatusCode(), 'error': result.getStatusMsg()}
+        return {'reference': reference, 'result': self.RESULT_STORED, 'cardToken': result.get('CardToken')}
@@ -1,28 +1,97 @@
+from decimal import Decimal, InvalidOperation
+
 from IPC.Helper import Helper
 from IPC.IPC_Exception import IPC_Exception
 
 
 class Cart(object):
     """
- * Purchase cart object
+ * Purchase cart object.
+ * Items are kept in parallel lists, prices and amounts as Decimal so that totals are exact,
+ * cart total is updated when items are added
     """
     ITEM_TYPE_ARTICLE = 'article'
     ITEM_TYPE_DELIVERY = 'delivery'
     ITEM_TYPE_DISCOUNT = 'discount'
 
     """
-    * Array containing cart items\n
-    * @var array
+    * Item names, quantities, single item prices, line amounts and delivery flags, by item position\n
+    * @var list
+    """
+    __names: list
+    __quantities: list
+    __prices: list
+    __amounts: list
+    __deliveries: list
+    """
+    * Sum of line amounts\n
+    * @var Decimal
     """
-    __cart = []
+    __total: Decimal
+
+    def __init__(self):
+        self.__names = []
+        self.__quantities = []
+        self.__prices = []
+        self.__amounts = []
+        self.__deliveries = []
+        self.__total = Decimal(0)
 
     def add(self, itemName, quantity, price, type = ITEM_TYPE_ARTICLE):
         """
     * @param string itemName Item name
     * @param int quantity Items quantity
-    * @param float price Single item price
+    * @param float|Decimal|string price Single item price
     * @param string type\n
     * @return Cart
+    * @raises IPC_Exception
+        """
+        price, amount, delivery = self.__line(itemName, quantity, price, type)
+
+        self.__names.append(itemName)
+        self.__quantities.append(quantity)
+        self.__prices.append(price)
+        self.__amounts.append(amount)
+        self.__deliveries.append(delivery)
+        self.__total += amount
+
+        return self
+
+    def addMany(self, items):
+        """
+    * Add many items at once, e.g. lines of large B2B order.
+    * Either all items are added or none, if any of them is invalid\n
+    * @param iterable items Tuples (itemName, quantity, price) or (itemName, quantity, price, type)\n
+    * @return Cart
+    * @raises IPC_Exception
+        """
+        line = self.__line
+        names = []
+        quantities = []
+        prices = []
+        amounts = []
+        deliveries = []
+        for item in items:
+            price, amount, delivery = line(*item)
+            names.append(item[0])
+            quantities.append(item[1])
+            prices.append(price)
+            amounts.append(amount)
+            deliveries.append(delivery)
+
+        self.__names.extend(names)
+        self.__quantities.extend(quantities)
+        self.__prices.extend(prices)
+        self.__amounts.extend(amounts)
+        self.__deliveries.extend(deliveries)
+        self.__total += sum(amounts, Decimal(0))
+
+        return self
+
+    def __line(self, itemName, quantity, price, type = ITEM_TYPE_ARTICLE):
+        """
+    * Validate item and calculate its price and line amount\n
+    * @return tuple (Decimal price, Decimal amount, int|None delivery)
     * @raises IPC_Exception
         """
         if not bool(itemName):
@@ -31,43 +100,46 @@ class Cart(object):
         if not bool(quantity) or not Helper.isValidCartQuantity(quantity):
             raise IPC_Exception('Invalid cart item quantity')
 
-        if not bool(price) or not Helper.isValidAmount(price):
+        # str() keeps the digits of float prices as written, e.g. 9.99 and not its binary value
+        text = price if isinstance(price, str) else str(price)
+        if not bool(price) or not Helper.isValidAmount(text):
             raise IPC_Exception('Invalid cart item price')
 
-        item = {
-            'name': itemName,
-            'quantity': quantity,
-            'price': price,
-        }
+        if not isinstance(price, Decimal):
+            # Helper.isValidAmount() checks only the leading number, e.g. '5abc' passes it
+            try:
+                price = Decimal(text)
+            except InvalidOperation:
+                raise IPC_Exception('Invalid cart item price')
 
+        delivery = None
         if type == self.ITEM_TYPE_DELIVERY:
-            item['delivery'] = 1
+            delivery = 1
         elif type == self.ITEM_TYPE_DISCOUNT:
-            item['price'] = num = -1 * abs(item['price'])
+            price = -abs(price)
 
-        self.__cart += item
-
-        return self
+        return price, price * quantity, delivery
 
     def getTotal(self):
         """
     * Returns cart total amount\n
-    * @return float
+    * @return Decimal
         """
-        sum = 0
-        if bool(self.__cart):
-            for v in self.__cart :
-                sum += v['quantity'] * v['price']
-
-        return sum
+        return self.__total
 
     def getItemsCount(self):
         """
     * Returns count of items in cart\n
     * @return int
         """
-        # TODO: select one of (list, dict)
-        return self.__cart.count if (bool(self.__cart) and isinstance(self.__cart, (list, dict))) else 0
+        return len(self.__names)
+
+    def getItems(self):
+        """
+    * Iterate cart items in order they were added\n
+    * @return iterator of tuples (string name, int quantity, Decimal price, Decimal amount, int|None delivery)
+        """
+        return zip(self.__names, self.__quantities, self.__prices, self.__amounts, self.__deliveries)
 
     def validate(self):
         """
@@ -75,14 +147,26 @@ class Cart(object):
     * @return boolean
     * @raises IPC_Exception
         """
-        if not self.getCart() or self.getItemsCount() == 0:
+        if self.getItemsCount() == 0:
             raise IPC_Exception('Missing cart items')
 
         return True
 
     def getCart(self):
         """
-    * Return cart array\n
+    * Return cart array, with item as dict with keys name, quantity, price and delivery if set.
+    * Items are created on each call, use getItems() to iterate cart\n
     * @return array
         """
-        return self.__cart
+        cart = []
+        for name, quantity, price, amount, delivery in self.getItems():
+            item = {
+                'name': name,
+                'quantity': quantity,
+                'price': price,
+            }
+            if delivery:
+                item['delivery'] = delivery
+            cart.append(item)
+
+        return cart
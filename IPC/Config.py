@@ -7,6 +7,7 @@ from IPC.Helper import Helper
 from IPC.IPC_Exception import IPC_Exception
 from IPC.Defines import Defines
 import os
+import threading
 
 class Config(object):
     """
@@ -23,12 +24,60 @@ class Config(object):
     __ipc_url = 'https://www.mypos.eu/vmp/checkout'
     __developerKey: str
     __source: str
+    __connectionPoolSize = 10
+    __connectionIdleTimeout = 30.0
+    __connectionTimeout = 60.0
+    __signatureCache = None
+    __signer = None
+    __tracer = None
+    """
+    *  @var int Changed by every setter of request details, validation result is cached for one revision.
+    *  Runtime settings do not change it, they feed neither request params nor validation
+    """
+    __revision = 0
+    __validRevision = -1
+    __frozen = False
+    """
+    *  @var dict Parsed RSA key objects by key name, stored together with the PEM they were built from
+    """
+    __keyCache: dict
 
     def __init__(self):
         """
     *  Config constructor.
         """
         self.__source = 'SDK_Python_' + Defines.SDK_VERSION
+        self.__keyCache = {}
+        self.__keyLock = threading.Lock()
+        self.__revisionLock = threading.Lock()
+
+    def __getKeyObject(self, name: str, pem: str):
+        """
+    *  Return parsed RSA key for the given PEM, importing it only once per key material\n
+    *  @param string name Cache slot name
+    *  @param string pem PEM encoded key\n
+    *  @return RsaKey
+        """
+        cached = self.__keyCache.get(name)
+        if cached is not None and cached[0] is pem:
+            return cached[1]
+
+        with self.__keyLock:
+            cached = self.__keyCache.get(name)
+            if cached is not None and cached[0] is pem:
+                return cached[1]
+            key = Crypto.importKey(pem)
+            self.__keyCache[name] = (pem, key)
+
+        return key
+
+    def __invalidateKey(self, name: str):
+        """
+    *  Drop parsed RSA key from cache after key material was changed\n
+    *  @param string name Cache slot name
+        """
+        with self.__keyLock:
+            self.__keyCache.pop(name, None)
 
     def setPrivateKeyPath(self, path: str):
         """
@@ -39,7 +88,7 @@ class Config(object):
         """
         if not os.path.isfile(path) or not os.access(path, os.R_OK):
             raise IPC_Exception('Private key not found in:' + path)
-        self.__privateKey = open(path).read(1000)
+        self.setPrivateKey(open(path).read(1000))
 
         return self
 
@@ -56,10 +105,20 @@ class Config(object):
     *  @param string publicKey\n
     *  @return Config
         """
+        self.__checkFrozen()
         self.__APIPublicKey = publicKey
+        self.__invalidateKey('api_public')
+        self.__changed()
 
         return self
 
+    def getAPIPublicKeyObject(self):
+        """
+    *  IPC API public RSA key, parsed once and cached until the key is changed\n
+    *  @return RsaKey
+        """
+        return self.__getKeyObject('api_public', self.getAPIPublicKey())
+
     def setAPIPublicKeyPath(self, path: str):
         """
     *  IPC API public RSA key as a filepath\n
@@ -67,9 +126,9 @@ class Config(object):
     *  @return Config
     *  @raises IPC_Exception
         """
-        if path:
+        if not os.path.isfile(path) or not os.access(path, os.R_OK):
             raise IPC_Exception('Public key not found in:' + path)
-        self.__APIPublicKey = open(path).read(1000)
+        self.setAPIPublicKey(open(path).read(1000))
 
         return self
 
@@ -89,10 +148,20 @@ class Config(object):
         * \r\n
         *  @return Config
         """
+        self.__checkFrozen()
         self.__encryptPublicKey = key
+        self.__invalidateKey('encrypt_public')
+        self.__changed()
 
         return self
 
+    def getEncryptPublicKeyObject(self):
+        """
+    *  Public RSA key using for encryption sensitive data, parsed once and cached until the key is changed\n
+    *  @return RsaKey
+        """
+        return self.__getKeyObject('encrypt_public', self.getEncryptPublicKey())
+
     def setEncryptPublicKeyPath(self, path: str):
         """
     *  Public RSA key using for encryption sensitive data\n
@@ -100,9 +169,9 @@ class Config(object):
     *  @return Config
     *  @raises IPC_Exception
         """
-        if path:
+        if not os.path.isfile(path) or not os.access(path, os.R_OK):
             raise IPC_Exception('Key not found in:' + path)
-        self.__encryptPublicKey = open(path).read(1000)
+        self.setEncryptPublicKey(open(path).read(1000))
 
         return self
 
@@ -119,7 +188,9 @@ class Config(object):
     *  @param string lang\n
     *  @return Config
         """
+        self.__checkFrozen()
         self.__lang = lang
+        self.__changed()
 
         return self
 
@@ -136,7 +207,9 @@ class Config(object):
     *  @param string developerKey\n
     *  @return Config
         """
+        self.__checkFrozen()
         self.__developerKey = developerKey
+        self.__changed()
 
         return self
 
@@ -151,14 +224,63 @@ class Config(object):
     *  Additional parameter to specify the source of request\n
     *  @param string source
         """
+        self.__checkFrozen()
         self.__source = source
+        self.__changed()
+
+    def __checkFrozen(self):
+        """
+    *  Called by setters of config details before the new value is stored
+    *  @raises IPC_Exception if config is frozen
+        """
+        if self.__frozen:
+            raise IPC_Exception('Config is frozen')
+
+    def __changed(self):
+        """
+    *  Mark config as changed after a setter stored new value, so data derived from the old value
+    *  is never cached under the new revision. Setters running in parallel threads never lose a change
+        """
+        with self.__revisionLock:
+            self.__revision += 1
+
+    def getRevision(self):
+        """
+    *  Counter changed by every setter of request details, e.g. to invalidate data derived from config\n
+    *  @return int
+        """
+        return self.__revision
+
+    def freeze(self):
+        """
+    *  Validate config once and make its request details immutable, their setters raise IPC_Exception afterwards.
+    *  Runtime settings stay changeable: tracer, signer, signature cache and connection pool settings.
+    *  Useful for configs shared by long-lived workers\n
+    *  @return Config
+    *  @raises IPC_Exception
+        """
+        self.validate()
+        self.__frozen = True
+
+        return self
+
+    def isFrozen(self):
+        """
+    *  @return boolean
+        """
+        return self.__frozen
 
     def validate(self):
         """
-    *  Validate all set config details\n
+    *  Validate all set config details.
+    *  Successful validation is remembered until a setter changes the config\n
     *  @return boolean
     *  @raises IPC_Exception
         """
+        revision = self.__revision
+        if self.__validRevision == revision:
+            return True
+
         if self.getKeyIndex() == None:
             raise IPC_Exception('Invalid Key Index')
 
@@ -175,10 +297,12 @@ class Config(object):
             raise IPC_Exception('Invalid IPC Version')
 
         try:
-            Crypto.importKey(self.getPrivateKey())
+            self.getPrivateKeyObject()
         except:
             raise IPC_Exception(f'Invalid Private key')
 
+        self.__validRevision = revision
+
         return True
 
     def getKeyIndex(self):
@@ -194,7 +318,9 @@ class Config(object):
     *  @param int keyIndex\n
     *  @return Config
         """
+        self.__checkFrozen()
         self.__keyIndex = keyIndex
+        self.__changed()
 
         return self
 
@@ -211,7 +337,112 @@ class Config(object):
     *  @param string ipc_url\n
     *  @return Config
         """
+        self.__checkFrozen()
         self.__ipc_url = ipc_url
+        self.__changed()
+
+        return self
+
+    def getConnectionPoolSize(self):
+        """
+    *  Max count of idle keep-alive connections kept open per IPC host\n
+    *  @return int
+        """
+        return self.__connectionPoolSize
+
+    def setConnectionPoolSize(self, connectionPoolSize: int):
+        """
+    *  Max count of idle keep-alive connections kept open per IPC host\n
+    *  @param int connectionPoolSize\n
+    *  @return Config
+        """
+        self.__connectionPoolSize = connectionPoolSize
+
+        return self
+
+    def getConnectionIdleTimeout(self):
+        """
+    *  Seconds an idle keep-alive connection may be reused\n
+    *  @return float
+        """
+        return self.__connectionIdleTimeout
+
+    def setConnectionIdleTimeout(self, connectionIdleTimeout: float):
+        """
+    *  Seconds an idle keep-alive connection may be reused\n
+    *  @param float connectionIdleTimeout\n
+    *  @return Config
+        """
+        self.__connectionIdleTimeout = connectionIdleTimeout
+
+        return self
+
+    def getConnectionTimeout(self):
+        """
+    *  Seconds to wait for connecting to IPC host and for every read of its response\n
+    *  @return float
+        """
+        return self.__connectionTimeout
+
+    def setConnectionTimeout(self, connectionTimeout: float):
+        """
+    *  Seconds to wait for connecting to IPC host and for every read of its response\n
+    *  @param float connectionTimeout\n
+    *  @return Config
+        """
+        self.__connectionTimeout = connectionTimeout
+
+        return self
+
+    def getSignatureCache(self):
+        """
+    *  Cache of verified response signatures, None if disabled\n
+    *  @return SignatureCache
+        """
+        return self.__signatureCache
+
+    def setSignatureCache(self, signatureCache):
+        """
+    *  Enable caching of verified response signatures, e.g. for replayed IPC notifications.
+    *  Pass None to disable it\n
+    *  @param SignatureCache signatureCache\n
+    *  @return Config
+        """
+        self.__signatureCache = signatureCache
+
+        return self
+
+    def getSigner(self):
+        """
+    *  Signer used for API requests, None to sign with the private key in the current process\n
+    *  @return Signer
+        """
+        return self.__signer
+
+    def setSigner(self, signer):
+        """
+    *  Signer used for API requests, e.g. ProcessPoolSigner for large batches\n
+    *  @param Signer signer\n
+    *  @return Config
+        """
+        self.__signer = signer
+
+        return self
+
+    def getTracer(self):
+        """
+    *  Tracer receiving stage timings of API requests, None if requests are not timed\n
+    *  @return Tracer
+        """
+        return self.__tracer
+
+    def setTracer(self, tracer):
+        """
+    *  Time stages of API requests, e.g. with OpenTelemetryTracer. Pass None to disable it\n
+    *  @param Tracer tracer\n
+    *  @return Config
+        """
+        self.__tracer = tracer
 
         return self
 
@@ -228,7 +459,9 @@ class Config(object):
     *  @param int sid\n
     *  @return Config
         """
+        self.__checkFrozen()
         self.__sid = sid
+        self.__changed()
 
         return self
 
@@ -245,7 +478,9 @@ class Config(object):
     *  @param string wallet\n
     *  @return Config
         """
+        self.__checkFrozen()
         self.__wallet = wallet
+        self.__changed()
 
         return self
 
@@ -262,7 +497,9 @@ class Config(object):
     *  @param string version\n
     *  @return Config
         """
+        self.__checkFrozen()
         self.__version = version
+        self.__changed()
 
         return self
 
@@ -279,10 +516,20 @@ class Config(object):
     *  @param string privateKey\n
     *  @return Config
         """
+        self.__checkFrozen()
         self.__privateKey = privateKey
+        self.__invalidateKey('private')
+        self.__changed()
 
         return self
 
+    def getPrivateKeyObject(self):
+        """
+    *  Store RSA key, parsed once and cached until the key is changed\n
+    *  @return RsaKey
+        """
+        return self.__getKeyObject('private', self.getPrivateKey())
+
     def loadConfigurationPackage(self, configurationPackage):
         """
     *  Decrypt data string and set configuration parameters\n
@@ -300,23 +547,18 @@ class Config(object):
         if not data:
             raise IPC_Exception('Invalid autogenerated data')
 
-        for key, value in data :
-            if key == '__sid':
+        for key, value in data.items():
+            if key == 'sid':
                 self.setSid(value)
-                break
             elif key == 'cn':
                 self.setWallet(value)
-                break
             elif key == 'pk':
                 self.setPrivateKey(value)
-                break
             elif key == 'pc':
                 self.setAPIPublicKey(value)
                 self.setEncryptPublicKey(value)
-                break
             elif key == 'idx':
                 self.setKeyIndex(value)
-                break
             else:
                 raise IPC_Exception('Unknown autogenerated authentication data parameter: ' + key)
 
@@ -0,0 +1,287 @@
+import select
+import socket
+import ssl
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+from IPC.Config import Config
+from IPC.HttpResponseParser import HttpResponseParser
+from IPC.IPC_ConnectionException import IPC_ConnectionException
+from IPC.Tracer import Tracer
+
+
+class Connection(object):
+    """
+ * Single HTTP/1.1 keep-alive connection to the IPC host
+    """
+    __sock: socket.socket
+    __lastUsed: float
+    """
+    * @var bool Some bytes of the current request were written to the socket
+    """
+    __sent = False
+
+    def __init__(self, host: str, port: int, sslContext = None, timeout = None):
+        """
+    * @param string host
+    * @param int port
+    * @param ssl.SSLContext sslContext TLS context, None for plain HTTP
+    * @param float timeout Seconds to wait for connecting and for every socket operation, None waits forever\n
+    * @raises OSError
+        """
+        sock = socket.create_connection((host, port), timeout)
+        # Request head and body are written separately, they must not wait for ACK of each other
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if sslContext is not None:
+            sock = sslContext.wrap_socket(sock, server_hostname=host)
+        self.__sock = sock
+        self.__parser = HttpResponseParser()
+        self.__lastUsed = time.monotonic()
+
+    def isStale(self, idleTimeout: float):
+        """
+    * Health check for idle connection.
+    * Connection is stale if it was idle too long or the server closed it (idle socket is readable)\n
+    * @param float idleTimeout Seconds\n
+    * @return boolean
+        """
+        if time.monotonic() - self.__lastUsed > idleTimeout:
+            return True
+        try:
+            readable, _, _ = select.select([self.__sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+
+        return bool(readable)
+
+    def touch(self):
+        """
+    * Mark connection as used right now
+        """
+        self.__lastUsed = time.monotonic()
+
+    def send(self, data):
+        """
+    * Write request. Parts are written with one sendmsg() call where the socket supports it,
+    * TLS sockets write them one by one\n
+    * @param bytes|tuple data Raw HTTP request, or its parts e.g. (head, body) sent without joining them
+    * @raises OSError
+        """
+        self.__sent = False
+        sock = self.__sock
+        parts = [part for part in ((data,) if isinstance(data, (bytes, bytearray)) else data) if len(part)]
+        scatter = not isinstance(sock, ssl.SSLSocket) and hasattr(sock, 'sendmsg')
+        while parts:
+            sent = sock.sendmsg(parts) if scatter else sock.send(parts[0])
+            self.__sent = True
+            # Drop fully sent parts, continue from the middle of partly sent one
+            while sent:
+                size = len(parts[0])
+                if sent < size:
+                    parts[0] = memoryview(parts[0])[sent:]
+                    break
+                sent -= size
+                del parts[0]
+
+    def hasSent(self):
+        """
+    * Whether any byte of the last request reached the socket. Until then the request may be safely repeated\n
+    * @return boolean
+        """
+        return self.__sent
+
+    def getResponse(self):
+        """
+    * Read one HTTP response, data is received straight into the reusable parser buffer\n
+    * @return tuple (int status, dict headers with lower-case names, bytearray body, bool keepAlive)
+    * @raises IPC_Exception
+    * @raises OSError
+        """
+        parser = self.__parser
+        parser.reset()
+        sock = self.__sock
+        while not parser.isComplete():
+            nbytes = sock.recv_into(parser.getBuffer())
+            if nbytes == 0:
+                parser.feedEof()
+                break
+            parser.bufferUpdated(nbytes)
+
+        return parser.getStatus(), parser.getHeaders(), parser.getBody(), parser.isKeepAlive()
+
+    def close(self):
+        """
+    * Close underlying socket
+        """
+        try:
+            self.__sock.close()
+        except OSError:
+            pass
+
+
+class ConnectionPool(object):
+    """
+ * Per-origin pool of keep-alive connections to the IPC API.
+ * Shared by all Base requests using the same IPC URL
+    """
+    __pools = {}
+    __poolsLock = threading.Lock()
+
+    __host: str
+    __port: int
+    __maxSize: int
+    __idleTimeout: float
+    __timeout = None
+
+    def __init__(self, url: str, maxSize: int, idleTimeout: float, timeout = None):
+        """
+    * @param string url IPC API URL, only the origin is used
+    * @param int maxSize Max count of idle connections kept open
+    * @param float idleTimeout Seconds an idle connection is considered reusable
+    * @param float timeout Seconds to wait for connecting and for every read, None waits forever
+        """
+        parsed = urlparse(url)
+        secure = parsed.scheme == 'https'
+        self.__host = parsed.hostname
+        self.__port = parsed.port or (443 if secure else 80)
+        self.__sslContext = ssl.create_default_context() if secure else None
+        self.__maxSize = maxSize
+        self.__idleTimeout = idleTimeout
+        self.__timeout = timeout
+        self.__idle = deque()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def getInstance(cnf: Config):
+        """
+    * Return connection pool for the IPC URL origin and connection settings of given config.
+    * Configs with different pool size or timeouts get separate pools\n
+    * @param cnf: Config\n
+    * @return ConnectionPool
+        """
+        url = cnf.getIpcURL()
+        parsed = urlparse(url)
+        settings = (cnf.getConnectionPoolSize(), cnf.getConnectionIdleTimeout(), cnf.getConnectionTimeout())
+        key = (parsed.scheme, parsed.hostname, parsed.port) + settings
+        pool = ConnectionPool.__pools.get(key)
+        if pool is None:
+            with ConnectionPool.__poolsLock:
+                pool = ConnectionPool.__pools.get(key)
+                if pool is None:
+                    pool = ConnectionPool.__pools[key] = ConnectionPool(url, *settings)
+
+        return pool
+
+    @staticmethod
+    def closeAll():
+        """
+    * Close idle connections of all pools
+        """
+        with ConnectionPool.__poolsLock:
+            pools = list(ConnectionPool.__pools.values())
+        for pool in pools:
+            pool.clear()
+
+    def getHost(self):
+        """
+    * @return string
+        """
+        return self.__host
+
+    def setMaxSize(self, maxSize: int):
+        """
+    * @param int maxSize Max count of idle connections kept open
+        """
+        self.__maxSize = maxSize
+
+    def setIdleTimeout(self, idleTimeout: float):
+        """
+    * @param float idleTimeout Seconds
+        """
+        self.__idleTimeout = idleTimeout
+
+    def acquire(self):
+        """
+    * Return healthy idle connection or open a new one\n
+    * @return tuple (Connection, bool reused)
+    * @raises IPC_ConnectionException
+        """
+        while True:
+            with self.__lock:
+                conn = self.__idle.pop() if self.__idle else None
+            if conn is None:
+                break
+            if not conn.isStale(self.__idleTimeout):
+                return conn, True
+            conn.close()
+
+        try:
+            return Connection(self.__host, self.__port, self.__sslContext, self.__timeout), False
+        except (OSError, ssl.SSLError) as ex:
+            raise IPC_ConnectionException(f'Error connecting IPC URL: {ex}') from ex
+
+    def release(self, conn: Connection):
+        """
+    * Return connection to the pool for reuse
+    * @param conn: Connection
+        """
+        conn.touch()
+        with self.__lock:
+            if len(self.__idle) < self.__maxSize:
+                self.__idle.append(conn)
+                return
+        conn.close()
+
+    def clear(self):
+        """
+    * Close all idle connections
+        """
+        with self.__lock:
+            idle = list(self.__idle)
+            self.__idle.clear()
+        for conn in idle:
+            conn.close()
+
+    def request(self, data, stages = None):
+        """
+    * Send raw HTTP request on a pooled connection and read the response.
+    * A reused connection that fails before any byte of the request was written is dropped and the request is retried
+    * on another one. Once the request was written it is never repeated, API methods like IPCRefund are not idempotent\n
+    * @param bytes|tuple data Raw HTTP request or its parts
+    * @param list stages Trace stages, connect, send and receive timings are appended to it\n
+    * @return tuple (int status, dict headers, bytes body)
+    * @raises IPC_ConnectionException if connection failed, with the stage it failed in
+    * @raises IPC_Exception if response is not valid HTTP
+        """
+        if stages is None:
+            stages = []
+        while True:
+            start = time.perf_counter_ns()
+            conn, reused = self.acquire()
+            stage = Tracer.STAGE_SEND
+            try:
+                connected = time.perf_counter_ns()
+                stages.append((Tracer.STAGE_CONNECT, start, connected))
+                conn.send(data)
+                sent = time.perf_counter_ns()
+                stages.append((Tracer.STAGE_SEND, connected, sent))
+                stage = Tracer.STAGE_RECEIVE
+                status, headers, body, keepAlive = conn.getResponse()
+                stages.append((Tracer.STAGE_RECEIVE, sent, time.perf_counter_ns()))
+            except OSError as ex:
+                conn.close()
+                if reused and not conn.hasSent():
+                    continue
+                raise IPC_ConnectionException(f'Error connecting IPC URL: {ex}', stage, conn.hasSent()) from ex
+            except BaseException:
+                conn.close()
+                raise
+
+            if keepAlive:
+                self.release(conn)
+            else:
+                conn.close()
+
+            return status, headers, body
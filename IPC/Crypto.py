@@ -1,11 +1,10 @@
 from Cryptodome.PublicKey import RSA
-from Cryptodome.Cipher import PKCS1_OAEP
 from Cryptodome.Signature import PKCS1_v1_5
 from Cryptodome.Hash import SHA512, SHA384, SHA256, SHA, MD5
-from Cryptodome import Random
 from base64 import b64encode, b64decode
 
 def newkeys(keysize):
+    from Cryptodome import Random
     random_generator = Random.new().read
     key = RSA.generate(keysize, random_generator)
     private, public = key, key.publickey()
@@ -14,46 +13,65 @@ def newkeys(keysize):
 def importKey(externKey):
     return RSA.importKey(externKey)
 
+def asKey(key):
+    """
+    Return key as RsaKey object, importing it only if PEM string is given
+    """
+    return key if isinstance(key, RSA.RsaKey) else importKey(key)
+
 def getpublickey(priv_key):
     return priv_key.publickey()
 
 def encrypt(message, pub_key):
+    # imported on first use, only card methods encrypt
+    from Cryptodome.Cipher import PKCS1_OAEP
+    pub_key = asKey(pub_key)
     cipher = PKCS1_OAEP.new(pub_key)
     return cipher.encrypt(message)
 
 def decrypt(ciphertext, priv_key):
-    priv_key = importKey(priv_key)
+    from Cryptodome.Cipher import PKCS1_OAEP
+    priv_key = asKey(priv_key)
     cipher = PKCS1_OAEP.new(priv_key)
     return cipher.decrypt(ciphertext)
 
-def sign(message, priv_key, hash="SHA256"):
-    priv_key = importKey(priv_key)
-    signer = PKCS1_v1_5.new(priv_key)
+class PrehashedDigest(object):
+    """
+    Finished hash value with the hash algorithm OID, accepted by signDigest().
+    Unlike hash objects it can be pickled and sent to other processes
+    """
+    def __init__(self, oid, value):
+        self.oid = oid
+        self.__value = value
+
+    def digest(self):
+        return self.__value
 
+def newDigest(hash="SHA256"):
     if (hash == "SHA512"):
-        digest = SHA512.new()
+        return SHA512.new()
     elif (hash == "SHA384"):
-        digest = SHA384.new()
+        return SHA384.new()
     elif (hash == "SHA256"):
-        digest = SHA256.new()
+        return SHA256.new()
     elif (hash == "SHA1"):
-        digest = SHA.new()
+        return SHA.new()
     else:
-        digest = MD5.new()
-    digest.update(message)
+        return MD5.new()
+
+def signDigest(digest, priv_key):
+    priv_key = asKey(priv_key)
+    signer = PKCS1_v1_5.new(priv_key)
     return signer.sign(digest)
 
+def sign(message, priv_key, hash="SHA256"):
+    digest = newDigest(hash)
+    digest.update(message)
+    return signDigest(digest, priv_key)
+
 def verify(message, signature, pub_key, hash="SHA256"):
+    pub_key = asKey(pub_key)
     signer = PKCS1_v1_5.new(pub_key)
-    if (hash == "SHA512"):
-        digest = SHA512.new()
-    elif (hash == "SHA384"):
-        digest = SHA384.new()
-    elif (hash == "SHA256"):
-        digest = SHA256.new()
-    elif (hash == "SHA1"):
-        digest = SHA.new()
-    else:
-        digest = MD5.new()
+    digest = newDigest(hash)
     digest.update(message)
     return signer.verify(digest, signature)
\ No newline at end of file
@@ -1,6 +1,5 @@
 from IPC.Helper import Helper
 from IPC.IPC_Exception import IPC_Exception
-import IPC.Purchase as Purchase
 
 
 class Customer(object):
@@ -109,7 +108,9 @@ class Customer(object):
     * @return bool
     * @raises IPC_Exception
         """
-        if paymentParametersRequired == Purchase.Purchase.PURCHASE_TYPE_FULL:
+        # imported here, Purchase module imports Customer
+        from IPC.Purchase import Purchase
+        if paymentParametersRequired == Purchase.PURCHASE_TYPE_FULL:
 
             if self.getFirstName() == None:
                 raise IPC_Exception('Invalid First name')
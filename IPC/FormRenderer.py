@@ -0,0 +1,113 @@
+import functools
+import gzip
+import html
+
+from IPC.PostParams import PostParams
+
+
+class FormRenderer(object):
+    """
+ * Auto-submit HTML form of signed API Request params for payment page methods.
+ * Markup around values is compiled once per param name and action URL, values are taken from PostParams
+ * already HTML escaped, and the page is assembled with a single join
+    """
+    HEAD = '<body onload="document.ipcForm.submit()"><form id="ipcForm" name="ipcForm" action="{action}" method="post">'
+    INPUT = '<input type="hidden" name="{name}" value="'
+    INPUT_END = '" />\n'
+    TAIL = '</form></body>'
+
+    """
+    * Max count of cached compiled heads and of cached inputs, least recently used are evicted
+    """
+    CACHE_SIZE = 4096
+    """
+    * Gzip level of compressed pages. The form compresses well already at level 1, higher levels are much slower
+    """
+    COMPRESS_LEVEL = 1
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def __head(action: str):
+        """
+    * @param string action Form action URL\n
+    * @return string
+        """
+        return FormRenderer.HEAD.format(action=html.escape(action))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def __input(name: str):
+        """
+    * @param string name Param name\n
+    * @return string Markup before the value
+        """
+        return FormRenderer.INPUT.format(name=html.escape(name))
+
+    @staticmethod
+    def parts(action: str, params: PostParams):
+        """
+    * Page as list of strings, join them to get the page\n
+    * @param string action Form action URL
+    * @param params: PostParams Signed params\n
+    * @return list
+        """
+        getInput = FormRenderer.__input
+        end = FormRenderer.INPUT_END
+        result = [FormRenderer.__head(action)]
+        append = result.append
+        for name, (raw, escaped) in params.entries():
+            append(getInput(name))
+            append(escaped)
+            append(end)
+        append(FormRenderer.TAIL)
+
+        return result
+
+    @staticmethod
+    def toString(action: str, params: PostParams):
+        """
+    * @param string action Form action URL
+    * @param params: PostParams Signed params\n
+    * @return string
+        """
+        return ''.join(FormRenderer.parts(action, params))
+
+    @staticmethod
+    def render(action: str, params: PostParams, compress = False):
+        """
+    * @param string action Form action URL
+    * @param params: PostParams Signed params
+    * @param bool compress Return gzip compressed page, to be sent with Content-Encoding: gzip\n
+    * @return bytes UTF-8 encoded page
+        """
+        page = ''.join(FormRenderer.parts(action, params)).encode('utf-8')
+
+        return gzip.compress(page, FormRenderer.COMPRESS_LEVEL, mtime=0) if compress else page
+
+    @staticmethod
+    def stream(action: str, params: PostParams, write, chunkSize = 65536):
+        """
+    * Write page into response writer while it is produced. Inputs are written as soon as
+    * at least chunkSize characters are buffered, so the whole page is never held in memory\n
+    * @param string action Form action URL
+    * @param params: PostParams Signed params
+    * @param callable write Called with UTF-8 encoded bytes, e.g. WSGI write() or file write()
+    * @param int chunkSize
+        """
+        getInput = FormRenderer.__input
+        end = FormRenderer.INPUT_END
+        buffer = [FormRenderer.__head(action)]
+        append = buffer.append
+        size = len(buffer[0])
+        for name, (raw, escaped) in params.entries():
+            prefix = getInput(name)
+            append(prefix)
+            append(escaped)
+            append(end)
+            size += len(prefix) + len(escaped) + len(end)
+            if size >= chunkSize:
+                write(''.join(buffer).encode('utf-8'))
+                buffer.clear()
+                size = 0
+        append(FormRenderer.TAIL)
+        write(''.join(buffer).encode('utf-8'))
@@ -0,0 +1,53 @@
+import abc
+
+from IPC.Base import Base
+
+
+class FormRequest(Base, metaclass=abc.ABCMeta):
+    """
+ * Base class of IPC methods sent by the customer's browser: IPCPurchase, IPCPurchaseByIcard and IPCPreAuthorization.
+ * The request is not sent by the SDK, it is rendered as an auto-submit HTML form posting to the IPC URL
+    """
+
+    def process(self):
+        """
+    * Initiate API request, the HTML form is printed to stdout\n
+    * @return boolean
+    * @raises IPC_Exception
+        """
+        self._prepare()
+        self._processHtmlPost()
+
+        return True
+
+    def render(self, compress = False):
+        """
+    * Build auto-submit HTML form of the request, to be returned as page body\n
+    * @param bool compress Return gzip compressed page, to be sent with Content-Encoding: gzip\n
+    * @return bytes UTF-8 encoded page
+    * @raises IPC_Exception
+        """
+        self._prepare()
+
+        return self._renderHtmlPost(compress)
+
+    def renderTo(self, write):
+        """
+    * Write auto-submit HTML form of the request into response writer\n
+    * @param callable write Called with bytes, e.g. WSGI write() or file write()
+    * @raises IPC_Exception
+        """
+        self._prepare()
+        self._streamHtmlPost(write)
+
+    async def process_async(self, compress = False):
+        """
+    * Asyncio counterpart of render(). Form is built without network I/O, so it runs in the default executor
+    * and the page is returned instead of printed\n
+    * @param bool compress Return gzip compressed page, to be sent with Content-Encoding: gzip\n
+    * @return bytes UTF-8 encoded page
+    * @raises IPC_Exception
+        """
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(None, self.render, compress)
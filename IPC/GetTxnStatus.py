@@ -1,7 +1,7 @@
 from IPC.Base import Base
 from IPC.Config import Config
 from IPC.Helper import Helper
-from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
 class GetTxnStatus(Base):
@@ -9,30 +9,37 @@ class GetTxnStatus(Base):
  * Process IPC method: IPCGetTxnStatus.
  * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCGetTxnStatus', (
+        ParamSchema.field('OrderID', 'getOrderID', Helper.isValidOrderId, 'Invalid OrderId'),
+        ParamSchema.field('OutputFormat', 'getOutputFormat', Helper.isValidOutputFormat, 'Invalid Output format'),
+    ))
     __orderID: str
 
     def __init__(self, cnf: Config):
         self._setCnf(cnf)
 
+    @classmethod
+    def bulk(cls, cnf: Config, orderIDs, concurrency = None, retries = 3, backoff = 0.5):
+        """
+    * Request status of many orders over a bounded worker pool.
+    * Requests ending with STATUS_IPC_ERROR are retried with exponential backoff\n
+    * @param cnf: Config
+    * @param iterable orderIDs
+    * @param int concurrency Max count of requests in flight, default is Config connection pool size
+    * @param int retries
+    * @param float backoff Seconds before first retry\n
+    * @return generator of tuple (string orderID, Response|IPC_Exception result) in completion order
+        """
+        from IPC.StatusPoller import StatusPoller
+
+        return StatusPoller(cls, cnf, concurrency, retries, backoff).poll(orderIDs)
+
     def process(self):
         """
     * Initiate API request\n
     * @return Response
         """
-        self.validate()
-
-        self._addPostParam('IPCmethod', 'IPCGetTxnStatus')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
-
-        self._addPostParam('OrderID', self.getOrderID())
-        self._addPostParam('OutputFormat', self.getOutputFormat())
-
-        return self._processPost()
+        return self._process()
 
     def validate(self):
         """
@@ -40,16 +47,7 @@ class GetTxnStatus(Base):
     * @return boolean
     * @raises IPC_Exception
         """
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
-
-        if self.getOrderID() == None or not Helper.isValidOrderId(self.getOrderID()):
-            raise IPC_Exception('Invalid OrderId')
-
-        if self.getOutputFormat() == None or not Helper.isValidOutputFormat(self.getOutputFormat()):
-            raise IPC_Exception('Invalid Output format')
+        self._schema.validate(self)
 
         return True
 
@@ -1,13 +1,35 @@
+from collections.abc import Mapping
 from IPC.Defines import Defines
-import validators
+from IPC.IPC_Exception import IPC_Exception
+import datetime
 import re
 import html
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class Helper(object):
     """
 *  IPC Library helper functions
     """
+    __amountPattern = re.compile(r'^(-)?[0-9]+(?:\.[0-9]{0,2})?')
+    """
+    *  Luhn lookup tables, ASCII digit to its value and to the digit sum of its double
+    """
+    __luhnDigit = bytes.maketrans(b'0123456789', bytes([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]))
+    __luhnDouble = bytes.maketrans(b'0123456789', bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9]))
+    """
+    *  Max length of card number, card numbers are right aligned to it in vectorized validation
+    """
+    CARD_NUMBER_WIDTH = 19
+    """
+    *  Min count of cards for validateCards() to use NumPy, if installed
+    """
+    VECTORIZE_MIN = 256
+
     def __init__(_self):
         pass
 
@@ -21,6 +43,8 @@ class Helper(object):
         # if len(email) > 7:
         #  return bool(re.match(
         #      "^.+@(\[?)[a-zA-Z0-9-.]+.([a-zA-Z]{2,3}|[0-9]{1,3})(]?)$", email))
+        import validators
+
         return bool(validators.email(email))
 
 
@@ -31,6 +55,8 @@ class Helper(object):
     *  @param string url\n
     *  @return boolean
         """
+        import validators
+
         return bool(validators.url(url))
 
 
@@ -41,6 +67,8 @@ class Helper(object):
     *  @param string ip\n
     *  @return boolean
         """
+        import validators
+
         return bool(validators.ipv4(ip))
 
 
@@ -61,7 +89,7 @@ class Helper(object):
     *  @param float amt\n
     *  @return boolean
         """
-        return bool(re.match(r'^(-)?[0-9]+(?:\.[0-9]{0,2})?', str(amt)))
+        return Helper.__amountPattern.match(amt if isinstance(amt, str) else str(amt)) is not None
 
 
     @staticmethod
@@ -116,35 +144,115 @@ class Helper(object):
     *  @param cardNo\n
     *  @return boolean
         """
-        cardNo = cardNo.strip().replace(" ", "")
-        if (not cardNo.isnumeric()) or (len(cardNo) > 19) or (len(cardNo) < 13):
-            return False
-        sum = dub = add = chk = 0
-        even = 0
-        for i in range(len(cardNo) - 1, -1, -1):
-            if even == 1:
-                dub = 2 * int(cardNo[i])
-                if dub > 9:
-                    add = dub - 9
-                else:
-                    add = dub
-                even = 0
-            else:
-                add = cardNo[i]
-                even = 1
-            sum += add
+        digits = Helper.__cardDigits(cardNo)
+
+        return digits is not None and Helper.__luhn(digits)
+
+    @staticmethod
+    def __cardDigits(cardNo):
+        """
+    *  Card number without spaces as ASCII bytes, if it has 13 to 19 digits\n
+    *  @param string cardNo\n
+    *  @return bytes|None
+        """
+        if not isinstance(cardNo, str):
+            return None
+        cardNo = cardNo.strip().replace(' ', '')
+        if not (cardNo.isascii() and cardNo.isdigit()) or len(cardNo) > 19 or len(cardNo) < 13:
+            return None
+
+        return cardNo.encode('ascii')
+
+    @staticmethod
+    def __luhn(digits: bytes):
+        """
+    *  Luhn checksum of card number digits, every second digit from the right is doubled\n
+    *  @param bytes digits\n
+    *  @return boolean
+        """
+        digits = digits[::-1]
+        total = sum(digits[0::2].translate(Helper.__luhnDigit)) + sum(digits[1::2].translate(Helper.__luhnDouble))
+
+        return total % 10 == 0
+
+    @staticmethod
+    def __luhnVectorized(numbers: list):
+        """
+    *  Luhn checksum of many card numbers with NumPy, numbers are padded with leading zeros to fixed width\n
+    *  @param list numbers Card number digits as bytes, None for invalid numbers\n
+    *  @return list of boolean
+        """
+        width = Helper.CARD_NUMBER_WIDTH
+        empty = b'0' * width
+        buffer = b''.join(empty if digits is None else digits.rjust(width, b'0') for digits in numbers)
+        matrix = numpy.frombuffer(buffer, dtype=numpy.uint8).reshape(len(numbers), width) - 48
+        # with odd width, columns 1, 3, ... are every second digit from the right
+        double = numpy.array([0, 2, 4, 6, 8, 1, 3, 5, 7, 9], dtype=numpy.uint8)
+        matrix[:, 1::2] = double[matrix[:, 1::2]]
+        valid = matrix.sum(axis=1, dtype=numpy.uint16) % 10 == 0
+        valid &= numpy.fromiter((digits is not None for digits in numbers), dtype=bool, count=len(numbers))
+
+        return valid.tolist()
+
+    @staticmethod
+    def validateCards(cardNumbers, cvcs = None, expDates = None):
+        """
+    *  Validate many cards at once, e.g. before storing them with IAStoreCard.
+    *  Checks are the same as in Card.validate(), card numbers are checked with NumPy if it is installed\n
+    *  @param iterable cardNumbers
+    *  @param iterable cvcs Optional, CVC of each card
+    *  @param iterable expDates Optional, tuple (string expMM, string expYY) of each card\n
+    *  @return list of boolean, True for each valid card
+    *  @raises IPC_Exception if lists are not of the same length
+        """
+        cardNumbers = list(cardNumbers)
+        if cvcs is not None:
+            cvcs = list(cvcs)
+        if expDates is not None:
+            expDates = list(expDates)
+        if (cvcs is not None and len(cvcs) != len(cardNumbers)) or (expDates is not None and len(expDates) != len(cardNumbers)):
+            raise IPC_Exception('Card numbers, CVCs and expire dates must be of the same count')
+
+        numbers = [Helper.__cardDigits(cardNo) for cardNo in cardNumbers]
+        if numpy is not None and len(numbers) >= Helper.VECTORIZE_MIN:
+            result = Helper.__luhnVectorized(numbers)
+        else:
+            luhn = Helper.__luhn
+            result = [digits is not None and luhn(digits) for digits in numbers]
+
+        if cvcs is not None:
+            isValidCVC = Helper.isValidCVC
+            result = [valid and isValidCVC(cvc) for valid, cvc in zip(result, cvcs)]
 
-        return ((sum % 10) == 0)
+        if expDates is not None:
+            year = datetime.datetime.today().year
+            isValidExpDate = Helper.__isValidExpDate
+            result = [valid and isValidExpDate(expMM, expYY, year) for valid, (expMM, expYY) in zip(result, expDates)]
 
+        return result
+
+    @staticmethod
+    def __isValidExpDate(expMM, expYY, year: int):
+        """
+    *  Validate card expire month and year, as Card.validate() does\n
+    *  @param string expMM
+    *  @param string expYY
+    *  @param int year Current year\n
+    *  @return boolean
+        """
+        if not isinstance(expMM, str) or not isinstance(expYY, str) or not expMM.isnumeric() or not expYY.isnumeric():
+            return False
+
+        return 0 < int(expMM) <= 12 and int(expYY) >= year
 
     @staticmethod
     def isValidCVC(cvc):
         """
     *  Validate card CVC\n
-    *  @param cvc\n
-    *  @return boolean
+    *  @param string cvc\n
+    *  @return boolean False if cvc is not a string
         """
-        return (cvc.isnumeric() and len(cvc) == 3)
+        return (isinstance(cvc, str) and cvc.isnumeric() and len(cvc) == 3)
 
     @staticmethod
     def versionCheck(current, required):
@@ -184,8 +292,7 @@ class Helper(object):
     *  @param bool notEmpty\n
     *  @return mixed
         """
-        # TODO: select one of (list, dict)
-        if not isinstance(array, (list, dict)):
+        if not isinstance(array, (list, Mapping)):
             return default
         if notEmpty:
             if key in array:
@@ -199,7 +306,7 @@ class Helper(object):
 
 
     @staticmethod
-    def getValuesFromMultiDimensionalArray(array, values = []):
+    def getValuesFromMultiDimensionalArray(array, values = None):
         """
     *  Returns one-dimensional array with all values from multi-dimensional array
     *  Useful when create request signature where only array values matter\n
@@ -207,14 +314,14 @@ class Helper(object):
     *  @param array values\n
     *  @return array
         """
-        # TODO: select one of (list, dict)
+        if values is None:
+            values = []
         if not isinstance(array, (list, dict)):
             return values
-        for k, v in array:
-            # TODO: select one of (list, dict)
+        for v in (array.values() if isinstance(array, dict) else array):
             if isinstance(v, (list, dict)):
                 values = Helper.getValuesFromMultiDimensionalArray(v, values)
             else:
-                values += v
+                values.append('' if v is None else str(v))
 
         return values
\ No newline at end of file
@@ -0,0 +1,279 @@
+from IPC.IPC_ConnectionException import IPC_ConnectionException
+from IPC.IPC_Exception import IPC_Exception
+from IPC.Tracer import Tracer
+
+
+class HttpResponseParser(object):
+    """
+ * Incremental HTTP/1.1 response parser.
+ * Received data is written into getBuffer() (e.g. with socket.recv_into) and announced with bufferUpdated(),
+ * or passed to feed(). Chunked bodies are decoded on the fly and Content-Length bodies are received
+ * straight into the body buffer, so response is assembled in linear time with at most one copy
+    """
+    STATE_HEAD = 0
+    STATE_BODY_LENGTH = 1
+    STATE_BODY_EOF = 2
+    STATE_CHUNK_SIZE = 3
+    STATE_CHUNK_DATA = 4
+    STATE_CHUNK_END = 5
+    STATE_TRAILERS = 6
+    STATE_DONE = 7
+
+    BUFFER_SIZE = 16384
+    MAX_LINE_SIZE = 65536
+    """
+    * Max bytes allocated for a Content-Length body before its data arrives, the buffer grows as data comes in
+    """
+    BODY_PREALLOC_SIZE = 262144
+
+    __slots__ = ('__buf', '__start', '__end', '__state', '__status', '__headers', '__keepAlive',
+                 '__body', '__bodyLen', '__bodySize', '__remaining', '__received')
+
+    def __init__(self):
+        self.__buf = bytearray(self.BUFFER_SIZE)
+        self.reset()
+
+    def reset(self):
+        """
+    * Prepare parser for next response on the same connection, read buffer is reused
+        """
+        self.__start = 0
+        self.__end = 0
+        self.__state = self.STATE_HEAD
+        self.__status = None
+        self.__headers = {}
+        self.__keepAlive = False
+        self.__body = bytearray()
+        self.__bodyLen = 0
+        self.__bodySize = 0
+        self.__remaining = 0
+        self.__received = False
+
+    def isComplete(self):
+        """
+    * @return boolean
+        """
+        return self.__state == self.STATE_DONE
+
+    def getStatus(self):
+        """
+    * @return int HTTP status code
+        """
+        return self.__status
+
+    def getHeaders(self):
+        """
+    * @return dict Headers with lower-case names
+        """
+        return self.__headers
+
+    def isKeepAlive(self):
+        """
+    * Whether connection may be reused after this response\n
+    * @return boolean
+        """
+        return self.__keepAlive
+
+    def getBody(self):
+        """
+    * Decoded response body\n
+    * @return bytearray
+        """
+        if self.__state == self.STATE_BODY_LENGTH or self.__state == self.STATE_DONE:
+            del self.__body[self.__bodyLen:]
+
+        return self.__body
+
+    def getBuffer(self):
+        """
+    * Writable buffer for next received data\n
+    * @return memoryview
+        """
+        if self.__state == self.STATE_BODY_LENGTH:
+            body = self.__body
+            if self.__bodyLen == len(body):
+                body.extend(bytes(min(len(body), self.__bodySize - len(body))))
+            return memoryview(body)[self.__bodyLen:]
+
+        buf = self.__buf
+        if self.__start == self.__end:
+            self.__start = self.__end = 0
+        elif self.__end == len(buf):
+            if self.__start > 0:
+                size = self.__end - self.__start
+                buf[:size] = buf[self.__start:self.__end]
+                self.__start, self.__end = 0, size
+            else:
+                buf.extend(bytes(len(buf)))
+
+        return memoryview(buf)[self.__end:]
+
+    def bufferUpdated(self, nbytes: int):
+        """
+    * Announce that nbytes were written into buffer returned by getBuffer()\n
+    * @param int nbytes
+    * @raises IPC_Exception
+        """
+        if nbytes <= 0:
+            return
+        self.__received = True
+        if self.__state == self.STATE_BODY_LENGTH:
+            self.__bodyLen += nbytes
+            if self.__bodyLen == self.__bodySize:
+                self.__state = self.STATE_DONE
+            return
+
+        self.__end += nbytes
+        self.__process()
+
+    def feed(self, data):
+        """
+    * Pass received data to parser\n
+    * @param bytes data
+    * @raises IPC_Exception
+        """
+        with memoryview(data) as view:
+            pos = 0
+            while pos < len(view) and self.__state != self.STATE_DONE:
+                with self.getBuffer() as buf:
+                    n = min(len(buf), len(view) - pos)
+                    buf[:n] = view[pos:pos + n]
+                self.bufferUpdated(n)
+                pos += n
+
+    def feedEof(self):
+        """
+    * Announce that server closed connection\n
+    * @raises ConnectionError if nothing was received
+    * @raises IPC_ConnectionException if response is incomplete
+        """
+        if self.__state == self.STATE_BODY_EOF:
+            self.__body += self.__buf[self.__start:self.__end]
+            self.__start = self.__end
+            self.__bodyLen = len(self.__body)
+            self.__state = self.STATE_DONE
+        elif self.__state != self.STATE_DONE:
+            if not self.__received:
+                raise ConnectionError('Connection closed by IPC host')
+            raise IPC_ConnectionException('Incomplete IPC response', Tracer.STAGE_RECEIVE, True)
+
+    def __readLine(self):
+        """
+    * Pop next line from read buffer\n
+    * @return bytearray|None None if the line is not complete yet
+    * @raises IPC_Exception
+        """
+        buf = self.__buf
+        i = buf.find(b'\n', self.__start, self.__end)
+        if i < 0:
+            if self.__end - self.__start > self.MAX_LINE_SIZE:
+                raise IPC_Exception('Invalid IPC response: line too long')
+            return None
+        line = buf[self.__start:i].rstrip(b'\r')
+        self.__start = i + 1
+
+        return line
+
+    def __process(self):
+        """
+    * Parse as much of read buffer as possible
+    * @raises IPC_Exception
+        """
+        while True:
+            state = self.__state
+            if state == self.STATE_HEAD:
+                if not self.__parseHead():
+                    return
+            elif state == self.STATE_BODY_EOF:
+                self.__body += self.__buf[self.__start:self.__end]
+                self.__start = self.__end
+                return
+            elif state == self.STATE_CHUNK_SIZE:
+                line = self.__readLine()
+                if line is None:
+                    return
+                try:
+                    self.__remaining = int(line.split(b';', 1)[0].strip(), 16)
+                except ValueError:
+                    raise IPC_Exception('Invalid chunked IPC response')
+                self.__state = self.STATE_CHUNK_DATA if self.__remaining > 0 else self.STATE_TRAILERS
+            elif state == self.STATE_CHUNK_DATA:
+                n = min(self.__remaining, self.__end - self.__start)
+                if n == 0:
+                    return
+                with memoryview(self.__buf) as view:
+                    self.__body += view[self.__start:self.__start + n]
+                self.__start += n
+                self.__remaining -= n
+                if self.__remaining == 0:
+                    self.__state = self.STATE_CHUNK_END
+            elif state == self.STATE_CHUNK_END:
+                line = self.__readLine()
+                if line is None:
+                    return
+                self.__state = self.STATE_CHUNK_SIZE
+            elif state == self.STATE_TRAILERS:
+                line = self.__readLine()
+                if line is None:
+                    return
+                if not line:
+                    self.__bodyLen = len(self.__body)
+                    self.__state = self.STATE_DONE
+            else:
+                return
+
+    def __parseHead(self):
+        """
+    * Parse status line and headers once they are fully received\n
+    * @return boolean False if more data is needed
+    * @raises IPC_Exception
+        """
+        buf = self.__buf
+        i = buf.find(b'\r\n\r\n', self.__start, self.__end)
+        sepLen = 4
+        if i < 0:
+            i = buf.find(b'\n\n', self.__start, self.__end)
+            sepLen = 2
+        if i < 0:
+            if self.__end - self.__start > self.MAX_LINE_SIZE:
+                raise IPC_Exception('Invalid IPC response: headers too large')
+            return False
+
+        lines = buf[self.__start:i].decode('latin-1').splitlines()
+        self.__start = i + sepLen
+
+        parts = lines[0].split(None, 2) if lines else []
+        if len(parts) < 2 or not parts[0].startswith('HTTP/') or not parts[1].isdigit():
+            raise IPC_Exception('Invalid IPC response status line')
+        self.__status = int(parts[1])
+
+        headers = self.__headers
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        self.__keepAlive = parts[0] == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        if self.__status in (204, 304):
+            self.__state = self.STATE_DONE
+        elif 'chunked' in headers.get('transfer-encoding', '').lower():
+            self.__state = self.STATE_CHUNK_SIZE
+        elif 'content-length' in headers:
+            try:
+                length = int(headers['content-length'])
+            except ValueError:
+                raise IPC_Exception('Invalid IPC response Content-Length')
+            if length < 0:
+                raise IPC_Exception('Invalid IPC response Content-Length')
+            # body is received directly into its final buffer, allocated as data arrives instead of trusting the header
+            n = min(length, self.__end - self.__start)
+            self.__bodySize = length
+            self.__body = bytearray(max(n, min(length, self.BODY_PREALLOC_SIZE)))
+            self.__body[:n] = buf[self.__start:self.__start + n]
+            self.__start += n
+            self.__bodyLen = n
+            self.__state = self.STATE_DONE if n == length else self.STATE_BODY_LENGTH
+        else:
+            self.__keepAlive = False
+            self.__state = self.STATE_BODY_EOF
+
+        return True
@@ -1,8 +1,9 @@
-from IPC.Card import Card
 from IPC.Base import Base
+from IPC.Card import Card
 from IPC.Config import Config
 from IPC.Helper import Helper
 from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
 class IAPreAuthorization(Base):
@@ -10,6 +11,22 @@ class IAPreAuthorization(Base):
  * Process IPC method: IPCIAPreAuthorization.
  * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCIAPreAuthorization', (
+        ParamSchema.field('OrderID', 'getOrderID'),
+        ParamSchema.field('ItemName', 'getItemName', str, 'Empty or invalid item name.'),
+        ParamSchema.field('Amount', 'getAmount', Helper.isValidAmount, 'Empty or invalid amount'),
+        ParamSchema.field('Currency', 'getCurrency', error='Invalid currency'),
+        ParamSchema.field('CardType', 'getCard.getCardType'),
+        ParamSchema.field('PAN', 'getCard.getCardNumber', encrypt=True),
+        ParamSchema.field('CardholderName', 'getCard.getCardHolder', optional=True),
+        ParamSchema.field('ExpDate', 'getCard.getExpDate', encrypt=True),
+        ParamSchema.field('CVC', 'getCard.getCvc', encrypt=True, optional=True),
+        ParamSchema.field('ECI', 'getCard.getEci', optional=True),
+        ParamSchema.field('AVV', 'getCard.getAvv', optional=True),
+        ParamSchema.field('XID', 'getCard.getXid', optional=True),
+        ParamSchema.field('Note', 'getNote'),
+        ParamSchema.field('OutputFormat', 'getOutputFormat'),
+    ), minVersion='1.4')
 
     __card: Card
     __currency = 'EUR'
@@ -93,36 +110,7 @@ class IAPreAuthorization(Base):
     * @return Response
     * @raises IPC_Exception
         """
-        self.validate()
-
-        self._addPostParam('IPCmethod', 'IPCIAPreAuthorization')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
-
-        self._addPostParam('OrderID', self.getOrderID())
-
-        self._addPostParam('ItemName', self.getItemName())
-
-        self._addPostParam('Amount', self.getAmount())
-        self._addPostParam('Currency', self.getCurrency())
-
-        self._addPostParam('CardType', self.getCard().getCardType())
-        self._addPostParam('PAN', self.getCard().getCardNumber(), True)
-        self._addPostParam('CardholderName', self.getCard().getCardHolder())
-        self._addPostParam('ExpDate', self.getCard().getExpDate(), True)
-        self._addPostParam('CVC', self.getCard().getCvc(), True)
-        self._addPostParam('ECI', self.getCard().getEci())
-        self._addPostParam('AVV', self.getCard().getAvv())
-        self._addPostParam('XID', self.getCard().getXid())
-
-        self._addPostParam('Note', self.getNote())
-        self._addPostParam('OutputFormat', self.getOutputFormat())
-
-        return self._processPost()
+        return self._process()
 
     def validate(self):
         """
@@ -130,22 +118,7 @@ class IAPreAuthorization(Base):
     * @return boolean
     * @raises IPC_Exception
         """
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
-
-        if not Helper.versionCheck(self._getCnf().getVersion(), '1.4'):
-            raise IPC_Exception('IPCVersion ' + self._getCnf().getVersion() + ' does not support IPCIAPreAuthorization method. Please use 1.4 or above.')
-
-        if self.getItemName() == None or not isinstance(self.getItemName(), str):
-            raise IPC_Exception('Empty or invalid item name.')
-
-        if self.getCurrency() == None:
-            raise IPC_Exception('Invalid currency')
-
-        if self.getAmount() == None or not Helper.isValidAmount(self.getAmount()):
-            raise IPC_Exception('Empty or invalid amount')
+        self._schema.validate(self)
 
         if self.getCard() == None:
             raise IPC_Exception('Missing card details')
@@ -3,6 +3,7 @@ from IPC.Card import Card
 from IPC.Cart import Cart
 from IPC.Config import Config
 from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
 class IAPurchase(Base):
@@ -10,6 +11,10 @@ class IAPurchase(Base):
  * Process IPC method: IPCIAPurchase.
  * Collect, validate and send API params
     """
+    """
+    * Only the IPCmethod and Config params heading the request are described, the rest is collected by _prepare()
+    """
+    _schema = ParamSchema('IPCIAPurchase', ())
 
     __cart: Cart
 
@@ -57,16 +62,17 @@ class IAPurchase(Base):
         """
     * Initiate API request\n
     * @return Response
+        """
+        return self._process()
+
+    def _prepare(self):
+        """
+    * Validate all set details and collect API params\n
+    * @raises IPC_Exception
         """
         self.validate()
 
-        self._addPostParam('IPCmethod', 'IPCIAPurchase')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
+        self._addHeaderParams()
 
         self._addPostParam('OrderID', self.getOrderID())
         self._addPostParam('Amount', self.getCart().getTotal())
@@ -89,18 +95,16 @@ class IAPurchase(Base):
         self._addPostParam('OutputFormat', self.getOutputFormat())
 
         self._addPostParam('CartItems', self.getCart().getItemsCount())
-        items = self.getCart().getCart()
+        items = self.getCart().getItems()
         i = 1
-        for v in items :
-            self._addPostParam(f'Article_{i}', v['name'])
-            self._addPostParam(f'Quantity_{i}', v['quantity'])
-            self._addPostParam(f'Price_{i}', v['price'])
-            self._addPostParam(f'Amount_{i}', v['price'] * v['quantity'])
+        for name, quantity, price, amount, delivery in items:
+            self._addPostParam(f'Article_{i}', name)
+            self._addPostParam(f'Quantity_{i}', quantity)
+            self._addPostParam(f'Price_{i}', price)
+            self._addPostParam(f'Amount_{i}', amount)
             self._addPostParam(f'Currency_{i}', self.getCurrency())
             i += 1
 
-        return self._processPost()
-
     def validate(self):
         """
     * Validate all set purchase details\n
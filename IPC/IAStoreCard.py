@@ -2,6 +2,7 @@ from IPC.Card import Card
 from IPC.CardStore import CardStore
 from IPC.Config import Config
 from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
 class IAStoreCard(CardStore):
@@ -9,6 +10,20 @@ class IAStoreCard(CardStore):
  * Process IPC method: IPCIAStoreCard.
  * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCIAStoreCard', (
+        ParamSchema.field('CardVerification', 'getCardVerification'),
+        ParamSchema.field('Amount', 'getAmount', when=lambda request: request.getCardVerification() == request.CARD_VERIFICATION_YES),
+        ParamSchema.field('Currency', 'getCurrency', when=lambda request: request.getCardVerification() == request.CARD_VERIFICATION_YES),
+        ParamSchema.field('CardType', 'getCard.getCardType'),
+        ParamSchema.field('PAN', 'getCard.getCardNumber', encrypt=True),
+        ParamSchema.field('CardholderName', 'getCard.getCardHolder', optional=True),
+        ParamSchema.field('ExpDate', 'getCard.getExpDate', encrypt=True),
+        ParamSchema.field('CVC', 'getCard.getCvc', encrypt=True, optional=True),
+        ParamSchema.field('ECI', 'getCard.getEci', optional=True),
+        ParamSchema.field('AVV', 'getCard.getAvv', optional=True),
+        ParamSchema.field('XID', 'getCard.getXid', optional=True),
+        ParamSchema.field('OutputFormat', 'getOutputFormat'),
+    ))
     CARD_VERIFICATION_NO = 1
     CARD_VERIFICATION_YES = 2
 
@@ -26,33 +41,7 @@ class IAStoreCard(CardStore):
     * Initiate API request\n
     * @return Response
         """
-        self.validate()
-
-        self._addPostParam('IPCmethod', 'IPCIAStoreCard')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
-
-        self._addPostParam('CardVerification', self.getCardVerification())
-        if (self.getCardVerification()) == self.CARD_VERIFICATION_YES:
-            self._addPostParam('Amount', self.getAmount())
-            self._addPostParam('Currency', self.getCurrency())
-
-        self._addPostParam('CardType', self.getCard().getCardType())
-        self._addPostParam('PAN', self.getCard().getCardNumber(), True)
-        self._addPostParam('CardholderName', self.getCard().getCardHolder())
-        self._addPostParam('ExpDate', self.getCard().getExpDate(), True)
-        self._addPostParam('CVC', self.getCard().getCvc(), True)
-        self._addPostParam('ECI', self.getCard().getEci())
-        self._addPostParam('AVV', self.getCard().getAvv())
-        self._addPostParam('XID', self.getCard().getXid())
-
-        self._addPostParam('OutputFormat', self.getOutputFormat())
-
-        return self._processPost()
+        return self._process()
 
     def validate(self):
         """
@@ -61,10 +50,7 @@ class IAStoreCard(CardStore):
     * @raises IPC_Exception
         """
         super().validate()
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
+        self._schema.validate(self)
 
         if self.getCard() == None:
             raise IPC_Exception('Missing card details')
@@ -1,7 +1,7 @@
 from IPC.Base import Base
 from IPC.Config import Config
 from IPC.Helper import Helper
-from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
 class IPCGetTxnLog(Base):
@@ -9,6 +9,10 @@ class IPCGetTxnLog(Base):
  * Process IPC method: IPCGetTxnLog.
  * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCGetTxnLog', (
+        ParamSchema.field('OrderID', 'getOrderID', Helper.isValidOrderId, 'Invalid OrderId'),
+        ParamSchema.field('OutputFormat', 'getOutputFormat', Helper.isValidOutputFormat, 'Invalid Output format'),
+    ))
     __orderID: str
 
     def __init__(self, cnf: Config):
@@ -24,19 +28,7 @@ class IPCGetTxnLog(Base):
     * @return Response
     * @raises IPC_Exception
         """
-        self.validate()
-
-        self._addPostParam('IPCmethod', 'IPCGetTxnLog')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
-        self._addPostParam('OrderID', self.getOrderID())
-        self._addPostParam('OutputFormat', self.getOutputFormat())
-
-        return self._processPost()
+        return self._process()
 
     def validate(self):
         """
@@ -44,16 +36,7 @@ class IPCGetTxnLog(Base):
     * @return boolean
     * @raises IPC_Exception
         """
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
-
-        if self.getOrderID() == None or not Helper.isValidOrderId(self.getOrderID()):
-            raise IPC_Exception('Invalid OrderId')
-
-        if self.getOutputFormat() == None or not Helper.isValidOutputFormat(self.getOutputFormat()):
-            raise IPC_Exception('Invalid Output format')
+        self._schema.validate(self)
 
         return True
 
@@ -0,0 +1,34 @@
+from IPC.IPC_Exception import IPC_Exception
+from IPC.Tracer import Tracer
+
+
+class IPC_ConnectionException(IPC_Exception):
+    """
+ * Connection to IPC host could not be opened or was lost during the request.
+ * The network error is chained as __cause__, e.g. TimeoutError or ssl.SSLError.
+ * A request that was sent, even partially, may have been processed by IPC and must not be sent again blindly
+    """
+    __stage: str
+    __sent: bool
+
+    def __init__(self, message: str, stage = Tracer.STAGE_CONNECT, sent = False):
+        """
+    * @param string message
+    * @param string stage Tracer.STAGE_CONNECT|STAGE_SEND|STAGE_RECEIVE in which the connection failed
+    * @param bool sent Whether any byte of the request was written
+        """
+        super().__init__(message)
+        self.__stage = stage
+        self.__sent = sent
+
+    def getStage(self):
+        """
+    * @return string Tracer.STAGE_CONNECT|STAGE_SEND|STAGE_RECEIVE
+        """
+        return self.__stage
+
+    def isSent(self):
+        """
+    * @return boolean
+        """
+        return self.__sent
@@ -0,0 +1,8 @@
+from IPC.IPC_Exception import IPC_Exception
+
+
+class IPC_GeneralErrorException(IPC_Exception):
+    """
+ * IPC replied with unsigned STATUS_IPC_ERROR response
+    """
+    pass
@@ -0,0 +1,8 @@
+from IPC.IPC_Exception import IPC_Exception
+
+
+class IPC_SignatureException(IPC_Exception):
+    """
+ * Response signature is missing or does not match the API public key
+    """
+    pass
@@ -1,7 +1,7 @@
 from IPC.Base import Base
 from IPC.Config import Config
 from IPC.Helper import Helper
-from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
 class MandateManagement(Base):
@@ -9,6 +9,13 @@ class MandateManagement(Base):
  * Process IPC method: IPCMandateManagement.
  * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCMandateManagement', (
+        ParamSchema.field('MandateReference', 'getMandateReference'),
+        ParamSchema.field('CustomerWalletNumber', 'getCustomerWalletNumber'),
+        ParamSchema.field('Action', 'getAction'),
+        ParamSchema.field('MandateText', 'getMandateText'),
+        ParamSchema.field('OutputFormat', 'getOutputFormat', Helper.isValidOutputFormat, 'Invalid Output format'),
+    ))
     MANDATE_MANAGEMENT_ACTION_REGISTER = 1
     MANDATE_MANAGEMENT_ACTION_CANCEL = 2
     __mandateReference: str
@@ -50,21 +57,7 @@ class MandateManagement(Base):
     * @return Response
     * @raises IPC_Exception
         """
-        self.validate()
-        self._addPostParam('IPCmethod', 'IPCMandateManagement')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
-        self._addPostParam('MandateReference', self.getMandateReference())
-        self._addPostParam('CustomerWalletNumber', self.getCustomerWalletNumber())
-        self._addPostParam('Action', self.getAction())
-        self._addPostParam('MandateText', self.getMandateText())
-        self._addPostParam('OutputFormat', self.getOutputFormat())
-
-        return self._processPost()
+        return self._process()
 
     def validate(self):
         """
@@ -72,13 +65,7 @@ class MandateManagement(Base):
     * @return boolean
     * @raises IPC_Exception
         """
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
-
-        if self.getOutputFormat() == None or not Helper.isValidOutputFormat(self.getOutputFormat()):
-            raise IPC_Exception('Invalid Output format')
+        self._schema.validate(self)
 
         return True
 
@@ -0,0 +1,270 @@
+import ssl
+import threading
+from bisect import bisect_left
+
+from IPC.IPC_ConnectionException import IPC_ConnectionException
+from IPC.IPC_Exception import IPC_Exception
+from IPC.IPC_GeneralErrorException import IPC_GeneralErrorException
+from IPC.IPC_SignatureException import IPC_SignatureException
+from IPC.Tracer import Tracer
+
+
+class MetricsRegistry(Tracer):
+    """
+ * Counts and times API requests, set it with Config.setTracer() and expose collected metrics in
+ * Prometheus text format with exposition(), wsgi() or asgi().
+ * Every thread records into its own shard, so recording takes no lock. Shards are merged when metrics are collected
+    """
+    """
+    * Default histogram buckets, in seconds
+    """
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    OUTCOME_OK = 'ok'
+    """
+    * Request failed before it was sent, e.g. details failed validation
+    """
+    OUTCOME_INVALID = 'invalid'
+    """
+    * Connection to IPC host could not be opened
+    """
+    OUTCOME_CONNECT_ERROR = 'connect_error'
+    """
+    * Connection was lost while sending request or reading response
+    """
+    OUTCOME_RECEIVE_ERROR = 'receive_error'
+    OUTCOME_TLS_ERROR = 'tls_error'
+    """
+    * Connect or read exceeded Config connection timeout
+    """
+    OUTCOME_TIMEOUT = 'timeout'
+    """
+    * Response signature missing or not matching the API public key
+    """
+    OUTCOME_BAD_SIGNATURE = 'bad_signature'
+    """
+    * Unsigned STATUS_IPC_ERROR response
+    """
+    OUTCOME_IPC_ERROR = 'ipc_error'
+    OUTCOME_BAD_RESPONSE = 'bad_response'
+    OUTCOME_ERROR = 'error'
+
+    """
+    * Collected metrics: name => (type, help, label names)
+    """
+    METRICS = {
+        'ipc_requests_total': ('counter', 'API requests by IPCmethod and outcome', ('method', 'outcome')),
+        'ipc_responses_total': ('counter', 'Verified API responses by IPCmethod and Status', ('method', 'status')),
+        'ipc_request_duration_seconds': ('histogram', 'API request duration by IPCmethod', ('method',)),
+        'ipc_stage_duration_seconds': ('histogram', 'API request stage duration by IPCmethod and stage', ('method', 'stage')),
+    }
+
+    __buckets: tuple
+    __tracer = None
+
+    def __init__(self, buckets = None, tracer = None):
+        """
+    * @param tuple buckets Histogram buckets in seconds, ascending
+    * @param Tracer tracer Tracer to pass every request to after it is recorded, e.g. OpenTelemetryTracer
+        """
+        self.__buckets = tuple(buckets) if buckets is not None else self.BUCKETS
+        self.__tracer = tracer
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        self.__shards = []
+        self.__retired = ({}, {})
+
+    def finish(self, trace):
+        """
+    * Record finished request\n
+    * @param Trace trace
+        """
+        counters, histograms = self.__getShard()
+        method = trace.getMethod() or ''
+
+        key = ('ipc_requests_total', method, self.getOutcome(trace))
+        counters[key] = counters.get(key, 0) + 1
+        status = trace.getStatus()
+        if status is not None:
+            key = ('ipc_responses_total', method, str(status))
+            counters[key] = counters.get(key, 0) + 1
+
+        buckets = self.__buckets
+        size = len(buckets) + 3
+        observations = [(('ipc_request_duration_seconds', method), trace.getDuration())]
+        observations.extend((('ipc_stage_duration_seconds', method, stage), (end - start) / 1e9)
+                            for stage, start, end in trace.getStages())
+        for key, value in observations:
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = [0] * size
+            histogram[bisect_left(buckets, value)] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+        if self.__tracer is not None:
+            self.__tracer.finish(trace)
+
+    def getOutcome(self, trace):
+        """
+    * Classify request by its error\n
+    * @param Trace trace\n
+    * @return string OUTCOME_*
+        """
+        error = trace.getError()
+        if error is None:
+            return self.OUTCOME_OK
+
+        if isinstance(error, IPC_ConnectionException):
+            cause = error.__cause__
+            if isinstance(cause, ssl.SSLError):
+                return self.OUTCOME_TLS_ERROR
+            if isinstance(cause, TimeoutError):
+                return self.OUTCOME_TIMEOUT
+            if error.getStage() == Tracer.STAGE_CONNECT:
+                return self.OUTCOME_CONNECT_ERROR
+            return self.OUTCOME_RECEIVE_ERROR
+        if isinstance(error, IPC_SignatureException):
+            return self.OUTCOME_BAD_SIGNATURE
+        if isinstance(error, IPC_GeneralErrorException):
+            return self.OUTCOME_IPC_ERROR
+        if Tracer.STAGE_SEND not in (stage for stage, start, end in trace.getStages()):
+            return self.OUTCOME_INVALID
+        if isinstance(error, IPC_Exception):
+            return self.OUTCOME_BAD_RESPONSE
+
+        return self.OUTCOME_ERROR
+
+    def collect(self):
+        """
+    * Current values of all metrics.
+    * Histogram value is list of per-bucket counts (the last one for +Inf), then sum and count\n
+    * @return tuple (dict counters, dict histograms) keyed by tuple (string name, label values in order of METRICS)
+        """
+        with self.__lock:
+            live = []
+            for thread, shard in self.__shards:
+                if thread.is_alive():
+                    live.append((thread, shard))
+                else:
+                    self.__merge(self.__retired, shard)
+            self.__shards = live
+            result = ({}, {})
+            self.__merge(result, self.__retired)
+            for thread, shard in live:
+                self.__merge(result, shard)
+
+        return result
+
+    def exposition(self):
+        """
+    * Metrics in Prometheus text exposition format 0.0.4\n
+    * @return string
+        """
+        counters, histograms = self.collect()
+        lines = []
+        for name, (type, help, labelNames) in self.METRICS.items():
+            lines.append(f'# HELP {name} {help}')
+            lines.append(f'# TYPE {name} {type}')
+            if type == 'counter':
+                for key, value in sorted(counters.items()):
+                    if key[0] == name:
+                        lines.append(f'{name}{self.__labels(tuple(zip(labelNames, key[1:])))} {value}')
+                continue
+
+            for key, value in sorted(histograms.items()):
+                if key[0] != name:
+                    continue
+                labels = tuple(zip(labelNames, key[1:]))
+                cumulative = 0
+                for le, count in zip(self.__buckets + (float('inf'),), value):
+                    cumulative += count
+                    bound = '+Inf' if le == float('inf') else repr(le)
+                    lines.append(f'{name}_bucket{self.__labels(labels + (("le", bound),))} {cumulative}')
+                lines.append(f'{name}_sum{self.__labels(labels)} {value[-2]!r}')
+                lines.append(f'{name}_count{self.__labels(labels)} {value[-1]}')
+
+        return '\n'.join(lines) + '\n'
+
+    def wsgi(self, environ, start_response):
+        """
+    * WSGI application serving exposition()
+        """
+        reply = self.exposition().encode('utf-8')
+        start_response('200 OK', [
+            ('Content-Type', 'text/plain; version=0.0.4; charset=utf-8'),
+            ('Content-Length', str(len(reply))),
+        ])
+
+        return [reply]
+
+    async def asgi(self, scope, receive, send):
+        """
+    * ASGI application serving exposition()
+        """
+        if scope['type'] != 'http':
+            return
+
+        reply = self.exposition().encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [(b'content-type', b'text/plain; version=0.0.4; charset=utf-8'), (b'content-length', str(len(reply)).encode('ascii'))],
+        })
+        await send({'type': 'http.response.body', 'body': reply})
+
+    def __getShard(self):
+        """
+    * Counters and histograms of the current thread\n
+    * @return tuple (dict counters, dict histograms)
+        """
+        try:
+            return self.__local.shard
+        except AttributeError:
+            pass
+
+        shard = ({}, {})
+        with self.__lock:
+            self.__shards.append((threading.current_thread(), shard))
+        self.__local.shard = shard
+
+        return shard
+
+    @staticmethod
+    def __merge(target: tuple, shard: tuple):
+        """
+    * Add shard values to target. Shard of running thread may change meanwhile, it is read from a copy\n
+    * @param tuple target (dict counters, dict histograms)
+    * @param tuple shard
+        """
+        counters, histograms = target
+        for key, value in shard[0].copy().items():
+            counters[key] = counters.get(key, 0) + value
+        for key, value in shard[1].copy().items():
+            value = list(value)
+            total = histograms.get(key)
+            histograms[key] = value if total is None else [a + b for a, b in zip(total, value)]
+
+    @staticmethod
+    def __labels(labels: tuple):
+        """
+    * @param tuple labels Tuples (name, value)\n
+    * @return string
+        """
+        if not labels:
+            return ''
+        values = ','.join(f'{name}="{MetricsRegistry.__escape(value)}"' for name, value in labels)
+
+        return '{' + values + '}'
+
+    @staticmethod
+    def __escape(value: str):
+        """
+    * Escape label value\n
+    * @param string value\n
+    * @return string
+        """
+        if '\\' in value or '"' in value or '\n' in value:
+            return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+        return value
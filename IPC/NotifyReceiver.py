@@ -0,0 +1,212 @@
+import queue
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qsl
+
+from IPC.Config import Config
+from IPC.Defines import Defines
+from IPC.IPC_Exception import IPC_Exception
+from IPC.Response import Response
+
+
+class NotifyReceiver(object):
+    """
+ * Receiver of IPC notifications posted to URL_Notify, mountable as WSGI (wsgi) or ASGI (asgi) application.
+ * Notification signature is verified with the cached API public key, repeated notifications of an already delivered
+ * IPC_Trnref are acknowledged without being delivered again. Verified notifications are passed to the handler
+ * or put in a bounded queue, and "OK" is replied only after that succeeded. An IPC_Trnref is remembered as delivered
+ * only then. When the queue is full, or the same IPC_Trnref is still being delivered by another request,
+ * 503 is replied, so IPC sends the notification again later
+    """
+    OK = b'OK'
+
+    __cnf: Config
+
+    def __init__(self, cnf: Config, handler = None, maxQueueSize = 10000, dedupeSize = 100000, dedupeTtl = 86400.0, maxBodySize = 65536):
+        """
+    * @param cnf: Config
+    * @param callable handler Called with verified Response, must persist it before returning. Default is the queue
+    * @param int maxQueueSize Max count of notifications waiting in queue
+    * @param int dedupeSize Max count of remembered IPC_Trnref values
+    * @param float dedupeTtl Seconds an IPC_Trnref is remembered
+    * @param int maxBodySize Max accepted request body in bytes
+        """
+        self.__cnf = cnf
+        self.__handler = handler
+        self.__queue = queue.Queue(maxQueueSize)
+        self.__dedupeSize = dedupeSize
+        self.__dedupeTtl = dedupeTtl
+        self.__maxBodySize = maxBodySize
+        self.__seen = OrderedDict()
+        self.__inFlight = set()
+        self.__lock = threading.Lock()
+        self.__stats = {'accepted': 0, 'duplicates': 0, 'busy': 0, 'rejected': 0, 'dropped': 0}
+
+    def get(self, block = True, timeout = None):
+        """
+    * Take next verified notification from queue\n
+    * @param bool block
+    * @param float timeout\n
+    * @return Response
+    * @raises queue.Empty
+        """
+        return self.__queue.get(block, timeout)
+
+    def handle(self, body: bytes):
+        """
+    * Verify and deliver one notification\n
+    * @param bytes body urlencoded POST body\n
+    * @return tuple (int HTTP status, bytes reply)
+        """
+        if len(body) > self.__maxBodySize:
+            self.__count('rejected')
+            return 413, b'Request too large'
+
+        try:
+            response = Response.getInstance(self.__cnf, dict(parse_qsl(body.decode('utf-8'), keep_blank_values=True)), Defines.COMMUNICATION_FORMAT_POST)
+        except (IPC_Exception, UnicodeDecodeError):
+            self.__count('rejected')
+            return 400, b'Invalid notification'
+
+        trnref = response.getTrnref()
+        if trnref is not None:
+            claimed = self.__claim(trnref)
+            if claimed is None:
+                self.__count('busy')
+                return 503, b'Busy'
+            if not claimed:
+                self.__count('duplicates')
+                return 200, self.OK
+
+        delivered = False
+        try:
+            if self.__handler is not None:
+                self.__handler(response)
+            else:
+                self.__queue.put_nowait(response)
+            delivered = True
+        except queue.Full:
+            self.__count('dropped')
+            return 503, b'Busy'
+        except Exception:
+            self.__count('dropped')
+            return 500, b'Notification not stored'
+        finally:
+            if trnref is not None:
+                self.__release(trnref, delivered)
+
+        self.__count('accepted')
+
+        return 200, self.OK
+
+    def wsgi(self, environ, start_response):
+        """
+    * WSGI application
+        """
+        if environ.get('REQUEST_METHOD') != 'POST':
+            status, reply = 405, b'Method not allowed'
+        else:
+            try:
+                length = int(environ.get('CONTENT_LENGTH') or 0)
+            except ValueError:
+                length = 0
+            if length > self.__maxBodySize:
+                self.__count('rejected')
+                status, reply = 413, b'Request too large'
+            else:
+                status, reply = self.handle(environ['wsgi.input'].read(length) if length > 0 else b'')
+
+        start_response(f'{status} {self.__reason(status)}', [
+            ('Content-Type', 'text/plain'),
+            ('Content-Length', str(len(reply))),
+        ])
+
+        return [reply]
+
+    async def asgi(self, scope, receive, send):
+        """
+    * ASGI application. Signature check and handler run in the default executor
+        """
+        import asyncio
+
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+        if scope['type'] != 'http':
+            return
+
+        if scope.get('method') != 'POST':
+            status, reply = 405, b'Method not allowed'
+        else:
+            body = bytearray()
+            more = True
+            while more and len(body) <= self.__maxBodySize:
+                message = await receive()
+                body += message.get('body', b'')
+                more = message.get('more_body', False)
+            status, reply = await asyncio.get_running_loop().run_in_executor(None, self.handle, bytes(body))
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'text/plain'), (b'content-length', str(len(reply)).encode('ascii'))],
+        })
+        await send({'type': 'http.response.body', 'body': reply})
+
+    def getStats(self):
+        """
+    * @return dict accepted, duplicates, busy, rejected, dropped counts and current queue size
+        """
+        with self.__lock:
+            stats = dict(self.__stats)
+        stats['queued'] = self.__queue.qsize()
+
+        return stats
+
+    def __claim(self, trnref: str):
+        """
+    * Start delivery of IPC_Trnref\n
+    * @param string trnref\n
+    * @return boolean|None True if it may be delivered, False if it was already delivered and did not expire,
+    *  None if another request is delivering it now
+        """
+        now = time.monotonic()
+        with self.__lock:
+            if trnref in self.__inFlight:
+                return None
+            expires = self.__seen.get(trnref)
+            if expires is not None and expires > now:
+                return False
+            self.__inFlight.add(trnref)
+
+        return True
+
+    def __release(self, trnref: str, delivered: bool):
+        """
+    * Finish delivery of IPC_Trnref. Delivered IPC_Trnref is remembered, otherwise its retry is accepted\n
+    * @param string trnref
+    * @param bool delivered
+        """
+        with self.__lock:
+            self.__inFlight.discard(trnref)
+            if not delivered:
+                return
+            self.__seen[trnref] = time.monotonic() + self.__dedupeTtl
+            self.__seen.move_to_end(trnref)
+            while len(self.__seen) > self.__dedupeSize:
+                self.__seen.popitem(last=False)
+
+    def __count(self, name: str):
+        with self.__lock:
+            self.__stats[name] += 1
+
+    @staticmethod
+    def __reason(status: int):
+        return {200: 'OK', 400: 'Bad Request', 405: 'Method Not Allowed', 413: 'Payload Too Large',
+                500: 'Internal Server Error', 503: 'Service Unavailable'}.get(status, '')
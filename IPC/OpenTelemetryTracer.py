@@ -0,0 +1,46 @@
+import time
+
+from IPC.IPC_Exception import IPC_Exception
+from IPC.Tracer import Tracer
+
+try:
+    from opentelemetry import trace as otel
+except ImportError:
+    otel = None
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+ * Emits every API request as OpenTelemetry client span with a child span per stage.
+ * Spans are created after the request finished, with the recorded start and end times,
+ * so nothing is done on the request path besides taking timestamps
+    """
+    SPAN_NAME = 'ipc.request'
+
+    def __init__(self, tracer = None):
+        """
+    * @param opentelemetry.trace.Tracer tracer Default is tracer of the global tracer provider
+    * @raises IPC_Exception if opentelemetry-api is not installed
+        """
+        if otel is None:
+            raise IPC_Exception('OpenTelemetryTracer requires opentelemetry-api package')
+        self.__tracer = tracer if tracer is not None else otel.get_tracer('IPC')
+
+    def finish(self, trace):
+        """
+    * @param Trace trace
+        """
+        # perf_counter_ns() timings to epoch nanoseconds expected by OpenTelemetry
+        offset = time.time_ns() - time.perf_counter_ns()
+        tracer = self.__tracer
+        span = tracer.start_span(self.SPAN_NAME, kind=otel.SpanKind.CLIENT, attributes=trace.getAttributes(),
+                                 start_time=trace.getStart() + offset)
+        context = otel.set_span_in_context(span)
+        for stage, start, end in trace.getStages():
+            tracer.start_span(stage, context=context, start_time=start + offset).end(end_time=end + offset)
+
+        error = trace.getError()
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(otel.Status(otel.StatusCode.ERROR, str(error)))
+        span.end(end_time=trace.getEnd() + offset)
@@ -0,0 +1,219 @@
+import weakref
+from operator import methodcaller
+
+from IPC.Helper import Helper
+from IPC.IPC_Exception import IPC_Exception
+
+
+class ParamSchema(object):
+    """
+ * Declarative API params of one IPCmethod: ordered fields with getter, check and encryption flag.
+ * Fields are compiled once per request class into flat tuples, so validating and collecting params
+ * is a loop over precomputed getters. Config params heading every request are encoded once per Config and its revision
+    """
+    """
+    * Params from Config heading every request after IPCmethod, tuples (param name, Config getter)
+    """
+    CONFIG_PARAMS = (
+        ('IPCVersion', 'getVersion'),
+        ('IPCLanguage', 'getLang'),
+        ('SID', 'getSid'),
+        ('WalletNumber', 'getWallet'),
+        ('KeyIndex', 'getKeyIndex'),
+        ('Source', 'getSource'),
+    )
+
+    __method: str
+    __fields: tuple
+    __minVersion = None
+    __title: str
+    """
+    *  @var WeakKeyDictionary Config => tuple (revision, encoded Config params).
+    *  The schema is shared by all requests of the class, so it does not keep Configs alive
+    """
+    __headers: weakref.WeakKeyDictionary
+
+    def __init__(self, method: str, fields, minVersion = None, title = None):
+        """
+    * @param string method IPCmethod
+    * @param iterable fields Tuples made by field(), in order of API params
+    * @param string minVersion Lowest IPCVersion supporting the method
+    * @param string title Method name used in the IPCVersion error, default is method
+        """
+        self.__method = method
+        self.__fields = tuple(fields)
+        self.__minVersion = minVersion
+        self.__title = title if title is not None else method
+        self.__compiled = {}
+        self.__headers = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def field(name: str, getter, check = None, error = None, encrypt = False, when = None, optional = False):
+        """
+    * Describe one API param\n
+    * @param string name API param name
+    * @param string|callable getter Request getter name, dotted path of getters e.g. 'getCard.getCardNumber',
+    *  or callable(request)
+    * @param type|callable check Required type or callable(value) returning boolean, applied when error is set
+    * @param string error Makes the param required, IPC_Exception message for missing or failed value
+    * @param bool encrypt Send value encrypted with the Config encrypt public key
+    * @param callable when callable(request), the param is left out when it returns False
+    * @param bool optional Send empty value instead of 'None' when the getter returns None, without encryption\n
+    * @return tuple
+        """
+        return name, getter, check, error, encrypt, when, optional
+
+    def getMethod(self):
+        """
+    * @return string IPCmethod
+        """
+        return self.__method
+
+    def getFields(self):
+        """
+    * @return tuple of field() tuples
+        """
+        return self.__fields
+
+    def validate(self, request):
+        """
+    * Validate Config, IPCVersion and all required fields of request, in order of fields\n
+    * @param Base request\n
+    * @return boolean
+    * @raises IPC_Exception
+        """
+        cnf = request._getCnf()
+        try:
+            cnf.validate()
+        except Exception as ex:
+            raise IPC_Exception(f'Invalid Config details: {ex}')
+
+        if self.__minVersion is not None and not Helper.versionCheck(cnf.getVersion(), self.__minVersion):
+            raise IPC_Exception('IPCVersion ' + cnf.getVersion() + ' does not support ' + self.__title
+                                + ' method. Please use ' + self.__minVersion + ' or above.')
+
+        for getter, check, error, when in self.__compile(type(request))[0]:
+            if when is not None and not when(request):
+                continue
+            value = getter(request)
+            if value is None or check is not None and not check(value):
+                raise IPC_Exception(error)
+
+        return True
+
+    def entries(self, request, encrypt):
+        """
+    * Encode API params of request, without validating them\n
+    * @param Base request
+    * @param callable encrypt callable(string value) returning encrypted value\n
+    * @return list of tuple (string name, tuple (string raw, string escaped)) to be added to PostParams
+        """
+        entries = list(self.getHeader(request._getCnf()))
+        append = entries.append
+        encode = request._encodePostParam
+        for name, getter, encrypted, when, optional in self.__compile(type(request))[1]:
+            if when is not None and not when(request):
+                continue
+            value = getter(request)
+            if value is None and optional:
+                append((name, ('', '')))
+                continue
+            if not isinstance(value, str):
+                value = str(value)
+            if encrypted:
+                value = encrypt(value)
+                append((name, (value, value)))
+            else:
+                append((name, encode(value)))
+
+        return entries
+
+    def getHeader(self, cnf):
+        """
+    * IPCmethod and Config params heading every request, encoded again only after Config changed\n
+    * @param Config cnf\n
+    * @return tuple of entries
+        """
+        revision = cnf.getRevision()
+        header = self.__headers.get(cnf)
+        if header is not None and header[0] == revision:
+            return header[1]
+
+        entries = [('IPCmethod', (self.__method, self.__method))]
+        for name, getter in self.CONFIG_PARAMS:
+            value = getattr(cnf, getter)()
+            entries.append((name, self.__encode(value)))
+        # Tuple is stored at once, so threads sharing the schema never see a half-built header
+        header = (revision, tuple(entries))
+        self.__headers[cnf] = header
+
+        return header[1]
+
+    @staticmethod
+    def __encode(value):
+        """
+    * @param mixed value\n
+    * @return tuple (string raw, string escaped)
+        """
+        raw = Helper.unescape(value if isinstance(value, str) else str(value))
+
+        return raw, Helper.escape(raw)
+
+    def __compile(self, cls):
+        """
+    * Resolve getters and checks of all fields for request class, once per class\n
+    * @param type cls\n
+    * @return tuple (tuple checks, tuple params)
+        """
+        compiled = self.__compiled.get(cls)
+        if compiled is not None:
+            return compiled
+
+        checks = []
+        params = []
+        for name, getter, check, error, encrypt, when, optional in self.__fields:
+            getter = self.__resolveGetter(cls, getter)
+            if isinstance(check, type):
+                check = self.__isInstance(check)
+            if error is not None:
+                checks.append((getter, check, error, when))
+            params.append((name, getter, encrypt, when, optional))
+        compiled = self.__compiled[cls] = (tuple(checks), tuple(params))
+
+        return compiled
+
+    @staticmethod
+    def __resolveGetter(cls, getter):
+        """
+    * @param type cls
+    * @param string|callable getter\n
+    * @return callable(request)
+        """
+        if callable(getter):
+            return getter
+
+        first, *rest = getter.split('.')
+        first = getattr(cls, first)
+        if not rest:
+            return first
+
+        rest = [methodcaller(name) for name in rest]
+
+        def resolve(request):
+            value = first(request)
+            for get in rest:
+                if value is None:
+                    return None
+                value = get(value)
+
+            return value
+
+        return resolve
+
+    @staticmethod
+    def __isInstance(type):
+        """
+    * @param type type\n
+    * @return callable(value)
+        """
+        return lambda value: isinstance(value, type)
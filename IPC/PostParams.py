@@ -0,0 +1,126 @@
+import re
+from binascii import b2a_base64
+
+
+class PostParams(object):
+    """
+ * Ordered API request params of a single request.
+ * Keeps raw (unescaped) value used for signing next to the escaped value sent to API.
+ * Not shared between requests, so requests may be built in parallel threads
+    """
+    """
+    * Sign data is base64 encoded in blocks of this size, must be multiple of 3
+    """
+    SIGN_BLOCK_SIZE = 3072
+    """
+    * Bytes needing escape in form-urlencoded body, all but the ones kept by urllib.parse.quote_plus
+    """
+    __unsafe = re.compile(rb'[^A-Za-z0-9_.~-]')
+    """
+    * Escaped byte by byte value
+    """
+    __quoted = tuple(b'+' if i == 0x20 else b'%%%02X' % i for i in range(256))
+
+    __slots__ = ('__values',)
+
+    def __init__(self):
+        """
+    * @var dict Param name => tuple (raw value, escaped value)
+        """
+        self.__values = {}
+
+    def set(self, name: str, raw: str, escaped: str):
+        """
+    * Add param or replace value of existing one keeping its position\n
+    * @param string name
+    * @param string raw Value used for request signature
+    * @param string escaped Value sent to API
+        """
+        self.__values[name] = (raw, escaped)
+
+    def update(self, entries):
+        """
+    * Add many params at once, e.g. prepared entries() of other PostParams\n
+    * @param iterable entries of tuple (string name, tuple (string raw, string escaped))
+        """
+        self.__values.update(entries)
+
+    def get(self, name: str, default = None):
+        """
+    * Escaped value of param\n
+    * @param string name
+    * @param mixed default\n
+    * @return string
+        """
+        value = self.__values.get(name)
+
+        return default if value is None else value[1]
+
+    def items(self):
+        """
+    * Param names with escaped values in order of adding\n
+    * @return iterable of tuple (string, string)
+        """
+        return ((name, value[1]) for name, value in self.__values.items())
+
+    def entries(self):
+        """
+    * Param names with both values in order of adding, without copying\n
+    * @return iterable of tuple (string name, tuple (string raw, string escaped))
+        """
+        return self.__values.items()
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __contains__(self, name):
+        return name in self.__values
+
+    def updateDigest(self, digest):
+        """
+    * Feed request sign data - base64 of raw values joined with '-' - into hash object.
+    * Data is encoded block by block, so the joined string is never built\n
+    * @param digest Hash object with update() method
+        """
+        blockSize = self.SIGN_BLOCK_SIZE
+        buf = bytearray()
+        sep = b''
+        for raw, escaped in self.__values.values():
+            buf += sep
+            buf += raw.encode('utf-8')
+            sep = b'-'
+            if len(buf) >= blockSize:
+                cut = len(buf) - len(buf) % 3
+                with memoryview(buf) as view:
+                    digest.update(b2a_base64(view[:cut], newline=False))
+                del buf[:cut]
+        digest.update(b2a_base64(buf, newline=False))
+
+    def encodeBody(self):
+        """
+    * Form-urlencode escaped values straight into one buffer, output is the same as of urllib.parse.urlencode(items())\n
+    * @return bytearray
+        """
+        quote = self.__quote
+        body = bytearray()
+        sep = b''
+        for name, (raw, escaped) in self.__values.items():
+            body += sep
+            body += quote(name.encode('utf-8'))
+            body += b'='
+            body += quote(escaped.encode('utf-8'))
+            sep = b'&'
+
+        return body
+
+    @staticmethod
+    def __quote(data: bytes):
+        """
+    * @param bytes data\n
+    * @return bytes
+        """
+        return PostParams.__unsafe.sub(PostParams.__quoteMatch, data)
+
+    @staticmethod
+    def __quoteMatch(match):
+        return PostParams.__quoted[match[0][0]]
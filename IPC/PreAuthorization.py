@@ -1,14 +1,19 @@
-from IPC.Base import Base
 from IPC.Config import Config
+from IPC.FormRequest import FormRequest
 from IPC.Helper import Helper
 from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
-class PreAuthorization(Base):
+class PreAuthorization(FormRequest):
     """
  * Process IPC method: IPCPreAuthorization.
  * Collect, validate and send API params
     """
+    """
+    * Only the IPCmethod and Config params heading the request are described, the rest is collected by _prepare()
+    """
+    _schema = ParamSchema('IPCPreAuthorization', ())
     __url_ok: str
     __url_cancel: str
     __url_notify: str
@@ -85,21 +90,14 @@ class PreAuthorization(Base):
 
         return self
 
-    def process(self):
+    def _prepare(self):
         """
-    * Initiate API request\n
-    * @return boolean
+    * Validate all set details and collect API params\n
     * @raises IPC_Exception
         """
         self.validate()
 
-        self._addPostParam('IPCmethod', 'IPCPreAuthorization')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
+        self._addHeaderParams()
 
         self._addPostParam('ItemName', self.getItemName())
 
@@ -113,10 +111,6 @@ class PreAuthorization(Base):
 
         self._addPostParam('Note', self.getNote())
 
-        self._processHtmlPost()
-
-        return True
-
     def validate(self):
         """
     * Validate all set PreAuthorization details\n
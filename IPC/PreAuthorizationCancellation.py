@@ -1,7 +1,7 @@
 from IPC.Base import Base
 from IPC.Config import Config
 from IPC.Helper import Helper
-from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
 class PreAuthorizationCancellation(Base):
@@ -9,6 +9,12 @@ class PreAuthorizationCancellation(Base):
  * Process IPC method: IPCPreAuthorizationCancellation.
  * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCPreAuthCancellation', (
+        ParamSchema.field('OrderID', 'getOrderID'),
+        ParamSchema.field('Amount', 'getAmount', Helper.isValidAmount, 'Empty or invalid amount'),
+        ParamSchema.field('Currency', 'getCurrency', error='Invalid currency'),
+        ParamSchema.field('OutputFormat', 'getOutputFormat'),
+    ), minVersion='1.4', title='IPCPreAuthorizationCancellation')
     __currency = 'EUR'
     __amount: float
     __orderID: str
@@ -56,24 +62,7 @@ class PreAuthorizationCancellation(Base):
     * @return Response
     * @raises IPC_Exception
         """
-        self.validate()
-
-        self._addPostParam('IPCmethod', 'IPCPreAuthCancellation')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
-
-        self._addPostParam('OrderID', self.getOrderID())
-
-        self._addPostParam('Amount', self.getAmount())
-        self._addPostParam('Currency', self.getCurrency())
-
-        self._addPostParam('OutputFormat', self.getOutputFormat())
-
-        return self._processPost()
+        return self._process()
 
     def validate(self):
         """
@@ -81,19 +70,7 @@ class PreAuthorizationCancellation(Base):
     * @return boolean
     * @raises IPC_Exception
         """
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
-
-        if not Helper.versionCheck(self._getCnf().getVersion(), '1.4'):
-            raise IPC_Exception('IPCVersion ' + self._getCnf().getVersion() + ' does not support IPCPreAuthorizationCancellation method. Please use 1.4 or above.')
-
-        if self.getCurrency() == None:
-            raise IPC_Exception('Invalid currency')
-
-        if self.getAmount() == None or not Helper.isValidAmount(self.getAmount()):
-            raise IPC_Exception('Empty or invalid amount')
+        self._schema.validate(self)
 
         return True
 
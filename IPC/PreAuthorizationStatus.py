@@ -1,7 +1,7 @@
 from IPC.Base import Base
 from IPC.Config import Config
-from IPC.Helper import Helper
-from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
+from IPC.StatusPoller import StatusPoller
 
 
 class PreAuthorizationStatus(Base):
@@ -9,6 +9,10 @@ class PreAuthorizationStatus(Base):
  * Process IPC method: IPCPreAuthorizationStatus.
  * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCPreAuthStatus', (
+        ParamSchema.field('OrderID', 'getOrderID'),
+        ParamSchema.field('OutputFormat', 'getOutputFormat'),
+    ), minVersion='1.4', title='IPCPreAuthorizationStatus')
     __orderID: str
 
     def __init__(self, cnf: Config):
@@ -28,27 +32,27 @@ class PreAuthorizationStatus(Base):
 
         return self
 
+    @classmethod
+    def bulk(cls, cnf: Config, orderIDs, concurrency = None, retries = 3, backoff = 0.5):
+        """
+    * Request status of many orders over a bounded worker pool.
+    * Requests ending with STATUS_IPC_ERROR are retried with exponential backoff\n
+    * @param cnf: Config
+    * @param iterable orderIDs
+    * @param int concurrency Max count of requests in flight, default is Config connection pool size
+    * @param int retries
+    * @param float backoff Seconds before first retry\n
+    * @return generator of tuple (string orderID, Response|IPC_Exception result) in completion order
+        """
+        return StatusPoller(cls, cnf, concurrency, retries, backoff).poll(orderIDs)
+
     def process(self):
         """
     * Initiate API request\n
     * @return Response
     * @raises IPC_Exception
         """
-        self.validate()
-
-        self._addPostParam('IPCmethod', 'IPCPreAuthStatus')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
-
-        self._addPostParam('OrderID', self.getOrderID())
-
-        self._addPostParam('OutputFormat', self.getOutputFormat())
-
-        return self._processPost()
+        return self._process()
 
     def validate(self):
         """
@@ -56,13 +60,7 @@ class PreAuthorizationStatus(Base):
     * @return boolean
     * @raises IPC_Exception
         """
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
-
-        if not Helper.versionCheck(self._getCnf().getVersion(), '1.4'):
-            raise IPC_Exception('IPCVersion ' + self._getCnf().getVersion() + ' does not support IPCPreAuthorizationStatus method. Please use 1.4 or above.')
+        self._schema.validate(self)
 
         return True
 
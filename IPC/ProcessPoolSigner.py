@@ -0,0 +1,88 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from IPC import Crypto
+from IPC.Signer import Signer
+
+# Store private key, imported once per worker process
+_workerKey = None
+
+
+def _initWorker(privateKey: str):
+    global _workerKey
+    _workerKey = Crypto.importKey(privateKey)
+
+
+def _signInWorker(oid: str, value: bytes):
+    return Crypto.signDigest(Crypto.PrehashedDigest(oid, value), _workerKey)
+
+
+class ProcessPoolSigner(Signer):
+    """
+ * Signs request digests in a pool of worker processes, so RSA signing of large batches
+ * is spread over all CPU cores. Only the finished digest is sent to the worker.
+ * Workers import the key once, they are started on first use and restarted when the Config key changes
+    """
+    __key = None
+    __executor = None
+
+    def __init__(self, workers = None, chunkSize = 16):
+        """
+    * @param int workers Count of worker processes, default is CPU count
+    * @param int chunkSize Count of digests sent to a worker at once by signMany()
+        """
+        self.__workers = workers
+        self.__chunkSize = chunkSize
+        self.__lock = threading.Lock()
+
+    def __getExecutor(self, privateKey):
+        """
+    * Worker pool holding given key, workers holding another key are shut down\n
+    * @param RsaKey privateKey\n
+    * @return ProcessPoolExecutor
+        """
+        with self.__lock:
+            if self.__key is not privateKey:
+                if self.__executor is not None:
+                    self.__executor.shutdown(wait=False)
+                self.__executor = ProcessPoolExecutor(
+                    max_workers=self.__workers,
+                    initializer=_initWorker,
+                    initargs=(privateKey.export_key().decode('ascii'),),
+                )
+                self.__key = privateKey
+
+            return self.__executor
+
+    def sign(self, digest, privateKey):
+        """
+    * @param digest Hash object of request sign data
+    * @param RsaKey privateKey Store RSA key\n
+    * @return bytes signature
+        """
+        return self.__getExecutor(privateKey).submit(_signInWorker, digest.oid, digest.digest()).result()
+
+    def signMany(self, digests, privateKey):
+        """
+    * @param list digests Hash objects of request sign data
+    * @param RsaKey privateKey Store RSA key\n
+    * @return list signatures in input order
+        """
+        digests = list(digests)
+
+        return list(self.__getExecutor(privateKey).map(
+            _signInWorker,
+            [digest.oid for digest in digests],
+            [digest.digest() for digest in digests],
+            chunksize=self.__chunkSize,
+        ))
+
+    def close(self):
+        """
+    * Shut down worker processes
+        """
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown()
+            self.__executor = None
+            self.__key = None
@@ -1,12 +1,14 @@
-from IPC.Base import Base
 from IPC.Cart import Cart
 from IPC.Customer import Customer
 from IPC.Config import Config
+from IPC.FormRequest import FormRequest
 from IPC.Helper import Helper
 from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
+from IPC.PostParams import PostParams
 
 
-class Purchase(Base):
+class Purchase(FormRequest):
     """
  * Process IPC method: IPCPurchase.
  * Collect, validate and send API params
@@ -23,8 +25,13 @@ class Purchase(Base):
     PAYMENT_METHOD_IDEAL = 2
     PAYMENT_METHOD_BOTH = 3
 
-    __cart: Cart
-    __customer: Customer
+    """
+    * Only the IPCmethod and Config params heading the request are described, the rest is collected by _buildParams()
+    """
+    _schema = ParamSchema('IPCPurchase', ())
+
+    __cart: Cart = None
+    __customer: Customer = None
     __url_ok: str
     __url_cancel: str
     __url_notify: str
@@ -97,70 +104,136 @@ class Purchase(Base):
         """
         self.__paymentParametersRequired = paymentParametersRequired
 
-    def process(self):
+    def _prepare(self):
         """
-    * Initiate API request\n
-    * @return boolean
+    * Validate all set details and collect API params\n
     * @raises IPC_Exception
         """
         self.validate()
 
-        self._addPostParam('IPCmethod', 'IPCPurchase')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
+        self._setPostParams(self._buildParams(self._getSettingsParams(), self.getOrderID(), self.getCart(), self.getCustomer(), self.getNote()))
 
-        self._addPostParam('Currency', self.getCurrency())
-        if self.__isNoCartPurchase():
-            self._addPostParam('Amount', self.__cart.getTotal())
-
-        self._addPostParam('OrderID', self.getOrderID())
-        self._addPostParam('URL_OK', self.getUrlOk())
-        self._addPostParam('URL_Cancel', self.getUrlCancel())
-        self._addPostParam('URL_Notify', self.getUrlNotify())
-
-        self._addPostParam('Note', self.getNote())
+    def _getSettingsParams(self):
+        """
+    * Encoded params of details which do not change between purchases: currency, URLs and purchase type\n
+    * @return dict param name => tuple (string raw, string escaped)
+        """
+        encode = self._encodePostParam
 
-        if self.getPaymentParametersRequired() != self.PURCHASE_TYPE_SIMPLIFIED_PAYMENT_PAGE:
-            self._addPostParam('customeremail', self.getCustomer().getEmail())
-            self._addPostParam('customerphone', self.getCustomer().getPhone())
-            self._addPostParam('customerfirstnames', self.getCustomer().getFirstName())
-            self._addPostParam('customerfamilyname', self.getCustomer().getLastName())
-            self._addPostParam('customercountry', self.getCustomer().getCountry())
-            self._addPostParam('customercity', self.getCustomer().getCity())
-            self._addPostParam('customerzipcode', self.getCustomer().getZip())
-            self._addPostParam('customeraddress', self.getCustomer().getAddress())
+        return {
+            'Currency': encode(self.getCurrency()),
+            'URL_OK': encode(self.getUrlOk()),
+            'URL_Cancel': encode(self.getUrlCancel()),
+            'URL_Notify': encode(self.getUrlNotify()),
+            'CardTokenRequest': encode(self.getCardTokenRequest()),
+            'PaymentParametersRequired': encode(self.getPaymentParametersRequired()),
+            'PaymentMethod': encode(self.getPaymentMethod()),
+        }
 
+    def _buildParams(self, settings: dict, orderID: str, cart, customer, note):
+        """
+    * Collect API params in API order, cart and customer are left out as purchase type of this purchase requires.
+    * Used by _prepare() and by PurchaseTemplate with settings encoded once\n
+    * @param dict settings Result of _getSettingsParams()
+    * @param string orderID
+    * @param Cart cart
+    * @param Customer customer
+    * @param string note\n
+    * @return PostParams
+        """
         if self.__isNoCartPurchase():
-            self._addPostParam('CartItems', self.__cart.getItemsCount())
-            items = self.__cart.getCart()
+            cart = None
+        if not self.__isWithCustomer():
+            customer = None
+        encode = self._encodePostParam
+        params = PostParams()
+        params.update(self._schema.getHeader(self._getCnf()))
+
+        params.set('Currency', *settings['Currency'])
+        if cart is not None:
+            params.set('Amount', *encode(cart.getTotal()))
+
+        params.set('OrderID', *encode(orderID))
+        params.set('URL_OK', *settings['URL_OK'])
+        params.set('URL_Cancel', *settings['URL_Cancel'])
+        params.set('URL_Notify', *settings['URL_Notify'])
+
+        params.set('Note', *encode(note))
+
+        if customer is not None:
+            params.set('customeremail', *encode(customer.getEmail()))
+            params.set('customerphone', *encode(customer.getPhone()))
+            params.set('customerfirstnames', *encode(customer.getFirstName()))
+            params.set('customerfamilyname', *encode(customer.getLastName()))
+            params.set('customercountry', *encode(customer.getCountry()))
+            params.set('customercity', *encode(customer.getCity()))
+            params.set('customerzipcode', *encode(customer.getZip()))
+            params.set('customeraddress', *encode(customer.getAddress()))
+
+        if cart is not None:
+            currency = settings['Currency']
+            params.set('CartItems', *encode(cart.getItemsCount()))
             i = 1
-            for v in items :
-                self._addPostParam(f'Article_{i}', v['name'])
-                self._addPostParam(f'Quantity_{i}', v['quantity'])
-                self._addPostParam(f'Price_{i}', v['price'])
-                self._addPostParam(f'Amount_{i}', v['price'] * v['quantity'])
-                self._addPostParam(f'Currency_{i}', self.getCurrency())
-                if bool(v['delivery']):
-                    self._addPostParam(f'Delivery_{i}', v['delivery'])
+            for name, quantity, price, amount, delivery in cart.getItems():
+                params.set(f'Article_{i}', *encode(name))
+                params.set(f'Quantity_{i}', *encode(quantity))
+                params.set(f'Price_{i}', *encode(price))
+                params.set(f'Amount_{i}', *encode(amount))
+                params.set(f'Currency_{i}', *currency)
+                if delivery:
+                    params.set(f'Delivery_{i}', *encode(delivery))
 
                 i += 1
 
-        self._addPostParam('CardTokenRequest', self.getCardTokenRequest())
-        self._addPostParam('PaymentParametersRequired', self.getPaymentParametersRequired())
-        self._addPostParam('PaymentMethod', self.getPaymentMethod())
+        params.set('CardTokenRequest', *settings['CardTokenRequest'])
+        params.set('PaymentParametersRequired', *settings['PaymentParametersRequired'])
+        params.set('PaymentMethod', *settings['PaymentMethod'])
 
-        self._processHtmlPost()
-
-        return True
+        return params
 
     def validate(self):
         """
     * Validate all set purchase details\n
     * @return boolean
+    * @raises IPC_Exception
+        """
+        self._validateSettings()
+        self._validateDetails(self.getCart(), self.getCustomer())
+
+        return True
+
+    def _validateDetails(self, cart, customer):
+        """
+    * Validate details which change between purchases against purchase type of this purchase\n
+    * @param Cart cart
+    * @param Customer customer\n
+    * @return boolean
+    * @raises IPC_Exception
+        """
+        if not self.__isNoCartPurchase():
+            if cart == None:
+                raise IPC_Exception('Missing Cart details')
+
+            try:
+                cart.validate()
+            except Exception as ex:
+                raise IPC_Exception(f'Invalid Cart details: {ex}')
+
+        if self.__isWithCustomer():
+            try:
+                if not customer:
+                    raise IPC_Exception('Customer details not set!')
+                if self.getPaymentParametersRequired() == self.PURCHASE_TYPE_FULL:
+                    customer.validate(self.getPaymentParametersRequired())
+            except Exception as ex:
+                raise IPC_Exception(f'Invalid Customer details: {ex}')
+
+        return True
+
+    def _validateSettings(self):
+        """
+    * Validate details which do not change between purchases: URLs, currency, purchase type and config\n
+    * @return boolean
     * @raises IPC_Exception
         """
         if self.getUrlCancel() == None or not Helper.isValidURL(self.getUrlCancel()):
@@ -189,28 +262,19 @@ class Purchase(Base):
         if self.getCurrency() == None:
             raise IPC_Exception('Invalid currency')
 
+        return self._validateConfig()
+
+    def _validateConfig(self):
+        """
+    * Validate config, the result is cached by Config until it changes\n
+    * @return boolean
+    * @raises IPC_Exception
+        """
         try:
             self._getCnf().validate()
         except Exception as ex:
             raise IPC_Exception(f'Invalid Config details: {ex}')
 
-        if not self.__isNoCartPurchase():
-            if self.getCart() == None:
-                raise IPC_Exception('Missing Cart details')
-
-            try:
-                self.getCart().validate()
-            except Exception as ex:
-                raise IPC_Exception(f'Invalid Cart details: {ex}')
-
-        if self.getPaymentParametersRequired() == self.PURCHASE_TYPE_FULL:
-            try:
-                if not self.getCustomer():
-                    raise IPC_Exception('Customer details not set!')
-                self.getCustomer().validate(self.getPaymentParametersRequired())
-            except Exception as ex:
-                raise IPC_Exception(f'Invalid Customer details: {ex}')
-
         return True
 
     def getUrlCancel(self):
@@ -282,6 +346,13 @@ class Purchase(Base):
         """
         return self.getCardTokenRequest() == self.CARD_TOKEN_REQUEST_ONLY_STORE
 
+    def __isWithCustomer(self):
+        """
+    * Customer params are sent unless the payment page collects them\n
+    * @return bool
+        """
+        return self.getPaymentParametersRequired() != self.PURCHASE_TYPE_SIMPLIFIED_PAYMENT_PAGE
+
     def getCart(self):
         """
     * Cart object\n
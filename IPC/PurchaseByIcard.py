@@ -1,15 +1,20 @@
-from IPC.Base import Base
 from IPC.Cart import Cart
 from IPC.Config import Config
+from IPC.FormRequest import FormRequest
 from IPC.Helper import Helper
 from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
-class PurchaseByIcard(Base):
+class PurchaseByIcard(FormRequest):
     """
  * Process IPC method: IPCPurchaseByIcard.
  * Collect, validate and send API params
     """
+    """
+    * Only the IPCmethod and Config params heading the request are described, the rest is collected by _prepare()
+    """
+    _schema = ParamSchema('IPCPurchaseByIcard', ())
 
     __cart: Cart
 
@@ -93,21 +98,14 @@ class PurchaseByIcard(Base):
         return self
 
 
-    def process(self):
+    def _prepare(self):
         """
-    * Initiate API request\n
-    * @return boolean
+    * Validate all set details and collect API params\n
     * @raises IPC_Exception
         """
         self.validate()
 
-        self._addPostParam('IPCmethod', 'IPCPurchaseByIcard')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
+        self._addHeaderParams()
 
         self._addPostParam('Currency', self.getCurrency())
         self._addPostParam('Amount', self.__cart.getTotal())
@@ -121,18 +119,15 @@ class PurchaseByIcard(Base):
         self._addPostParam('CustomerPhone', self.getPhone())
 
         self._addPostParam('CartItems', self.__cart.getItemsCount())
-        items = self.__cart.getCart()
+        items = self.__cart.getItems()
         i = 1
-        for v in items :
-            self._addPostParam(f'Article_{i}', v['name'])
-            self._addPostParam(f'Quantity_{i}', v['quantity'])
-            self._addPostParam(f'Price_{i}', v['price'])
-            self._addPostParam(f'Amount_{i}', v['price'] * v['quantity'])
+        for name, quantity, price, amount, delivery in items:
+            self._addPostParam(f'Article_{i}', name)
+            self._addPostParam(f'Quantity_{i}', quantity)
+            self._addPostParam(f'Price_{i}', price)
+            self._addPostParam(f'Amount_{i}', amount)
             self._addPostParam(f'Currency_{i}', self.getCurrency())
             i += 1
-        self._processHtmlPost()
-
-        return True
 
     def validate(self):
         """
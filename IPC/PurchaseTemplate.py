@@ -0,0 +1,82 @@
+import copy
+
+from IPC.Base import Base
+from IPC.Cart import Cart
+from IPC.Customer import Customer
+from IPC.FormRenderer import FormRenderer
+from IPC.Purchase import Purchase
+
+
+class PurchaseTemplate(Base):
+    """
+ * Reusable IPCPurchase request for purchases sharing config, currency, URLs and purchase type.
+ * Shared details are validated and escaped once when the template is created,
+ * each purchase only adds OrderID, cart, customer and note, signs and renders the form.
+ * Params are collected by the same builder as Purchase, Config params follow the Config revision.
+ * The template keeps no per-purchase state, so it may be shared between threads
+    """
+    _schema = Purchase._schema
+
+    __purchase: Purchase
+    __settings: dict
+
+    def __init__(self, purchase: Purchase):
+        """
+    * @param purchase: Purchase Purchase with config, currency, URLs, CardTokenRequest,
+    * PaymentParametersRequired and PaymentMethod set. Later changes of the purchase do not affect the template
+    * @raises IPC_Exception
+        """
+        purchase._validateSettings()
+        self._setCnf(purchase._getCnf())
+        self.__purchase = copy.copy(purchase)
+        self.__settings = self.__purchase._getSettingsParams()
+
+    def prepare(self, orderID: str, cart: Cart = None, customer: Customer = None, note = ''):
+        """
+    * Validate purchase details and build signed API params\n
+    * @param string orderID
+    * @param Cart cart Not needed when only card token is requested
+    * @param Customer customer Needed unless PaymentParametersRequired is PURCHASE_TYPE_SIMPLIFIED_PAYMENT_PAGE
+    * @param string note\n
+    * @return PostParams
+    * @raises IPC_Exception
+        """
+        return self._signPostParams(self.__build(orderID, cart, customer, note))
+
+    def render(self, orderID: str, cart: Cart = None, customer: Customer = None, note = '', compress = False):
+        """
+    * Build auto-submit HTML form of the purchase\n
+    * @param string orderID
+    * @param Cart cart
+    * @param Customer customer
+    * @param string note
+    * @param bool compress Return gzip compressed page, to be sent with Content-Encoding: gzip\n
+    * @return bytes UTF-8 encoded page
+    * @raises IPC_Exception
+        """
+        return FormRenderer.render(self._getCnf().getIpcURL(), self.prepare(orderID, cart, customer, note), compress)
+
+    def renderTo(self, write, orderID: str, cart: Cart = None, customer: Customer = None, note = ''):
+        """
+    * Write auto-submit HTML form of the purchase into response writer\n
+    * @param callable write Called with bytes
+    * @param string orderID
+    * @param Cart cart
+    * @param Customer customer
+    * @param string note
+    * @raises IPC_Exception
+        """
+        FormRenderer.stream(self._getCnf().getIpcURL(), self.prepare(orderID, cart, customer, note), write)
+
+    def __build(self, orderID: str, cart: Cart, customer: Customer, note):
+        """
+    * Validate per-purchase details and collect API params with the param builder of Purchase.
+    * Config params are taken from the Config of current revision\n
+    * @return PostParams
+    * @raises IPC_Exception
+        """
+        purchase = self.__purchase
+        purchase._validateConfig()
+        purchase._validateDetails(cart, customer)
+
+        return purchase._buildParams(self.__settings, orderID, cart, customer, note)
@@ -1,8 +1,11 @@
+from decimal import Decimal
+
 from IPC.Base import Base
 from IPC.Config import Config
 from IPC.Defines import Defines
 from IPC.Helper import Helper
-from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
+from IPC.Response import Response
 
 
 class Refund(Base):
@@ -10,6 +13,13 @@ class Refund(Base):
  * Process IPC method: IPCRefund.
  * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCRefund', (
+        ParamSchema.field('Currency', 'getCurrency', error='Invalid Currency'),
+        ParamSchema.field('Amount', 'getAmount', Helper.isValidAmount, 'Invalid Amount'),
+        ParamSchema.field('OrderID', 'getOrderID', Helper.isValidOrderId, 'Invalid OrderId'),
+        ParamSchema.field('IPC_Trnref', 'getTrnref', Helper.isValidTrnRef, 'Invalid TrnRef'),
+        ParamSchema.field('OutputFormat', 'getOutputFormat', Helper.isValidOutputFormat, 'Invalid Output format'),
+    ))
     __currency = 'EUR'
     __orderID: str
     __trnref = None
@@ -55,29 +65,27 @@ class Refund(Base):
     * @return boolean
     * @raises IPC_Exception
         """
-        self.validate()
-
-        self._addPostParam('IPCmethod', 'IPCRefund')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
+        return self.__isSuccessful(self._process())
 
-        self._addPostParam('Currency', self.getCurrency())
-        self._addPostParam('Amount', self.getAmount())
-
-        self._addPostParam('OrderID', self.getOrderID())
-        self._addPostParam('IPC_Trnref', self.getTrnref())
-        self._addPostParam('OutputFormat', self.getOutputFormat())
+    async def process_async(self):
+        """
+    * Asyncio counterpart of process()\n
+    * @return boolean
+    * @raises IPC_Exception
+        """
+        return self.__isSuccessful(await super().process_async())
 
-        response = self._processPost().getData(str.lower)
+    def __isSuccessful(self, response: Response):
+        """
+    * Check refund response against requested amount and currency\n
+    * @param response: Response\n
+    * @return boolean
+        """
         if (
-            not response.get('ipc_trnref')
-            or (not response['amount'] or response['amount'] != self.getAmount())
-            or (not response['currency'] or response['currency'] != self.getCurrency())
-            or response['status'] != Defines.STATUS_SUCCESS
+            not response.getTrnref()
+            or response.getAmount() != Decimal(str(self.getAmount()))
+            or (not response.getCurrency() or response.getCurrency() != self.getCurrency())
+            or response.getStatusCode() != Defines.STATUS_SUCCESS
         ):
             return False
 
@@ -89,25 +97,7 @@ class Refund(Base):
     * @return boolean
     * @raises IPC_Exception
         """
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
-
-        if self.getAmount() == None or not Helper.isValidAmount(self.getAmount()):
-            raise IPC_Exception('Invalid Amount')
-
-        if self.getCurrency() == None:
-            raise IPC_Exception('Invalid Currency')
-
-        if self.getTrnref() == None or not Helper.isValidTrnRef(self.getTrnref()):
-            raise IPC_Exception('Invalid TrnRef')
-
-        if self.getOrderID() == None or not Helper.isValidOrderId(self.getOrderID()):
-            raise IPC_Exception('Invalid OrderId')
-
-        if self.getOutputFormat() == None or not Helper.isValidOutputFormat(self.getOutputFormat()):
-            raise IPC_Exception('Invalid Output format')
+        self._schema.validate(self)
 
         return True
 
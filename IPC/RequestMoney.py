@@ -1,7 +1,7 @@
 from IPC.Base import Base
 from IPC.Config import Config
 from IPC.Helper import Helper
-from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
 class RequestMoney(Base):
@@ -9,6 +9,16 @@ class RequestMoney(Base):
  * Process IPC method: IPCRequestMoney.
  * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCRequestMoney', (
+        ParamSchema.field('Currency', 'getCurrency', error='Invalid Currency'),
+        ParamSchema.field('Amount', 'getAmount', Helper.isValidAmount, 'Invalid Amount'),
+        ParamSchema.field('OrderID', 'getOrderID', Helper.isValidOrderId, 'Invalid OrderId'),
+        ParamSchema.field('MandateReference', 'getMandateReference'),
+        ParamSchema.field('CustomerWalletNumber', 'getCustomerWalletNumber'),
+        ParamSchema.field('ReversalIndicator', lambda request: int(request.getReversalIndicator() | False)),
+        ParamSchema.field('Reason', 'getReason'),
+        ParamSchema.field('OutputFormat', 'getOutputFormat', Helper.isValidOutputFormat, 'Invalid Output format'),
+    ))
     __currency = 'EUR'
     __mandateReference: str
     __customerWalletNumber: str
@@ -74,28 +84,7 @@ class RequestMoney(Base):
     * @return Response
     * @raises IPC_Exception
         """
-        self.validate()
-
-        self._addPostParam('IPCmethod', 'IPCRequestMoney')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
-
-        self._addPostParam('Currency', self.getCurrency())
-        self._addPostParam('Amount', self.getAmount())
-
-        self._addPostParam('OrderID', self.getOrderID())
-        self._addPostParam('MandateReference', self.getMandateReference())
-
-        self._addPostParam('CustomerWalletNumber', self.getCustomerWalletNumber())
-        self._addPostParam('ReversalIndicator', int(self.getReversalIndicator() | False))
-        self._addPostParam('Reason', self.getReason())
-        self._addPostParam('OutputFormat', self.getOutputFormat())
-
-        return self._processPost()
+        return self._process()
 
     def validate(self):
         """
@@ -103,22 +92,7 @@ class RequestMoney(Base):
     * @return boolean
     * @raises IPC_Exception
         """
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
-
-        if self.getAmount() == None or not Helper.isValidAmount(self.getAmount()):
-            raise IPC_Exception('Invalid Amount')
-
-        if self.getCurrency() == None:
-            raise IPC_Exception('Invalid Currency')
-
-        if self.getOrderID() == None or not Helper.isValidOrderId(self.getOrderID()):
-            raise IPC_Exception('Invalid OrderId')
-
-        if self.getOutputFormat() == None or not Helper.isValidOutputFormat(self.getOutputFormat()):
-            raise IPC_Exception('Invalid Output format')
+        self._schema.validate(self)
 
         return True
 
@@ -1,14 +1,17 @@
 import base64
-import json
+import time
+from decimal import Decimal, InvalidOperation
 from typing import Dict
 
-import xmltodict
-
 from IPC import Crypto
 from IPC.Defines import Defines
 from IPC.Config import Config
 from IPC.Helper import Helper
 from IPC.IPC_Exception import IPC_Exception
+from IPC.IPC_GeneralErrorException import IPC_GeneralErrorException
+from IPC.IPC_SignatureException import IPC_SignatureException
+from IPC.ResponseDecoder import ResponseDecoder
+from IPC.Tracer import Tracer
 
 
 class Response(object):
@@ -19,25 +22,40 @@ class Response(object):
     __raw_data = None
     __format = None
     __data: Dict[str, str]
-    __signature: str
+    __signature = None
+    """
+    * @var list Values covered by signature, in document order
+    """
+    __signValues = None
+    """
+    * @var dict Key case function => data with changed key case, built once and used by getters
+    """
+    __cased = None
+    """
+    * @var dict Lower-case param name => value converted by typed accessor
+    """
+    __typed = None
 
-    def __init__(self, cnf: Config, raw_data, format):
+    def __init__(self, cnf: Config, raw_data, format, stages = None):
         """
     * @param cnf: Config
     * @param string|array raw_data
-    * @param string format COMMUNICATION_FORMAT_JSON|COMMUNICATION_FORMAT_XML|COMMUNICATION_FORMAT_POST\n
+    * @param string format COMMUNICATION_FORMAT_JSON|COMMUNICATION_FORMAT_XML|COMMUNICATION_FORMAT_POST
+    * @param list stages Optional, Trace.getStages() list to append parse and verify timings to\n
     * @raises IPC_Exception
         """
         self.__cnf = cnf
-        self.__setData(raw_data, format)
+        self.__setData(raw_data, format, stages)
 
-    def __setData(self, raw_data, format):
+    def __setData(self, raw_data, format, stages = None):
         """
     * @param raw_data
-    * @param format\n
+    * @param format
+    * @param list stages\n
     * @return self
     * @raises IPC_Exception
         """
+        start = time.perf_counter_ns()
         if not bool(raw_data):
             raise IPC_Exception('Invalid Response data')
 
@@ -45,67 +63,76 @@ class Response(object):
         self.__raw_data = raw_data
 
         if format == Defines.COMMUNICATION_FORMAT_JSON:
-            self.__data = Dict[str, str](json.loads(self.__raw_data))
+            decoded = ResponseDecoder.decodeJson(self.__raw_data)
         elif format == Defines.COMMUNICATION_FORMAT_XML:
-            self.__data = xmltodict.parse(self.__raw_data)
-            if self.__data['@attributes']:
-                del self.__data['@attributes']
+            decoded = ResponseDecoder.decodeXml(self.__raw_data)
         elif format == Defines.COMMUNICATION_FORMAT_POST:
-            self.__data = self.__raw_data
+            decoded = ResponseDecoder.decodePost(self.__raw_data)
         else:
             raise IPC_Exception('Invalid response format!')
 
+        self.__data, self.__signValues, self.__signature = decoded
+        self.__cased = {}
+        self.__typed = {}
+
         if not bool(self.__data):
             raise IPC_Exception('No IPC Response!')
 
-        self.__extractSignature()
-
-        if not bool(self.__signature) and ('Status' in self.__data) and self.__data['Status'] == Defines.STATUS_IPC_ERROR:
-            raise IPC_Exception('IPC Response - General Error!')
+        if not bool(self.__signature) and str(self.__data.get('Status')) == str(Defines.STATUS_IPC_ERROR):
+            raise IPC_GeneralErrorException('IPC Response - General Error!')
 
+        parsed = time.perf_counter_ns()
         self.__verifySignature()
+        if stages is not None:
+            stages.append((Tracer.STAGE_PARSE, start, parsed))
+            stages.append((Tracer.STAGE_VERIFY, parsed, time.perf_counter_ns()))
 
         return self
 
-    def __extractSignature(self):
-        # TODO: select one of (list, dict)
-        if bool(self.__data) and isinstance(self.__data, (list, dict)):
-            for k, v in self.__data:
-                if k.lower() == '__signature':
-                    self.__signature = v
-                    del self.__data[k]
-
-        return True
-
     def __verifySignature(self):
         """
+    * @raises IPC_SignatureException if signature is missing, malformed or does not match
     * @raises IPC_Exception
         """
         if not bool(self.__signature):
-            raise IPC_Exception('Missing request signature!')
+            raise IPC_SignatureException('Missing request signature!')
 
         if not self.__cnf:
             raise IPC_Exception('Missing config object!')
 
-        pubKey = self.__cnf.getAPIPublicKey()
-        if not Crypto.verify(self.__getSignData(), base64.b64decode(self.__signature), pubKey, Defines.SIGNATURE_ALGO):
-            raise IPC_Exception('Signature check failed!')
+        pubKey = self.__cnf.getAPIPublicKeyObject()
+        signData = self.__getSignData()
+        cache = self.__cnf.getSignatureCache()
+        if cache is not None and cache.isVerified(signData, self.__signature, pubKey):
+            return
+
+        try:
+            signature = base64.b64decode(self.__signature, validate=True)
+        except (ValueError, TypeError):
+            # binascii.Error of malformed base64 is a ValueError
+            raise IPC_SignatureException('Signature check failed!')
+        if not Crypto.verify(signData, signature, pubKey, Defines.SIGNATURE_ALGO):
+            raise IPC_SignatureException('Signature check failed!')
+
+        if cache is not None:
+            cache.add(signData, self.__signature, pubKey)
 
     def __getSignData(self):
-        return base64.b64encode('-'.join(list(Helper.getValuesFromMultiDimensionalArray(self.__data))).encode('utf-8'))
+        return base64.b64encode('-'.join(self.__signValues).encode('utf-8'))
 
 
     @staticmethod
-    def getInstance(cnf: Config, raw_data, format: str):
+    def getInstance(cnf: Config, raw_data, format: str, stages = None):
         """
     * Static class to create Response object\n
     * @param cnf: Config
     * @param string|array raw_data
-    * @param string format\n
+    * @param string format
+    * @param list stages Optional, Trace.getStages() list to append parse and verify timings to\n
     * @return Response
     * @raises IPC_Exception
         """
-        return Response(cnf, raw_data, format)
+        return Response(cnf, raw_data, format, stages)
 
     def isSignatureCorrect(self):
         """
@@ -130,11 +157,19 @@ class Response(object):
 
     def getStatus(self):
         """
-    * Request param: Status\n
-    * @return int
+    * Request param: Status as sent by IPC, use getStatusCode() to compare with Defines.STATUS_* constants\n
+    * @return string|int
     * @raises IPC_Exception
         """
-        return Helper.getArrayVal(self.getData(str.lower), 'status')
+        return Helper.getArrayVal(self.__getCased(str.lower), 'status')
+
+    def getStatusCode(self):
+        """
+    * Request param: Status converted to int, to be compared with Defines.STATUS_* constants\n
+    * @return int None if Status is missing
+    * @raises IPC_Exception if Status is not a number
+        """
+        return self.__getTyped('status', int)
 
     def getData(self, case = None):
         """
@@ -144,16 +179,28 @@ class Response(object):
     * @raises IPC_Exception
         """
         if case != None:
+            return dict(self.__getCased(case))
+
+        return self.__data
+
+    def __getCased(self, case):
+        """
+    * Data with changed key case, built once per Response. Not to be modified, getData(case) returns a copy\n
+    * @param function case str.lower|str.upper\n
+    * @return dict
+    * @raises IPC_Exception
+        """
+        cased = self.__cased.get(case)
+        if cased is None:
             if (not case in [
                 str.lower,
                 str.upper,
             ]):
                 raise IPC_Exception('Invalid Key Case!')
 
-            return dict((case(k), v) for k, v in self.__data)
-            # array_change_key_case(self.__data, case)
+            cased = self.__cased[case] = dict((case(k), v) for k, v in self.__data.items())
 
-        return self.__data
+        return cased
 
     def getStatusMsg(self):
         """
@@ -161,7 +208,78 @@ class Response(object):
     * @return string
     * @raises IPC_Exception
         """
-        return Helper.getArrayVal(self.getData(str.lower), 'statusmsg')
+        return self.__getCased(str.lower).get('statusmsg')
+
+    def getAmount(self):
+        """
+    * Request param: Amount, exact for comparing with requested amount\n
+    * @return Decimal
+    * @raises IPC_Exception
+        """
+        return self.__getTyped('amount', self.__toDecimal)
+
+    def getCurrency(self):
+        """
+    * Request param: Currency\n
+    * @return string
+        """
+        return self.__getTyped('currency', str)
+
+    def getTrnref(self):
+        """
+    * Request param: IPC_Trnref\n
+    * @return string
+        """
+        return self.__getTyped('ipc_trnref', str)
+
+    def getOrderID(self):
+        """
+    * Request param: OrderID\n
+    * @return string
+        """
+        return self.__getTyped('orderid', str)
+
+    def get(self, name: str, default = None):
+        """
+    * Response param by case-insensitive name\n
+    * @param string name
+    * @param mixed default\n
+    * @return mixed
+        """
+        return self.__getCased(str.lower).get(name.lower(), default)
+
+    def __getTyped(self, name: str, convert):
+        """
+    * Response param converted once per Response\n
+    * @param string name Lower-case param name
+    * @param function convert\n
+    * @return mixed None if param is missing or empty
+    * @raises IPC_Exception
+        """
+        try:
+            return self.__typed[name]
+        except KeyError:
+            pass
+
+        value = self.__getCased(str.lower).get(name)
+        if value is None or value == '':
+            value = None
+        else:
+            try:
+                value = convert(value)
+            except (TypeError, ValueError, InvalidOperation):
+                raise IPC_Exception(f'Invalid response param {name}')
+        self.__typed[name] = value
+
+        return value
+
+    @staticmethod
+    def __toDecimal(value):
+        """
+    * @param string|int|float value JSON numbers are converted by their shortest repr\n
+    * @return Decimal
+        """
+        return Decimal(value if isinstance(value, str) else str(value))
 
     def getDataRaw(self):
         """
@@ -0,0 +1,149 @@
+import json
+from xml.parsers import expat
+
+from IPC.IPC_Exception import IPC_Exception
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ResponseDecoder(object):
+    """
+ * Decodes IPC API responses into dict and collects values covered by the response signature.
+ * Sign values are the leaf values in document order without the top-level Signature.
+ * XML is decoded in a single pass over expat events, JSON is parsed by orjson when installed
+ * and its values are collected in one non-recursive walk
+    """
+
+    @staticmethod
+    def decodeJson(raw):
+        """
+    * @param string|bytes raw\n
+    * @return tuple (dict data, list sign values, string|None signature)
+    * @raises IPC_Exception
+        """
+        try:
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError as ex:
+            raise IPC_Exception(f'Invalid JSON response: {ex}')
+        if not isinstance(data, dict):
+            raise IPC_Exception('Invalid JSON response')
+
+        return ResponseDecoder.__collect(data)
+
+    @staticmethod
+    def decodePost(data: dict):
+        """
+    * Decode already parsed POST params, e.g. notify request. Given dict is not modified\n
+    * @param dict data\n
+    * @return tuple (dict data, list sign values, string|None signature)
+        """
+        return ResponseDecoder.__collect(dict(data))
+
+    @staticmethod
+    def __collect(data: dict):
+        """
+    * Detach top-level Signature and collect leaf values in document order\n
+    * @param dict data\n
+    * @return tuple (dict data, list sign values, string|None signature)
+        """
+        signature = None
+        for k in data:
+            if k.lower() == 'signature':
+                signature = data.pop(k)
+                break
+
+        values = []
+        append = values.append
+        stack = [iter(data.values())]
+        while stack:
+            for v in stack[-1]:
+                if v.__class__ is str:
+                    append(v)
+                elif isinstance(v, dict):
+                    stack.append(iter(v.values()))
+                    break
+                elif isinstance(v, list):
+                    stack.append(iter(v))
+                    break
+                else:
+                    append('' if v is None else str(v))
+            else:
+                stack.pop()
+
+        return data, values, signature
+
+    @staticmethod
+    def decodeXml(raw):
+        """
+    * Output has the shape of xmltodict.parse() for the root element content: repeated elements become lists,
+    * empty elements become None, attributes become '@name' keys and text next to attributes or child elements
+    * becomes '#text'. Text is stripped of surrounding whitespace. The root element is unwrapped and its attributes
+    * are dropped, so Status and Signature are top-level params as in JSON responses\n
+    * @param string|bytes raw\n
+    * @return tuple (dict data, list sign values, string|None signature)
+    * @raises IPC_Exception
+        """
+        values = []
+        signature = None
+        # frame: [dict of attributes and child elements or None for plain leaf, list of text parts]
+        stack = []
+        frame = [{}, None]
+
+        def start(name, attrs):
+            nonlocal frame
+            stack.append(frame)
+            item = None
+            if attrs and len(stack) > 1:
+                item = {}
+                for k, v in attrs.items():
+                    item['@' + k] = v
+                    values.append(v)
+            frame = [item, []]
+
+        def end(name):
+            nonlocal frame, signature
+            item, text = frame
+            frame = stack.pop()
+            text = ''.join(text).strip() if text else ''
+            if item is None:
+                value = text or None
+                if len(stack) == 1 and name.lower() == 'signature':
+                    signature = value
+                    return
+                values.append(text)
+            else:
+                if text:
+                    item['#text'] = text
+                    values.append(text)
+                value = item
+            parent = frame[0]
+            if parent is None:
+                parent = frame[0] = {}
+            if name in parent:
+                old = parent[name]
+                if old.__class__ is list:
+                    old.append(value)
+                else:
+                    parent[name] = [old, value]
+            else:
+                parent[name] = value
+
+        def chars(data):
+            frame[1].append(data)
+
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = chars
+        try:
+            parser.Parse(raw, True)
+        except expat.ExpatError as ex:
+            raise IPC_Exception(f'Invalid XML response: {ex}')
+
+        root = next(iter(frame[0].values()), None)
+
+        return (root if isinstance(root, dict) else {}), values, signature
@@ -1,7 +1,7 @@
-from IPC.Config import Config
 from IPC.Base import Base
+from IPC.Config import Config
 from IPC.Helper import Helper
-from IPC.IPC_Exception import IPC_Exception
+from IPC.ParamSchema import ParamSchema
 
 
 class Reversal(Base):
@@ -9,6 +9,10 @@ class Reversal(Base):
  * Process IPC method: IPCReversal.
  * Collect, validate and send API params
     """
+    _schema = ParamSchema('IPCReversal', (
+        ParamSchema.field('IPC_Trnref', 'getTrnref', Helper.isValidTrnRef, 'Invalid TrnRef'),
+        ParamSchema.field('OutputFormat', 'getOutputFormat', Helper.isValidOutputFormat, 'Invalid Output format'),
+    ))
     __trnref: str
 
     def __init__(self, cnf: Config):
@@ -26,19 +30,7 @@ class Reversal(Base):
      * @return Response
      * @raises IPC_Exception
         """
-        self.validate()
-
-        self._addPostParam('IPCmethod', 'IPCReversal')
-        self._addPostParam('IPCVersion', self._getCnf().getVersion())
-        self._addPostParam('IPCLanguage', self._getCnf().getLang())
-        self._addPostParam('SID', self._getCnf().getSid())
-        self._addPostParam('WalletNumber', self._getCnf().getWallet())
-        self._addPostParam('KeyIndex', self._getCnf().getKeyIndex())
-        self._addPostParam('Source', self._getCnf().getSource())
-        self._addPostParam('IPC_Trnref', self.getTrnref())
-        self._addPostParam('OutputFormat', self.getOutputFormat())
-
-        return self._processPost()
+        return self._process()
 
     def validate(self):
         """
@@ -47,16 +39,7 @@ class Reversal(Base):
      * @return boolean
      * @raises IPC_Exception
         """
-        try:
-            self._getCnf().validate()
-        except Exception as ex:
-            raise IPC_Exception(f'Invalid Config details: {ex}')
-
-        if self.getTrnref() == None or not Helper.isValidTrnRef(self.getTrnref()):
-            raise IPC_Exception('Invalid TrnRef')
-
-        if self.getOutputFormat() == None or not Helper.isValidOutputFormat(self.getOutputFormat()):
-            raise IPC_Exception('Invalid Output format')
+        self._schema.validate(self)
 
         return True
 
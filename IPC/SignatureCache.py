@@ -0,0 +1,134 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class SignatureCache(object):
+    """
+ * Bounded LRU cache of successful signature verifications with TTL.
+ * Lets replayed IPC notifications skip the RSA verify of an already verified payload.
+ * Entries are keyed by SHA-256 of (key, signature, sign data), so every entry has the same small size.
+ * Eviction is automatic: add() drops expired entries from the least recently used end and then the least recently
+ * used ones above max size, so memory stays bounded by max size. trim() only releases memory earlier
+    """
+    __maxSize: int
+    __ttl: float
+    __hits = 0
+    __misses = 0
+
+    def __init__(self, maxSize = 10000, ttl = 300.0):
+        """
+    * @param int maxSize Max count of cached verifications
+    * @param float ttl Seconds a verification is cached
+        """
+        self.__maxSize = maxSize
+        self.__ttl = ttl
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __getKey(signData: bytes, signature, pubKey):
+        """
+    * @param bytes signData
+    * @param string|bytes signature Signature in base64 format
+    * @param RsaKey pubKey\n
+    * @return bytes
+        """
+        if isinstance(signature, str):
+            signature = signature.encode('ascii')
+        h = hashlib.sha256()
+        for number in (pubKey.n, pubKey.e):
+            h.update(number.to_bytes((number.bit_length() + 7) // 8, 'big'))
+            h.update(b'\0')
+        h.update(signature)
+        h.update(b'\0')
+        h.update(signData)
+
+        return h.digest()
+
+    def isVerified(self, signData: bytes, signature, pubKey):
+        """
+    * Check if the same payload was already verified with the same key\n
+    * @param bytes signData
+    * @param string|bytes signature Signature in base64 format
+    * @param RsaKey pubKey\n
+    * @return boolean
+        """
+        key = self.__getKey(signData, signature, pubKey)
+        now = time.monotonic()
+        with self.__lock:
+            expires = self.__entries.get(key)
+            if expires is not None and expires > now:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return True
+            if expires is not None:
+                del self.__entries[key]
+            self.__misses += 1
+
+        return False
+
+    def add(self, signData: bytes, signature, pubKey):
+        """
+    * Remember successfully verified payload\n
+    * @param bytes signData
+    * @param string|bytes signature Signature in base64 format
+    * @param RsaKey pubKey
+        """
+        key = self.__getKey(signData, signature, pubKey)
+        now = time.monotonic()
+        with self.__lock:
+            entries = self.__entries
+            entries[key] = now + self.__ttl
+            entries.move_to_end(key)
+            while True:
+                oldest = next(iter(entries))
+                if oldest == key or entries[oldest] > now:
+                    break
+                del entries[oldest]
+            while len(entries) > self.__maxSize:
+                entries.popitem(last=False)
+
+    def trim(self, size = None):
+        """
+    * Drop expired entries and shrink the cache to given size, least recently used first.
+    * Call it to release memory, e.g. from a memory pressure handler\n
+    * @param int size Default is half of max size
+        """
+        if size is None:
+            size = self.__maxSize // 2
+        now = time.monotonic()
+        with self.__lock:
+            for key in [k for k, expires in self.__entries.items() if expires <= now]:
+                del self.__entries[key]
+            while len(self.__entries) > size:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        """
+    * Drop all entries and reset counters
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    def getHits(self):
+        """
+    * @return int
+        """
+        return self.__hits
+
+    def getMisses(self):
+        """
+    * @return int
+        """
+        return self.__misses
+
+    def getStats(self):
+        """
+    * @return dict hits, misses and current size
+        """
+        with self.__lock:
+            return {'hits': self.__hits, 'misses': self.__misses, 'size': len(self.__entries)}
@@ -0,0 +1,37 @@
+from IPC import Crypto
+
+
+class Signer(object):
+    """
+ * Signs request digests in the current process.
+ * Base class for signers set with Config.setSigner(). Signers hold no key of their own,
+ * every call gets the current Config private key, so a later Config.setPrivateKey() is always used
+    """
+
+    def sign(self, digest, privateKey):
+        """
+    * @param digest Hash object of request sign data
+    * @param RsaKey privateKey Store RSA key\n
+    * @return bytes signature
+        """
+        return Crypto.signDigest(digest, privateKey)
+
+    def signMany(self, digests, privateKey):
+        """
+    * @param list digests Hash objects of request sign data
+    * @param RsaKey privateKey Store RSA key\n
+    * @return list signatures in input order
+        """
+        return [self.sign(digest, privateKey) for digest in digests]
+
+    def close(self):
+        """
+    * Release signer resources
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
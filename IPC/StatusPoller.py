@@ -0,0 +1,79 @@
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from IPC.Config import Config
+from IPC.Defines import Defines
+from IPC.IPC_Exception import IPC_Exception
+
+
+class StatusPoller(object):
+    """
+ * Bulk status checks for many OrderIDs.
+ * Fans requests out over a bounded worker pool and streams results back as they complete
+    """
+    __cnf: Config
+    __concurrency: int
+    __retries: int
+    __backoff: float
+
+    def __init__(self, requestClass, cnf: Config, concurrency = None, retries = 3, backoff = 0.5, outputFormat = None):
+        """
+    * @param type requestClass GetTxnStatus|GetPaymentStatus|PreAuthorizationStatus
+    * @param cnf: Config
+    * @param int concurrency Max count of requests in flight, default is Config connection pool size
+    * @param int retries Max count of retries per OrderID on STATUS_IPC_ERROR or failed request
+    * @param float backoff Seconds before first retry, doubled on each next retry
+    * @param string outputFormat COMMUNICATION_FORMAT_JSON|COMMUNICATION_FORMAT_XML
+        """
+        if concurrency is None:
+            concurrency = cnf.getConnectionPoolSize()
+        if concurrency < 1:
+            raise IPC_Exception('Invalid concurrency')
+        self.__requestClass = requestClass
+        self.__cnf = cnf
+        self.__concurrency = concurrency
+        self.__retries = retries
+        self.__backoff = backoff
+        self.__outputFormat = outputFormat
+
+    def poll(self, orderIDs):
+        """
+    * Request status of every OrderID, results are yielded in completion order.
+    * Result is the Response object or IPC_Exception of the last failed attempt\n
+    * @param iterable orderIDs\n
+    * @return generator of tuple (string orderID, Response|IPC_Exception result)
+        """
+        orderIDs = iter(orderIDs)
+        with ThreadPoolExecutor(max_workers=self.__concurrency) as executor:
+            pending = set(executor.submit(self.__fetch, orderID) for orderID in itertools.islice(orderIDs, self.__concurrency))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for orderID in itertools.islice(orderIDs, 1):
+                        pending.add(executor.submit(self.__fetch, orderID))
+                    yield future.result()
+
+    def __fetch(self, orderID: str):
+        """
+    * Request status of single OrderID with retry and exponential backoff\n
+    * @param string orderID\n
+    * @return tuple (string orderID, Response|IPC_Exception result)
+        """
+        attempt = 0
+        while True:
+            req = self.__requestClass(self.__cnf)
+            req.setOrderID(orderID)
+            if self.__outputFormat is not None:
+                req.setOutputFormat(self.__outputFormat)
+            try:
+                result = req.process()
+                if result.getStatusCode() != Defines.STATUS_IPC_ERROR:
+                    return orderID, result
+            except IPC_Exception as ex:
+                result = ex
+
+            if attempt >= self.__retries:
+                return orderID, result
+            time.sleep(self.__backoff * (2 ** attempt))
+            attempt += 1
@@ -0,0 +1,123 @@
+import time
+
+
+class Trace(object):
+    """
+ * Timings of one API request, passed to Tracer.finish().
+ * Times are time.perf_counter_ns() values, stages are in the order they ran.
+ * A stage repeated on retry over a new connection is recorded again
+    """
+    __method = None
+    __status = None
+    __error = None
+    __end = None
+    __outputFormat: str
+    __start: int
+    __stages: list
+
+    def __init__(self, outputFormat: str, start = None):
+        """
+    * @param string outputFormat
+    * @param int start Request start, default is now
+        """
+        self.__outputFormat = outputFormat
+        self.__start = time.perf_counter_ns() if start is None else start
+        self.__stages = []
+
+    def addStage(self, stage: str, start: int, end: int):
+        """
+    * @param string stage Tracer.STAGE_*
+    * @param int start
+    * @param int end
+        """
+        self.__stages.append((stage, start, end))
+
+    def getStages(self):
+        """
+    * Stages as list of tuples (string stage, int start, int end).
+    * Connection pools append to the same list\n
+    * @return list
+        """
+        return self.__stages
+
+    def getMethod(self):
+        """
+    * @return string IPCmethod, None if request failed before params were collected
+        """
+        return self.__method
+
+    def setMethod(self, method: str):
+        """
+    * @param string method
+        """
+        self.__method = method
+
+    def getOutputFormat(self):
+        """
+    * @return string
+        """
+        return self.__outputFormat
+
+    def getStatus(self):
+        """
+    * @return int Response Status, None if request failed
+        """
+        return self.__status
+
+    def setStatus(self, status):
+        """
+    * @param int status
+        """
+        self.__status = status
+
+    def getError(self):
+        """
+    * @return Exception Error of failed request, None if response was received
+        """
+        return self.__error
+
+    def setError(self, error: Exception):
+        """
+    * @param Exception error
+        """
+        self.__error = error
+
+    def getStart(self):
+        """
+    * @return int
+        """
+        return self.__start
+
+    def getEnd(self):
+        """
+    * @return int None until request is finished
+        """
+        return self.__end
+
+    def finish(self, end = None):
+        """
+    * @param int end Request end, default is now
+        """
+        self.__end = time.perf_counter_ns() if end is None else end
+
+    def getDuration(self):
+        """
+    * @return float Seconds
+        """
+        return (self.__end - self.__start) / 1e9
+
+    def getAttributes(self):
+        """
+    * Tags of the request, named as OpenTelemetry attributes\n
+    * @return dict
+        """
+        attributes = {
+            'ipc.method': self.__method or '',
+            'ipc.output_format': self.__outputFormat or '',
+        }
+        if self.__status is not None:
+            attributes['ipc.status'] = self.__status
+        if self.__error is not None:
+            attributes['error.type'] = type(self.__error).__name__
+
+        return attributes
@@ -0,0 +1,41 @@
+class Tracer(object):
+    """
+ * Receives stage timings of API requests. Base class for tracers set with Config.setTracer().
+ * finish() is called once per request, when response is verified or request failed,
+ * from the thread that made the request. Requests are timed the same way without tracer set,
+ * their timings are passed to an instance of this no-op base class
+    """
+    """
+    * Validate details and collect API params
+    """
+    STAGE_PREPARE = 'prepare'
+    """
+    * Sign API params
+    """
+    STAGE_SIGN = 'sign'
+    """
+    * Take pooled connection, or open new one including TLS handshake
+    """
+    STAGE_CONNECT = 'connect'
+    """
+    * Write request head and body to connection
+    """
+    STAGE_SEND = 'send'
+    """
+    * Wait for and read HTTP response
+    """
+    STAGE_RECEIVE = 'receive'
+    """
+    * Decode response body
+    """
+    STAGE_PARSE = 'parse'
+    """
+    * Verify response signature
+    """
+    STAGE_VERIFY = 'verify'
+
+    def finish(self, trace):
+        """
+    * @param Trace trace Timings of finished request
+        """
+        pass
@@ -1,32 +1,87 @@
-from .AuthorizationReverse import AuthorizationReverse
-from .Cart import Cart
-from .Defines import Defines
-from .IAPreAuthorization import IAPreAuthorization
-from .IPC_Exception import IPC_Exception
-from .PreAuthorizationCancellation import PreAuthorizationCancellation
-from .PurchaseByIcard import PurchaseByIcard
-from .Reversal import Reversal
-from .Authorization import Authorization
-from .Base import Base
-from .Config import Config
-from .GetPaymentStatus import GetPaymentStatus
-from .IAPurchase import IAPurchase
-from .IPCGetTxnLog import IPCGetTxnLog
-from .PreAuthorizationCompletion import PreAuthorizationCompletion
-from .Refund import Refund
-from .AuthorizationCapture import AuthorizationCapture
-from .Card import Card
-# from .Crypto import Crypto
-from .GetTxnStatus import GetTxnStatus
-from .IAStoreCard import IAStoreCard
-from .MandateManagement import MandateManagement
-from .PreAuthorizationStatus import PreAuthorizationStatus
-from .RequestMoney import RequestMoney
-from .AuthorizationList import AuthorizationList
-from .CardStore import CardStore
-from .Customer import Customer
-from .Helper import Helper
-from .IAStoredCardUpdate import IAStoredCardUpdate
-from .PreAuthorization import PreAuthorization
-from .Purchase import Purchase
-from .Response import Response
+"""
+ * myPOS Checkout API SDK.
+ * Classes are imported from their modules on first access (PEP 562), so importing the package
+ * loads only the modules a worker uses
+"""
+import importlib
+import sys
+import types
+
+"""
+ * Exported classes, each is defined in the module of the same name
+"""
+__all__ = [
+    'AsyncConnectionPool',
+    'Authorization',
+    'AuthorizationCapture',
+    'AuthorizationList',
+    'AuthorizationReverse',
+    'Base',
+    'Card',
+    'CardMigration',
+    'CardStore',
+    'Cart',
+    'Config',
+    'ConnectionPool',
+    'Customer',
+    'Defines',
+    'FormRequest',
+    'GetPaymentStatus',
+    'GetTxnStatus',
+    'Helper',
+    'IAPreAuthorization',
+    'IAPurchase',
+    'IAStoreCard',
+    'IAStoredCardUpdate',
+    'IPCGetTxnLog',
+    'IPC_ConnectionException',
+    'IPC_Exception',
+    'IPC_GeneralErrorException',
+    'IPC_SignatureException',
+    'MandateManagement',
+    'MetricsRegistry',
+    'NotifyReceiver',
+    'OpenTelemetryTracer',
+    'PreAuthorization',
+    'PreAuthorizationCancellation',
+    'PreAuthorizationCompletion',
+    'PreAuthorizationStatus',
+    'ProcessPoolSigner',
+    'Purchase',
+    'PurchaseByIcard',
+    'PurchaseTemplate',
+    'Refund',
+    'RequestMoney',
+    'Response',
+    'Reversal',
+    'SignatureCache',
+    'Signer',
+    'StatusPoller',
+    'Trace',
+    'Tracer',
+]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    return getattr(importlib.import_module(f'{__name__}.{name}'), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(types.ModuleType):
+    """
+ * Importing submodule IPC.X binds the module as package attribute X.
+ * Bind exported class X instead, so "from IPC import X" keeps returning the class
+    """
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and name in __all__ and value.__name__ == f'{__name__}.{name}':
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,56 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import argparse
+import random
+import tempfile
+import time
+
+from IPC.CardMigration import CardMigration
+from IPC.Config import Config
+from IPC.Helper import Helper
+
+from mock_server import MockServer
+
+# Cards stored per second by CardMigration against MockServer with simulated API latency,
+# for several concurrency levels. Concurrency 1 is the same as calling IAStoreCard.process() in a loop.
+
+
+def cards(count: int, seed = 1):
+    rnd = random.Random(seed)
+    year = str(time.localtime().tm_year + 2)
+    for i in range(count):
+        body = str(rnd.randrange(10 ** 14, 10 ** 15))
+        number = next(body + check for check in '0123456789' if Helper.isValidCardNumber(body + check))
+        yield {'reference': f'card-{i}', 'cardNumber': number, 'cardHolder': 'John Smith', 'expMM': '12', 'expYY': year,
+               'cvc': '123', 'cardType': '1'}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=500)
+    parser.add_argument('--latency', type=float, default=0.02, help='Seconds of simulated API latency')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    args = parser.parse_args()
+
+    with MockServer() as server, tempfile.TemporaryDirectory() as directory:
+        server.setLatency(args.latency)
+        print(f'{args.count} cards, {args.latency * 1000:.0f} ms API latency')
+        print(f'{"concurrency":>11} {"seconds":>9} {"cards/s":>9} {"stored":>7}')
+        for concurrency in args.concurrency:
+            cnf = Config()
+            cnf.setPrivateKeyPath(pt + '/keys/test.store_private_key.pem')
+            cnf.setEncryptPublicKeyPath(pt + '/keys/test.encrypt_key.pem')
+            cnf.setLang('EN')
+            cnf.setSid('000000000000010')
+            cnf.setWallet('61938166610')
+            cnf.setKeyIndex(1)
+            cnf.setConnectionPoolSize(concurrency)
+            server.configure(cnf)
+
+            migration = CardMigration(cnf, f'{directory}/journal-{concurrency}.jsonl', concurrency=concurrency)
+            start = time.perf_counter()
+            stats = migration.migrate(cards(args.count))
+            elapsed = time.perf_counter() - start
+            print(f'{concurrency:>11} {elapsed:>9.2f} {args.count / elapsed:>9.1f} {stats[CardMigration.RESULT_STORED]:>7}')
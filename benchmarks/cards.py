@@ -0,0 +1,95 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import argparse
+import importlib
+import random
+import time
+
+from IPC.Helper import Helper
+
+HelperModule = importlib.import_module('IPC.Helper')
+
+# Bulk validation of card numbers, CVCs and expire dates, as before storing migrated cards.
+# Compares per-card Luhn loop, as isValidCardNumber did before, with Helper.validateCards
+# with and without NumPy.
+
+
+def legacyIsValidCardNumber(cardNo: str):
+    cardNo = cardNo.strip().replace(" ", "")
+    if (not cardNo.isnumeric()) or (len(cardNo) > 19) or (len(cardNo) < 13):
+        return False
+    sum = dub = add = chk = 0
+    even = 0
+    for i in range(len(cardNo) - 1, -1, -1):
+        if even == 1:
+            dub = 2 * int(cardNo[i])
+            if dub > 9:
+                add = dub - 9
+            else:
+                add = dub
+            even = 0
+        else:
+            add = int(cardNo[i])
+            even = 1
+        sum += add
+
+    return ((sum % 10) == 0)
+
+
+def cards(count: int, seed = 1):
+    """
+    * Card numbers of 13 to 19 digits, about every tenth with wrong check digit
+    """
+    rnd = random.Random(seed)
+    unique = []
+    for i in range(min(count, 10000)):
+        body = str(rnd.randrange(10 ** 11, 10 ** 18))
+        for check in '0123456789':
+            if legacyIsValidCardNumber(body + check):
+                break
+        if i % 10 == 0:
+            check = str((int(check) + 1) % 10)
+        unique.append(body + check)
+
+    numbers = (unique * (count // len(unique) + 1))[:count]
+    cvcs = ['123'] * count
+    expDates = [('12', str(time.localtime().tm_year + 1))] * count
+
+    return numbers, cvcs, expDates
+
+
+def measure(name, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f'{name:<40} {elapsed:>9.3f} s {elapsed * 1e9 / len(result):>9.0f} ns/card')
+
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=1000000)
+    args = parser.parse_args()
+
+    numbers, cvcs, expDates = cards(args.count)
+    print(f'{args.count} cards, NumPy {"installed" if HelperModule.numpy is not None else "not installed"}')
+    expected = measure('legacy loop, numbers', lambda: [legacyIsValidCardNumber(n) for n in numbers])
+    result = measure('isValidCardNumber loop, numbers', lambda: [Helper.isValidCardNumber(n) for n in numbers])
+    assert result == expected
+
+    numpy = HelperModule.numpy
+    HelperModule.numpy = None
+    try:
+        result = measure('validateCards lookup table, numbers', lambda: Helper.validateCards(numbers))
+        assert result == expected
+        measure('validateCards lookup table, full', lambda: Helper.validateCards(numbers, cvcs, expDates))
+    finally:
+        HelperModule.numpy = numpy
+
+    if numpy is not None:
+        result = measure('validateCards NumPy, numbers', lambda: Helper.validateCards(numbers))
+        assert result == expected
+        measure('validateCards NumPy, full', lambda: Helper.validateCards(numbers, cvcs, expDates))
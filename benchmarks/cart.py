@@ -0,0 +1,52 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import timeit
+
+from IPC.Cart import Cart
+
+# Filling a cart of B2B order lines with add() and addMany(), and reading its total
+# and items as the IPC classes do when collecting params.
+
+
+def lines(count: int):
+    return [(f'Article {i}', i % 5 + 1, 9.99 + i % 10) for i in range(count)]
+
+
+def addEach(items):
+    cart = Cart()
+    for name, quantity, price in items:
+        cart.add(name, quantity, price)
+
+    return cart
+
+
+def addMany(items):
+    return Cart().addMany(items)
+
+
+def readItems(cart):
+    total = cart.getTotal()
+    for name, quantity, price, amount, delivery in cart.getItems():
+        pass
+
+    return total
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e3
+
+
+if __name__ == '__main__':
+    print('Times in milliseconds per cart')
+    print(f'{"items":>7} | {"add":>9} {"addMany":>9} {"speedup":>8} | {"total+items":>12}')
+    for count in (10, 1000, 10000):
+        items = lines(count)
+        assert addEach(items).getTotal() == addMany(items).getTotal()
+        number = max(3, 20000 // count)
+        each = bench(lambda: addEach(items), number)
+        many = bench(lambda: addMany(items), number)
+        cart = addMany(items)
+        read = bench(lambda: readItems(cart), number)
+        print(f'{count:>7} | {each:>9.3f} {many:>9.3f} {each / many:>7.2f}x | {read:>12.3f}')
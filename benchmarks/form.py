@@ -0,0 +1,78 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import timeit
+
+from IPC.FormRenderer import FormRenderer
+from IPC.Helper import Helper
+from IPC.PostParams import PostParams
+
+# Compares rendering of the auto-submit payment form by string concatenation,
+# as _processHtmlPost did before, with FormRenderer. Signing is not included.
+
+ACTION = 'https://www.mypos.eu/vmp/checkout-test'
+HEADER = [
+    ('IPCmethod', 'IPCPurchase'),
+    ('IPCVersion', '1.4'),
+    ('IPCLanguage', 'EN'),
+    ('SID', '000000000000010'),
+    ('WalletNumber', '61938166610'),
+    ('KeyIndex', '1'),
+    ('Source', 'SDK_Python'),
+    ('Currency', 'EUR'),
+    ('Amount', '123.45'),
+    ('OrderID', 'b7c0a1a4-5fd2-4c8a-9d3e-3c8b2a6f1e10'),
+    ('URL_OK', 'https://www.example.com/ok?a=1&b=2'),
+    ('URL_Cancel', 'https://www.example.com/cancel'),
+    ('URL_Notify', 'https://www.example.com/notify'),
+    ('Note', 'Some note & "more"'),
+]
+
+
+def formParams(items: int):
+    params = PostParams()
+    for k, v in HEADER:
+        params.set(k, v, Helper.escape(v))
+    params.set('CartItems', str(items), str(items))
+    for i in range(1, items + 1):
+        for k, v in ((f'Article_{i}', f'Hp Probook 6360b Sticker "{i}"'), (f'Quantity_{i}', '2'), (f'Price_{i}', '10.0'),
+                     (f'Amount_{i}', '20.0'), (f'Currency_{i}', 'EUR')):
+            params.set(k, v, Helper.escape(v))
+    signature = 'A' * 172 + '=='
+    params.set('Signature', signature, signature)
+
+    return params
+
+
+def legacyRender(params):
+    c = '<body onload="document.ipcForm.submit()">'
+    c += '<form id="ipcForm" name="ipcForm" action="' + ACTION + '" method="post">'
+    for k, v in params.items():
+        c += f'<input type="hidden" name="{k}" value="{v}" />\n'
+    c += '</form></body>'
+
+    return c.encode('utf-8')
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+if __name__ == '__main__':
+    print('Times in microseconds per page')
+    print(f'{"items":>6} {"bytes":>8} {"gzip":>7} | {"concat":>9} {"render":>9} {"speedup":>8} | {"stream":>9} {"gzip":>9}')
+    for items in (1, 20, 200, 500):
+        params = formParams(items)
+        page = FormRenderer.render(ACTION, params)
+        assert page == legacyRender(params)
+        streamed = []
+        FormRenderer.stream(ACTION, params, streamed.append)
+        assert b''.join(streamed) == page
+        number = max(20, 20000 // len(params))
+        old = bench(lambda: legacyRender(params), number)
+        new = bench(lambda: FormRenderer.render(ACTION, params), number)
+        stream = bench(lambda: FormRenderer.stream(ACTION, params, lambda data: None), number)
+        compressed = bench(lambda: FormRenderer.render(ACTION, params, True), number)
+        size = len(FormRenderer.render(ACTION, params, True))
+        print(f'{items:>6} {len(page):>8} {size:>7} | {old:>9.1f} {new:>9.1f} {old / new:>7.2f}x | {stream:>9.1f} {compressed:>9.1f}')
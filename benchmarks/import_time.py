@@ -0,0 +1,52 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import subprocess
+
+# Cold-start cost of importing the package, measured with python -X importtime in fresh interpreters:
+# median total per scenario and the modules contributing most to it.
+
+RUNS = 9
+SCENARIOS = (
+    'import IPC',
+    'from IPC import Config',
+    'from IPC import GetTxnStatus',
+    'from IPC import Purchase',
+    'from IPC import NotifyReceiver',
+    'from IPC import MetricsRegistry',
+    'import IPC; IPC.Helper.isValidEmail("a@b.cd")',
+)
+
+
+def importTime(statement: str):
+    """
+    * @param string statement\n
+    * @return tuple (float ms of all imports after interpreter startup, dict module => self ms)
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], cwd=pt, capture_output=True,
+                            text=True, check=True)
+    total = 0
+    modules = {}
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self, cumulative, name = line[len('import time:'):].split('|')
+        topLevel = not name.startswith('  ')
+        started = started or topLevel and name.strip().split('.')[0] == 'IPC'
+        if started:
+            modules[name.strip()] = int(self) / 1000
+            if topLevel:
+                total += int(cumulative) / 1000
+
+    return total, modules
+
+
+if __name__ == '__main__':
+    print(f'{"statement":<46} {"ms":>8}  slowest modules (self ms)')
+    for statement in SCENARIOS:
+        runs = sorted((importTime(statement) for i in range(RUNS)), key=lambda run: run[0])
+        total, modules = runs[RUNS // 2]
+        slowest = sorted(modules.items(), key=lambda item: -item[1])[:3]
+        print(f'{statement:<46} {total:>8.1f}  ' + ', '.join(f'{name} {ms:.1f}' for name, ms in slowest))
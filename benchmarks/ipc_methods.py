@@ -0,0 +1,377 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import argparse
+import json
+import platform
+import statistics
+import time
+
+from IPC import Crypto
+from IPC.Authorization import Authorization
+from IPC.AuthorizationCapture import AuthorizationCapture
+from IPC.AuthorizationList import AuthorizationList
+from IPC.AuthorizationReverse import AuthorizationReverse
+from IPC.Card import Card
+from IPC.Cart import Cart
+from IPC.Config import Config
+from IPC.ConnectionPool import ConnectionPool
+from IPC.Customer import Customer
+from IPC.GetPaymentStatus import GetPaymentStatus
+from IPC.GetTxnStatus import GetTxnStatus
+from IPC.IAPreAuthorization import IAPreAuthorization
+from IPC.IAPurchase import IAPurchase
+from IPC.IAStoreCard import IAStoreCard
+from IPC.IAStoredCardUpdate import IAStoredCardUpdate
+from IPC.IPCGetTxnLog import IPCGetTxnLog
+from IPC.MandateManagement import MandateManagement
+from IPC.PreAuthorization import PreAuthorization
+from IPC.PreAuthorizationCancellation import PreAuthorizationCancellation
+from IPC.PreAuthorizationCompletion import PreAuthorizationCompletion
+from IPC.PreAuthorizationStatus import PreAuthorizationStatus
+from IPC.Purchase import Purchase
+from IPC.PurchaseByIcard import PurchaseByIcard
+from IPC.Refund import Refund
+from IPC.RequestMoney import RequestMoney
+from IPC.Reversal import Reversal
+
+from mock_server import MockServer
+
+# Per-stage timings of every IPC method against a local MockServer:
+# validate() -> param building (_prepare) -> signature -> transport -> Response parsing and verification.
+# Results may be saved with --save and compared with a previous run with --compare,
+# the script exits with status 1 if a stage got slower than --threshold.
+#
+# Usage: python benchmarks/ipc_methods.py [--bits 1024 2048 4096] [--carts 1 10 100 500] [--repeat 20]
+#                                         [--methods Purchase Refund] [--save out.json] [--compare base.json]
+
+STAGES = ('validate', 'build', 'sign', 'transport', 'response')
+URL_OK = 'https://www.example.com/ok'
+URL_CANCEL = 'https://www.example.com/cancel'
+URL_NOTIFY = 'https://www.example.com/notify'
+
+
+def newCard(token = False):
+    card = Card()
+    if token:
+        card.setCardToken('0F1DC2C6B2FB8B7B7E0E1B2E4C0B0B5F')
+        return card
+    card.setCardType(Card.CARD_TYPE_VISA)
+    card.setCardNumber('4111111111111111')
+    card.setCardHolder('John Smith')
+    card.setExpMM('12')
+    card.setExpYY(str(time.localtime().tm_year + 2))
+    card.setCvc('123')
+    card.setEci('')
+    card.setAvv('')
+    card.setXid('')
+
+    return card
+
+
+def newCart(items: int):
+    cart = Cart()
+    for i in range(items):
+        cart.add(f'Item {i} & <accessory>', i % 3 + 1, 9.99 + i % 10)
+
+    return cart
+
+
+def newCustomer():
+    customer = Customer()
+    customer.setEmail('name@website.com')
+    customer.setFirstName('John')
+    customer.setLastName('Smith')
+    customer.setPhone('+23568956958')
+    customer.setCountry('DEU')
+    customer.setCity('Hamburg')
+    customer.setZip('20095')
+    customer.setAddress('Kleine Bahnstr. 41')
+
+    return customer
+
+
+def purchase(cnf, cart):
+    req = Purchase(cnf)
+    req.setCurrency('EUR')
+    req.setOrderID('order-1')
+    req.setUrlOk(URL_OK)
+    req.setUrlCancel(URL_CANCEL)
+    req.setUrlNotify(URL_NOTIFY)
+    req.setNote('Some note')
+    req.setPaymentParametersRequired(Purchase.PURCHASE_TYPE_FULL)
+    req.setCardTokenRequest(Purchase.CARD_TOKEN_REQUEST_NONE)
+    req.setCustomer(newCustomer())
+    req.setCart(cart)
+
+    return req
+
+
+def purchaseByIcard(cnf, cart):
+    req = PurchaseByIcard(cnf)
+    req.setCurrency('EUR')
+    req.setOrderID('order-1')
+    req.setUrlOk(URL_OK)
+    req.setUrlCancel(URL_CANCEL)
+    req.setUrlNotify(URL_NOTIFY)
+    req.setEmail('name@website.com')
+    req.setPhone('+23568956958')
+    req.setCart(cart)
+
+    return req
+
+
+def iaPurchase(cnf, cart):
+    req = IAPurchase(cnf)
+    req.setCurrency('EUR')
+    req.setOrderID('order-1')
+    req.setNote('Some note')
+    req.setAccountSettlement('')
+    req.setCard(newCard())
+    req.setCart(cart)
+
+    return req
+
+
+def preAuthorization(cnf):
+    req = PreAuthorization(cnf)
+    req.setCurrency('EUR')
+    req.setOrderID('order-1')
+    req.setItemName('Item')
+    req.setAmount(19.99)
+    req.setUrlOk(URL_OK)
+    req.setUrlCancel(URL_CANCEL)
+    req.setUrlNotify(URL_NOTIFY)
+    req.setNote('Some note')
+
+    return req
+
+
+def withCard(cls, token):
+    def factory(cnf):
+        req = cls(cnf)
+        req.setOrderID('order-1')
+        req.setItemName('Item')
+        req.setCurrency('EUR')
+        req.setAmount(19.99)
+        req.setCard(newCard(token))
+        req.setNote('Some note')
+        return req
+
+    return factory
+
+
+def storeCard(cls):
+    def factory(cnf):
+        req = cls(cnf)
+        req.setCard(newCard())
+        req.setCardVerification(IAStoreCard.CARD_VERIFICATION_NO)
+        return req
+
+    return factory
+
+
+def withAmount(cls):
+    def factory(cnf):
+        req = cls(cnf)
+        req.setOrderID('order-1')
+        req.setCurrency('EUR')
+        req.setAmount(19.99)
+        return req
+
+    return factory
+
+
+def withOrderID(cls):
+    def factory(cnf):
+        req = cls(cnf)
+        req.setOrderID('order-1')
+        return req
+
+    return factory
+
+
+def refund(cnf):
+    req = Refund(cnf)
+    req.setOrderID('order-1')
+    req.setTrnref('1234567')
+    req.setCurrency('EUR')
+    req.setAmount(19.99)
+
+    return req
+
+
+def reversal(cnf):
+    req = Reversal(cnf)
+    req.setTrnref('1234567')
+
+    return req
+
+
+def mandateManagement(cnf):
+    req = MandateManagement(cnf)
+    req.setMandateReference('mandate-1')
+    req.setCustomerWalletNumber('61938166610')
+    req.setAction(MandateManagement.MANDATE_MANAGEMENT_ACTION_REGISTER)
+    req.setMandateText('Mandate text')
+
+    return req
+
+
+def requestMoney(cnf):
+    req = RequestMoney(cnf)
+    req.setOrderID('order-1')
+    req.setMandateReference('mandate-1')
+    req.setCustomerWalletNumber('61938166610')
+    req.setReversalIndicator(False)
+    req.setReason('Reason')
+    req.setCurrency('EUR')
+    req.setAmount(19.99)
+
+    return req
+
+
+"""
+* Method name => (factory, takes cart, posts HTML form)
+"""
+METHODS = {
+    'Authorization': (withCard(Authorization, True), False, False),
+    'AuthorizationCapture': (withAmount(AuthorizationCapture), False, False),
+    'AuthorizationList': (AuthorizationList, False, False),
+    'AuthorizationReverse': (withAmount(AuthorizationReverse), False, False),
+    'GetPaymentStatus': (withOrderID(GetPaymentStatus), False, False),
+    'GetTxnStatus': (withOrderID(GetTxnStatus), False, False),
+    'IAPreAuthorization': (withCard(IAPreAuthorization, False), False, False),
+    'IAPurchase': (iaPurchase, True, False),
+    'IAStoreCard': (storeCard(IAStoreCard), False, False),
+    'IAStoredCardUpdate': (storeCard(IAStoredCardUpdate), False, False),
+    'IPCGetTxnLog': (withOrderID(IPCGetTxnLog), False, False),
+    'MandateManagement': (mandateManagement, False, False),
+    'PreAuthorization': (preAuthorization, False, True),
+    'PreAuthorizationCancellation': (withAmount(PreAuthorizationCancellation), False, False),
+    'PreAuthorizationCompletion': (withAmount(PreAuthorizationCompletion), False, False),
+    'PreAuthorizationStatus': (withOrderID(PreAuthorizationStatus), False, False),
+    'Purchase': (purchase, True, True),
+    'PurchaseByIcard': (purchaseByIcard, True, True),
+    'Refund': (refund, False, False),
+    'RequestMoney': (requestMoney, False, False),
+    'Reversal': (reversal, False, False),
+}
+
+
+def newConfig(server: MockServer, privateKey):
+    cnf = Config()
+    cnf.setPrivateKey(privateKey.export_key().decode('ascii'))
+    cnf.setEncryptPublicKeyPath(pt + '/keys/test.encrypt_key.pem')
+    cnf.setLang('EN')
+    cnf.setSid('000000000000010')
+    cnf.setWallet('61938166610')
+    cnf.setKeyIndex(1)
+
+    return server.configure(cnf)
+
+
+def measure(req, form: bool, repeat: int):
+    """
+    * Run all stages repeat times\n
+    * @return dict stage => median seconds
+    """
+    pool = ConnectionPool.getInstance(req._getCnf())
+    validate = req.validate
+    times = {stage: [] for stage in STAGES}
+    clock = time.perf_counter
+    for _ in range(repeat):
+        t0 = clock()
+        validate()
+        t1 = clock()
+        req.validate = lambda: True
+        try:
+            req._prepare()
+        finally:
+            del req.validate
+        params = req._detachPostParams()
+        t2 = clock()
+        req._signPostParams(params)
+        t3 = clock()
+        status, headers, body = pool.request(req._encodePostRequest(params))
+        t4 = clock()
+        if not form:
+            req._buildResponse(body)
+        t5 = clock()
+
+        times['validate'].append(t1 - t0)
+        times['build'].append(t2 - t1)
+        times['sign'].append(t3 - t2)
+        times['transport'].append(t4 - t3)
+        if not form:
+            times['response'].append(t5 - t4)
+
+    return {stage: statistics.median(values) for stage, values in times.items() if values}
+
+
+def run(args):
+    results = {}
+    for bits in args.bits:
+        storePublic, storePrivate = Crypto.newkeys(bits)
+        apiPublic, apiPrivate = Crypto.newkeys(bits)
+        with MockServer(storePublicKey=storePublic, apiPrivateKey=apiPrivate) as server:
+            server.setLogSize(args.log_size)
+            cnf = newConfig(server, storePrivate)
+            for name in args.methods:
+                factory, takesCart, form = METHODS[name]
+                for items in (args.carts if takesCart else [0]):
+                    req = factory(cnf, newCart(items)) if takesCart else factory(cnf)
+                    key = f'{name}/rsa{bits}' + (f'/cart{items}' if takesCart else '')
+                    results[key] = measure(req, form, args.repeat)
+                    report(key, results[key])
+            ConnectionPool.closeAll()
+
+    return results
+
+
+def report(key, timings):
+    cells = ''.join(f'{timings[stage] * 1e6:>12.1f}' if stage in timings else f'{"-":>12}' for stage in STAGES)
+    print(f'{key:<48}{cells}', flush=True)
+
+
+def compare(results, baseline, threshold: float):
+    """
+    * Print stages slower than baseline by more than threshold\n
+    * @return int Count of regressions
+    """
+    regressions = 0
+    for key, timings in results.items():
+        for stage, value in timings.items():
+            base = baseline.get(key, {}).get(stage)
+            if base and value > base * (1 + threshold):
+                regressions += 1
+                print(f'REGRESSION {key} {stage}: {base * 1e6:.1f}us -> {value * 1e6:.1f}us ({value / base - 1:+.0%})')
+
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Per-stage benchmark of IPC methods against local MockServer')
+    parser.add_argument('--bits', type=int, nargs='+', default=[1024, 2048, 4096])
+    parser.add_argument('--carts', type=int, nargs='+', default=[1, 10, 100, 500])
+    parser.add_argument('--methods', nargs='+', default=list(METHODS), choices=list(METHODS))
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--log-size', type=int, default=50, help='entries returned by list methods')
+    parser.add_argument('--save', help='write results as JSON')
+    parser.add_argument('--compare', help='JSON results of a previous run')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown against --compare')
+    args = parser.parse_args()
+
+    print(f'{"median us":<48}' + ''.join(f'{stage:>12}' for stage in STAGES))
+    results = run(args)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'python': platform.python_version(), 'platform': platform.platform(), 'results': results}, f, indent=1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
@@ -0,0 +1,54 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import threading
+import time
+
+from IPC.MetricsRegistry import MetricsRegistry
+from IPC.Trace import Trace
+from IPC.Tracer import Tracer
+
+# Cost of recording one request in MetricsRegistry, from one and from many threads,
+# and of rendering the Prometheus exposition.
+
+
+def newTrace(method: str):
+    trace = Trace('json', 0)
+    trace.setMethod(method)
+    trace.setStatus(0)
+    offset = 0
+    for stage in (Tracer.STAGE_PREPARE, Tracer.STAGE_SIGN, Tracer.STAGE_CONNECT, Tracer.STAGE_SEND, Tracer.STAGE_RECEIVE,
+                  Tracer.STAGE_PARSE, Tracer.STAGE_VERIFY):
+        trace.addStage(stage, offset, offset + 500000)
+        offset += 500000
+    trace.finish(offset)
+
+    return trace
+
+
+def record(registry, traces, count: int):
+    for i in range(count):
+        registry.finish(traces[i % len(traces)])
+
+
+if __name__ == '__main__':
+    count = 200000
+    traces = [newTrace(method) for method in ('IPCGetTxnStatus', 'IPCRefund', 'IPCIAPurchase', 'IPCReversal')]
+    print(f'{"threads":>7} {"records/s":>12} {"us/record":>10}')
+    for threads in (1, 4, 8):
+        registry = MetricsRegistry()
+        workers = [threading.Thread(target=record, args=(registry, traces, count)) for i in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        counters, histograms = registry.collect()
+        assert sum(counters[key] for key in counters if key[0] == 'ipc_requests_total') == threads * count
+        print(f'{threads:>7} {threads * count / elapsed:>12.0f} {elapsed / (threads * count) * 1e6:>10.2f}')
+
+    start = time.perf_counter()
+    text = registry.exposition()
+    print(f'exposition: {len(text.splitlines())} lines in {(time.perf_counter() - start) * 1e3:.2f} ms')
@@ -0,0 +1,357 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import html
+import json
+import random
+import threading
+import time
+import uuid
+from base64 import b64encode, b64decode
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl
+from xml.sax.saxutils import escape as xmlEscape
+
+from IPC import Crypto
+from IPC.Config import Config
+from IPC.Defines import Defines
+
+
+class MockServer(object):
+    """
+ * Local stand-in for the IPC API for offline load and latency tests, used by the benchmarks.
+ * Verifies request signatures with the store public key and answers with JSON/XML responses
+ * signed with its own API key. Latency, error rate and chunked encoding can be injected.
+ * Signatures are computed from the encoded response itself, not with the SDK helpers:
+ * sign data is the text of every leaf value in document order joined by '-'
+    """
+    FORM_METHODS = [
+        'IPCPurchase',
+        'IPCPurchaseByIcard',
+        'IPCPreAuthorization',
+    ]
+    API_METHODS = [
+        'IPCAuthorization',
+        'IPCAuthorizationCapture',
+        'IPCAuthorizationList',
+        'IPCAuthorizationReverse',
+        'IPCGetPaymentStatus',
+        'IPCGetTxnLog',
+        'IPCGetTxnStatus',
+        'IPCIAPreAuthorization',
+        'IPCIAPurchase',
+        'IPCIAStoreCard',
+        'IPCIAStoredCardUpdate',
+        'IPCMandateManagement',
+        'IPCPreAuthCancellation',
+        'IPCPreAuthCompletion',
+        'IPCPreAuthStatus',
+        'IPCRefund',
+        'IPCRequestMoney',
+        'IPCReversal',
+    ]
+    """
+    * Request params echoed back in responses when present
+    """
+    ECHO_PARAMS = ['OrderID', 'IPC_Trnref', 'Amount', 'Currency', 'MandateReference', 'CardToken']
+    """
+    * Methods returning list of logSize entries
+    """
+    LIST_METHODS = {
+        'IPCGetTxnLog': 'Log',
+        'IPCAuthorizationList': 'Authorizations',
+    }
+
+    __host: str
+    __port: int
+    __latency = 0.0
+    __jitter = 0.0
+    __errorRate = 0.0
+    __chunkSize = 0
+    __logSize = 0
+    __requestCount = 0
+    __server = None
+    __thread = None
+
+    def __init__(self, storePublicKey = None, apiPrivateKey = None, host = '127.0.0.1', port = 0, seed = None):
+        """
+    * @param string|RsaKey storePublicKey Key for request signature check, default is derived from keys/test.store_private_key.pem
+    * @param string|RsaKey apiPrivateKey Key for response signatures, default is a new 1024 bit key
+    * @param string host
+    * @param int port 0 to pick free port
+    * @param int seed Seed for injected latency jitter and errors
+        """
+        if storePublicKey is None:
+            path = os.path.join(pt, 'keys', 'test.store_private_key.pem')
+            storePublicKey = Crypto.importKey(open(path).read()).publickey()
+        if apiPrivateKey is None:
+            public, apiPrivateKey = Crypto.newkeys(1024)
+        self.__storePublicKey = Crypto.asKey(storePublicKey)
+        self.__apiPrivateKey = Crypto.asKey(apiPrivateKey)
+        self.__host = host
+        self.__port = port
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+
+    def start(self):
+        """
+    * Start serving in a background thread\n
+    * @return MockServer
+        """
+        handler = type('MockServerHandler', (_MockServerHandler,), {'mockServer': self})
+        self.__server = ThreadingHTTPServer((self.__host, self.__port), handler)
+        self.__server.daemon_threads = True
+        self.__port = self.__server.server_address[1]
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+
+        return self
+
+    def stop(self):
+        """
+    * Stop serving
+        """
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def getURL(self):
+        """
+    * IPC URL to use with Config.setIpcURL()\n
+    * @return string
+        """
+        return f'http://{self.__host}:{self.__port}/vmp/checkout'
+
+    def getAPIPublicKey(self):
+        """
+    * Public key of response signatures, use with Config.setAPIPublicKey()\n
+    * @return string
+        """
+        return self.__apiPrivateKey.publickey().export_key().decode('ascii')
+
+    def configure(self, cnf: Config):
+        """
+    * Point config to this server\n
+    * @param cnf: Config\n
+    * @return Config
+        """
+        cnf.setIpcURL(self.getURL())
+        cnf.setAPIPublicKey(self.getAPIPublicKey())
+
+        return cnf
+
+    def setLatency(self, latency: float, jitter = 0.0):
+        """
+    * Delay every response\n
+    * @param float latency Seconds
+    * @param float jitter Max random seconds added to latency\n
+    * @return MockServer
+        """
+        self.__latency = latency
+        self.__jitter = jitter
+
+        return self
+
+    def setErrorRate(self, errorRate: float):
+        """
+    * Share of requests answered with unsigned STATUS_IPC_ERROR response\n
+    * @param float errorRate 0..1\n
+    * @return MockServer
+        """
+        self.__errorRate = errorRate
+
+        return self
+
+    def setChunkSize(self, chunkSize: int):
+        """
+    * Send responses with chunked Transfer-Encoding\n
+    * @param int chunkSize Bytes per chunk, 0 to send Content-Length\n
+    * @return MockServer
+        """
+        self.__chunkSize = chunkSize
+
+        return self
+
+    def getChunkSize(self):
+        """
+    * @return int
+        """
+        return self.__chunkSize
+
+    def setLogSize(self, logSize: int):
+        """
+    * Count of entries returned by list methods (IPCGetTxnLog, IPCAuthorizationList)\n
+    * @param int logSize\n
+    * @return MockServer
+        """
+        self.__logSize = logSize
+
+        return self
+
+    def getRequestCount(self):
+        """
+    * @return int Count of handled requests
+        """
+        return self.__requestCount
+
+    def handle(self, body: bytes):
+        """
+    * Process one API request\n
+    * @param bytes body urlencoded POST body\n
+    * @return tuple (string content type, bytes content)
+        """
+        with self.__lock:
+            self.__requestCount += 1
+            delay = self.__latency + (self.__random.uniform(0, self.__jitter) if self.__jitter else 0)
+            fail = self.__errorRate > 0 and self.__random.random() < self.__errorRate
+        if delay > 0:
+            time.sleep(delay)
+
+        params = parse_qsl(body.decode('utf-8'), keep_blank_values=True)
+        request = dict(params)
+        method = html.unescape(request.get('IPCmethod', ''))
+        outputFormat = request.get('OutputFormat', Defines.COMMUNICATION_FORMAT_JSON)
+
+        if fail:
+            return self.__render({'Status': str(Defines.STATUS_IPC_ERROR), 'StatusMsg': 'IPC Error'}, outputFormat, False)
+
+        if method not in self.FORM_METHODS and method not in self.API_METHODS:
+            return self.__render(self.__status(Defines.STATUS_UNSUPPORTED_CALL, 'Unsupported method'), outputFormat)
+
+        if not params or params[-1][0] != 'Signature' or not self.__isValidSignature(params):
+            return self.__render(self.__status(Defines.STATUS_SIGNATURE_FAILED, 'Signature check failed'), outputFormat)
+
+        if method in self.FORM_METHODS:
+            orderID = xmlEscape(html.unescape(request.get('OrderID', '')))
+            return 'text/html; charset=utf-8', f'<html><body>Mock {method} payment page for order {orderID}</body></html>'.encode('utf-8')
+
+        data = self.__status(Defines.STATUS_SUCCESS, 'Success')
+        for name in self.ECHO_PARAMS:
+            if name in request:
+                data[name] = html.unescape(request[name])
+        if method in self.LIST_METHODS:
+            data[self.LIST_METHODS[method]] = [self.__logEntry(i) for i in range(self.__logSize)]
+        else:
+            data.setdefault('IPC_Trnref', str(uuid.uuid4()))
+        if method == 'IPCIAStoreCard':
+            data['CardToken'] = str(uuid.uuid4())
+
+        return self.__render(data, outputFormat)
+
+    @staticmethod
+    def __status(status: int, statusMsg: str):
+        return {'Status': str(status), 'StatusMsg': statusMsg}
+
+    def __logEntry(self, i: int):
+        return {
+            'OrderID': f'order-{i}',
+            'IPC_Trnref': f'{i:010d}',
+            'Amount': f'{(i % 1000) + 0.99:.2f}',
+            'Currency': 'EUR',
+            'Status': str(Defines.STATUS_SUCCESS),
+        }
+
+    def __isValidSignature(self, params):
+        """
+    * @param list params Request params in order, Signature is the last one\n
+    * @return boolean
+        """
+        signData = b64encode('-'.join(html.unescape(v) for k, v in params[:-1]).encode('utf-8'))
+        try:
+            return Crypto.verify(signData, b64decode(params[-1][1]), self.__storePublicKey, Defines.SIGNATURE_ALGO)
+        except ValueError:
+            return False
+
+    def __render(self, data: dict, outputFormat: str, sign = True):
+        """
+    * Encode response and sign the leaf values collected while encoding it\n
+    * @param dict data
+    * @param string outputFormat
+    * @param bool sign\n
+    * @return tuple (string content type, bytes content)
+        """
+        xml = outputFormat == Defines.COMMUNICATION_FORMAT_XML
+        encode = self.__toXml if xml else self.__toJson
+        leaves = []
+        members = [encode(name, value, leaves) for name, value in data.items()]
+        if sign:
+            signData = b64encode('-'.join(leaves).encode('utf-8'))
+            signature = b64encode(Crypto.sign(signData, self.__apiPrivateKey, Defines.SIGNATURE_ALGO)).decode('ascii')
+            members.append(encode('Signature', signature, []))
+
+        if xml:
+            return 'text/xml; charset=utf-8', ('<?xml version="1.0" encoding="UTF-8"?><Response>' + ''.join(members) + '</Response>').encode('utf-8')
+
+        return 'application/json', ('{' + ','.join(members) + '}').encode('utf-8')
+
+    def __toXml(self, name: str, value, leaves: list):
+        """
+    * @param string name Element name
+    * @param mixed value
+    * @param list leaves Collects text of leaf elements, an empty element is a leaf with empty text\n
+    * @return string
+        """
+        if isinstance(value, (dict, list)) and value:
+            items = value.items() if isinstance(value, dict) else (('Item', v) for v in value)
+            return f'<{name}>' + ''.join(self.__toXml(k, v, leaves) for k, v in items) + f'</{name}>'
+
+        text = '' if isinstance(value, (dict, list)) else str(value)
+        leaves.append(text)
+
+        return f'<{name}>{xmlEscape(text)}</{name}>'
+
+    def __toJson(self, name, value, leaves: list):
+        """
+    * @param string name Member name, None for list item
+    * @param mixed value
+    * @param list leaves Collects scalar values, empty objects and arrays have none\n
+    * @return string
+        """
+        if isinstance(value, dict):
+            encoded = '{' + ','.join(self.__toJson(k, v, leaves) for k, v in value.items()) + '}'
+        elif isinstance(value, list):
+            encoded = '[' + ','.join(self.__toJson(None, v, leaves) for v in value) + ']'
+        else:
+            leaves.append(str(value))
+            encoded = json.dumps(str(value))
+
+        return encoded if name is None else json.dumps(name) + ':' + encoded
+
+
+class _MockServerHandler(BaseHTTPRequestHandler):
+    """
+ * HTTP/1.1 keep-alive handler of MockServer
+    """
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    mockServer: MockServer
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        contentType, content = self.mockServer.handle(body)
+
+        self.send_response(200)
+        self.send_header('Content-Type', contentType)
+        chunkSize = self.mockServer.getChunkSize()
+        if chunkSize > 0:
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for i in range(0, len(content), chunkSize):
+                chunk = content[i:i + chunkSize]
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            self.wfile.write(b'0\r\n\r\n')
+        else:
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
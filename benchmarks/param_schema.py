@@ -0,0 +1,78 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import timeit
+
+from IPC.Config import Config
+from IPC.ParamSchema import ParamSchema
+from ipc_methods import METHODS
+
+# Collecting API params of the IPC methods described by ParamSchema: compiled schema entries()
+# against calling the getters and _addPostParam() once per param as hand-written _prepare() did.
+# Validation is excluded from both.
+
+
+def newConfig():
+    cnf = Config()
+    cnf.setEncryptPublicKeyPath(pt + '/keys/test.encrypt_key.pem')
+    cnf.setLang('EN')
+    cnf.setSid('000000000000010')
+    cnf.setWallet('61938166610')
+    cnf.setKeyIndex(1)
+
+    return cnf
+
+
+def getValue(req, getter):
+    if callable(getter):
+        return getter(req)
+    value = req
+    for name in getter.split('.'):
+        value = getattr(value, name)()
+
+    return value
+
+
+def addEach(req):
+    cnf = req._getCnf()
+    req._addPostParam('IPCmethod', req._schema.getMethod())
+    for name, getter in ParamSchema.CONFIG_PARAMS:
+        req._addPostParam(name, getattr(cnf, getter)())
+    for name, getter, check, error, encrypt, when, optional in req._schema.getFields():
+        if when is None or when(req):
+            value = getValue(req, getter)
+            if value is None and optional:
+                req._addPostParam(name, '')
+            else:
+                req._addPostParam(name, value, encrypt)
+
+    return req._detachPostParams()
+
+
+def schema(req):
+    req._prepare()
+
+    return req._detachPostParams()
+
+
+def bench(func, req, number):
+    return min(timeit.repeat(lambda: func(req), number=number, repeat=5)) / number * 1e6
+
+
+if __name__ == '__main__':
+    print('Times in microseconds per request, card methods include RSA encryption of card details')
+    print(f'{"method":<30} {"params":>6} | {"_addPostParam":>13} {"schema":>8} {"speedup":>8}')
+    for method, (factory, cart, form) in METHODS.items():
+        if cart:
+            continue
+        req = factory(newConfig())
+        if not req._schema.getFields():
+            continue
+        req.validate = lambda: True
+        params = schema(req)
+        assert [name for name, value in params.items()] == [name for name, value in addEach(req).items()]
+        number = 200 if 'PAN' in params or 'CVC' in params else 20000
+        each = bench(addEach, req, number)
+        compiled = bench(schema, req, number)
+        print(f'{method:<30} {len(params):>6} | {each:>13.2f} {compiled:>8.2f} {each / compiled:>7.2f}x')
@@ -0,0 +1,77 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import timeit
+from urllib.parse import urlencode, urlparse
+
+from IPC.Config import Config
+from IPC.IAStoreCard import IAStoreCard
+from ipc_methods import newCard, newCart, purchase, withOrderID
+from IPC.GetTxnStatus import GetTxnStatus
+
+# Encoding signed params into a raw HTTP POST request: urlencode() into a str joined with the head
+# and encoded again, against PostParams.encodeBody() into a bytearray sent after the head as it is.
+
+
+def newConfig():
+    cnf = Config()
+    cnf.setIpcURL('https://www.mypos.eu/vmp/checkout-test')
+    cnf.setPrivateKeyPath(pt + '/keys/test.store_private_key.pem')
+    cnf.setEncryptPublicKeyPath(pt + '/keys/test.encrypt_key.pem')
+    cnf.setLang('EN')
+    cnf.setSid('000000000000010')
+    cnf.setWallet('61938166610')
+    cnf.setKeyIndex(1)
+
+    return cnf
+
+
+def joined(cnf, params):
+    url = urlparse(cnf.getIpcURL())
+    postData = urlencode(params)
+
+    eol = "\r\n"
+    path = (url.path or '/') + ('?' + url.query if url.query else '')
+    req = f"POST {path} HTTP/1.1{eol}"
+    req += f"Host: {url.hostname}{eol}"
+    req += f"Content-type: application/x-www-form-urlencoded{eol}"
+    req += f"Content-length: {len(postData)}{eol}"
+    req += f"Connection: keep-alive{eol}{eol}"
+    req += postData
+
+    return req.encode('utf-8')
+
+
+def storeCard(cnf):
+    req = IAStoreCard(cnf)
+    req.setCard(newCard())
+    req.setCardVerification(IAStoreCard.CARD_VERIFICATION_NO)
+
+    return req
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+if __name__ == '__main__':
+    cnf = newConfig()
+    requests = {
+        'GetTxnStatus': withOrderID(GetTxnStatus)(cnf),
+        'IAStoreCard': storeCard(cnf),
+        'Purchase/cart10': purchase(cnf, newCart(10)),
+        'Purchase/cart500': purchase(cnf, newCart(500)),
+        'Purchase/cart5000': purchase(cnf, newCart(5000)),
+    }
+    print('Times in microseconds per request')
+    print(f'{"request":<18} {"bytes":>8} | {"urlencode":>10} {"bytearray":>10} {"speedup":>8}')
+    for name, req in requests.items():
+        params = req.signBatch([req])[0]
+        encode = req._encodePostRequest
+        head, body = encode(params)
+        assert head + body == joined(cnf, params)
+        number = max(5, 200000 // len(body))
+        old = bench(lambda: joined(cnf, params), number)
+        new = bench(lambda: encode(params), number)
+        print(f'{name:<18} {len(head) + len(body):>8} | {old:>10.1f} {new:>10.1f} {old / new:>7.2f}x')
@@ -0,0 +1,54 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import time
+
+from IPC import Crypto
+from IPC.Defines import Defines
+from IPC.ProcessPoolSigner import ProcessPoolSigner
+from IPC.Signer import Signer
+
+# Signing throughput of the in-process Signer and ProcessPoolSigner
+# with growing worker count. Usage: python benchmarks/signer.py [count] [bits]
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+BITS = int(sys.argv[2]) if len(sys.argv) > 2 else 2048
+
+
+def digests(count: int):
+    result = []
+    for i in range(count):
+        digest = Crypto.newDigest(Defines.SIGNATURE_ALGO)
+        digest.update(f'order-{i}'.encode('utf-8'))
+        result.append(digest)
+
+    return result
+
+
+def run(signer, items, key):
+    start = time.perf_counter()
+    signatures = signer.signMany(items, key)
+    elapsed = time.perf_counter() - start
+    assert len(signatures) == len(items)
+
+    return len(items) / elapsed
+
+
+if __name__ == '__main__':
+    public, private = Crypto.newkeys(BITS)
+    items = digests(COUNT)
+
+    key = Crypto.asKey(private)
+    base = run(Signer(), items, key)
+    print(f'{COUNT} signatures, RSA {BITS}')
+    print(f'{"signer":>22} {"sig/s":>10} {"scaling":>8}')
+    print(f'{"Signer":>22} {base:>10.0f} {1:>7.2f}x')
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ProcessPoolSigner(workers=workers) as signer:
+            signer.signMany(items[:workers], key)  # start workers
+            rate = run(signer, items, key)
+        print(f'{f"ProcessPoolSigner({workers})":>22} {rate:>10.0f} {rate / base:>7.2f}x')
+        workers *= 2
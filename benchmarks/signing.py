@@ -0,0 +1,103 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import timeit
+from base64 import b64encode
+
+from IPC import Crypto
+from IPC.Defines import Defines
+from IPC.Helper import Helper
+from IPC.PostParams import PostParams
+
+# Compares building and hashing request sign data with the previous
+# dict based pipeline and PostParams. RSA signing itself is the same
+# for both and is reported separately.
+
+HEADER = [
+    ('IPCmethod', 'IPCIAPurchase'),
+    ('IPCVersion', '1.4'),
+    ('IPCLanguage', 'EN'),
+    ('SID', '000000000000010'),
+    ('WalletNumber', '61938166610'),
+    ('KeyIndex', '1'),
+    ('Source', 'SDK_Python_' + Defines.SDK_VERSION),
+    ('OrderID', 'b7c0a1a4-5fd2-4c8a-9d3e-3c8b2a6f1e10'),
+    ('Amount', '123.45'),
+    ('Currency', 'EUR'),
+    ('Note', 'Some note & more'),
+    ('OutputFormat', 'json'),
+]
+
+
+def cartParams(items: int):
+    params = list(HEADER)
+    params.append(('CartItems', str(items)))
+    for i in range(1, items + 1):
+        params.append((f'Article_{i}', f'Hp Probook 6360b Sticker "{i}"'))
+        params.append((f'Quantity_{i}', '2'))
+        params.append((f'Price_{i}', '10.0'))
+        params.append((f'Amount_{i}', '20.0'))
+        params.append((f'Currency_{i}', 'EUR'))
+
+    return params
+
+
+def legacyBuild(params):
+    stored = {}
+    for k, v in params:
+        stored[k] = Helper.escape(Helper.unescape(v))
+
+    return stored
+
+
+def legacyDigest(stored):
+    unescaped = dict()
+    for k, v in stored.items():
+        unescaped[k] = Helper.unescape(v)
+    concData = b64encode('-'.join(str(x) for x in unescaped.values()).encode('utf-8'))
+    digest = Crypto.newDigest(Defines.SIGNATURE_ALGO)
+    digest.update(concData)
+
+    return digest
+
+
+def pipelineBuild(params):
+    stored = PostParams()
+    for k, v in params:
+        raw = Helper.unescape(v)
+        stored.set(k, raw, Helper.escape(raw))
+
+    return stored
+
+
+def pipelineDigest(stored):
+    digest = Crypto.newDigest(Defines.SIGNATURE_ALGO)
+    stored.updateDigest(digest)
+
+    return digest
+
+
+def bench(func, arg, number):
+    return min(timeit.repeat(lambda: func(arg), number=number, repeat=5)) / number * 1e6
+
+
+if __name__ == '__main__':
+    key = Crypto.importKey(open(pt + '/keys/test.store_private_key.pem').read())
+    digest = pipelineDigest(pipelineBuild(cartParams(1)))
+    rsa = min(timeit.repeat(lambda: Crypto.signDigest(digest, key), number=200, repeat=5)) / 200 * 1e6
+
+    print('Times in microseconds per request; "sign data" is building and hashing the string to sign')
+    print(f'{"items":>6} {"params":>7} | {"build old":>10} {"build new":>10} | {"sign data old":>14} {"sign data new":>14} {"speedup":>8} | {"total speedup":>13}')
+    for items in (1, 20, 200):
+        params = cartParams(items)
+        legacyStored = legacyBuild(params)
+        stored = pipelineBuild(params)
+        assert legacyDigest(legacyStored).digest() == pipelineDigest(stored).digest()
+        number = max(10, 20000 // len(params))
+        buildOld = bench(legacyBuild, params, number)
+        buildNew = bench(pipelineBuild, params, number)
+        signOld = bench(legacyDigest, legacyStored, number)
+        signNew = bench(pipelineDigest, stored, number)
+        print(f'{items:>6} {len(params):>7} | {buildOld:>10.1f} {buildNew:>10.1f} | {signOld:>14.1f} {signNew:>14.1f} {signOld / signNew:>7.2f}x | {(buildOld + signOld) / (buildNew + signNew):>12.2f}x')
+    print(f'RSA sign (same for both): {rsa:.1f}')
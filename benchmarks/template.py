@@ -0,0 +1,91 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+import timeit
+
+from IPC.Cart import Cart
+from IPC.Config import Config
+from IPC.Customer import Customer
+from IPC.Purchase import Purchase
+from IPC.PurchaseTemplate import PurchaseTemplate
+
+# Per-purchase cost of Purchase.render() and PurchaseTemplate.render() with the same
+# checkout configuration. "build" is validation and param collection without signing.
+
+conf = Config()
+conf.setIpcURL('https://www.mypos.eu/vmp/checkout-test')
+conf.setPrivateKeyPath(pt + '/keys/test.store_private_key.pem')
+conf.setLang('EN')
+conf.setSid('000000000000010')
+conf.setWallet('61938166610')
+conf.setKeyIndex(1)
+
+
+def newCustomer():
+    customer = Customer()
+    customer.setEmail('name@website.com')
+    customer.setFirstName('John')
+    customer.setLastName('Smith')
+    customer.setPhone('+23568956958')
+    customer.setCountry('DEU')
+    customer.setCity('Hamburg')
+    customer.setZip('20095')
+    customer.setAddress('Kleine Bahnstr. 41')
+
+    return customer
+
+
+def newPurchase():
+    req = Purchase(conf)
+    req.setCurrency('EUR')
+    req.setUrlOk('https://www.example.com/ok')
+    req.setUrlCancel('https://www.example.com/cancel')
+    req.setUrlNotify('https://www.example.com/notify')
+    req.setPaymentParametersRequired(Purchase.PURCHASE_TYPE_FULL)
+    req.setCardTokenRequest(Purchase.CARD_TOKEN_REQUEST_NONE)
+
+    return req
+
+
+def purchaseBuild(cart, customer):
+    req = newPurchase()
+    req.setOrderID('order-1')
+    req.setNote('Some note')
+    req.setCart(cart)
+    req.setCustomer(customer)
+    req._prepare()
+
+    return req._detachPostParams()
+
+
+def purchaseRender(cart, customer):
+    req = newPurchase()
+    req.setOrderID('order-1')
+    req.setNote('Some note')
+    req.setCart(cart)
+    req.setCustomer(customer)
+
+    return req.render()
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+if __name__ == '__main__':
+    template = PurchaseTemplate(newPurchase())
+    customer = newCustomer()
+    print('Times in microseconds per purchase')
+    print(f'{"items":>6} | {"build Purchase":>15} {"build template":>15} {"speedup":>8} | {"render Purchase":>16} {"render template":>16} {"speedup":>8}')
+    for items in (1, 20, 200):
+        cart = Cart()
+        for i in range(items):
+            cart.add(f'Item {i}', 1, 9.99)
+        assert purchaseRender(cart, customer) == template.render('order-1', cart, customer, 'Some note')
+        number = max(10, 2000 // items)
+        buildOld = bench(lambda: purchaseBuild(cart, customer), number)
+        buildNew = bench(lambda: template._PurchaseTemplate__build('order-1', cart, customer, 'Some note'), number)
+        renderOld = bench(lambda: purchaseRender(cart, customer), number)
+        renderNew = bench(lambda: template.render('order-1', cart, customer, 'Some note'), number)
+        print(f'{items:>6} | {buildOld:>15.1f} {buildNew:>15.1f} {buildOld / buildNew:>7.2f}x | {renderOld:>16.1f} {renderNew:>16.1f} {renderOld / renderNew:>7.2f}x')
@@ -0,0 +1,22 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# Card regression checks, no network is used.
+
+from IPC.Card import Card
+from IPC.Helper import Helper
+
+# details which were never set read as None
+card = Card()
+for getter in ('getCardType', 'getCardNumber', 'getCardHolder', 'getExpMM', 'getExpYY', 'getCvc', 'getEci', 'getAvv',
+               'getXid', 'getCardToken'):
+    assert getattr(card, getter)() is None, f'{getter}() of new card must be None'
+
+# Luhn checksum
+for number in ('4111111111111111', '5555555555554444', '378282246310005'):
+    assert Helper.isValidCardNumber(number), f'{number} must be valid'
+for number in ('4111111111111112', '5555555555554445'):
+    assert not Helper.isValidCardNumber(number), f'{number} must be invalid'
+
+print('OK')
@@ -0,0 +1,130 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+sys.path.insert(2, os.path.join(pt, 'benchmarks'))
+
+# CardMigration against the local mock IPC server: journal, resume of an interrupted run, unknown results
+# of requests sent without response and the token mapping file.
+
+import csv
+import datetime
+import json
+import socket
+import tempfile
+import threading
+
+from mock_server import MockServer
+from IPC.CardMigration import CardMigration
+from IPC.Config import Config
+
+
+def newConfig():
+    conf = Config()
+    conf.setPrivateKeyPath(pt + '/keys/test.store_private_key.pem')
+    conf.setEncryptPublicKeyPath(pt + '/keys/test.encrypt_key.pem')
+    conf.setLang('EN')
+    conf.setSid('000000000000010')
+    conf.setWallet('61938166610')
+    conf.setKeyIndex(1)
+    conf.setConnectionPoolSize(4)
+
+    return conf
+
+
+def newCard(reference, cardNumber = '4111111111111111'):
+    return {'reference': reference, 'cardNumber': cardNumber, 'cardType': '1', 'cardHolder': 'John Doe',
+            'expMM': '12', 'expYY': str(datetime.datetime.today().year + 1), 'cvc': '123'}
+
+
+def lastEntry(path):
+    with open(path, encoding='utf-8') as journal:
+        return json.loads(journal.readlines()[-1])
+
+
+# server reading one request per connection and closing it without response
+def silentServer():
+    server = socket.create_server(('127.0.0.1', 0))
+
+    def serve():
+        while True:
+            try:
+                conn, address = server.accept()
+            except OSError:
+                return
+            with conn:
+                data = b''
+                while b'\r\n\r\n' not in data:
+                    data += conn.recv(65536)
+                head, body = data.split(b'\r\n\r\n', 1)
+                length = int([line.split(b':')[1] for line in head.split(b'\r\n') if line.lower().startswith(b'content-length')][0])
+                while len(body) < length:
+                    body += conn.recv(65536)
+
+    threading.Thread(target=serve, daemon=True).start()
+
+    return server
+
+
+with tempfile.TemporaryDirectory() as tmp, MockServer() as server:
+    conf = server.configure(newConfig())
+    journalPath = os.path.join(tmp, 'journal.jsonl')
+    cards = [newCard(f'card-{i}') for i in range(6)] + [
+        newCard('card-invalid', '4111111111111112'),
+        newCard('card-0'),
+        newCard(None),
+        newCard(''),
+    ]
+
+    # interrupted run, only first cards are migrated
+    migration = CardMigration(conf, journalPath, backoff=0)
+    stats = migration.migrate(cards[:3])
+    assert stats == {'stored': 3, 'failed': 0, 'unknown': 0, 'skipped': 0}, stats
+    firstTokens = migration.readJournal()
+    assert sorted(firstTokens) == ['card-0', 'card-1', 'card-2'] and all(firstTokens.values())
+
+    # journal line cut by the interruption is ignored
+    with open(journalPath, 'ab') as journal:
+        journal.write(b'{"reference": "card-3", "res')
+
+    # resumed run skips stored cards and the duplicate, cards without reference fail
+    results = []
+    stats = migration.migrate(cards, lambda reference, result: results.append(reference))
+    assert stats == {'stored': 3, 'failed': 3, 'unknown': 0, 'skipped': 4}, stats
+    assert sorted(results, key=str) == sorted(['card-3', 'card-4', 'card-5', 'card-invalid', None, ''], key=str)
+    tokens = migration.readJournal()
+    assert sorted(tokens) == [f'card-{i}' for i in range(6)]
+    assert all(tokens[reference] == token for reference, token in firstTokens.items())
+    with open(journalPath, encoding='utf-8') as journal:
+        assert '4111' not in journal.read(), 'journal must not contain card details'
+
+    # failed card is tried again on next run
+    stats = migration.migrate(cards)
+    assert stats == {'stored': 0, 'failed': 3, 'unknown': 0, 'skipped': 7}, stats
+
+    # mapping of stored cards
+    mappingPath = os.path.join(tmp, 'mapping.csv')
+    assert migration.writeMapping(mappingPath) == 6
+    with open(mappingPath, newline='', encoding='utf-8') as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ['reference', 'cardToken']
+    assert dict(rows[1:]) == tokens
+
+    # request sent without response is journaled as unknown, and not sent again on resume
+    silent = silentServer()
+    unknownConf = newConfig()
+    unknownConf.setIpcURL('http://127.0.0.1:%d/vmp/checkout' % silent.getsockname()[1])
+    unknownConf.setAPIPublicKey(server.getAPIPublicKey())
+    unknownPath = os.path.join(tmp, 'unknown.jsonl')
+    stats = CardMigration(unknownConf, unknownPath, backoff=0).migrate([newCard('card-lost')])
+    silent.close()
+    assert stats == {'stored': 0, 'failed': 0, 'unknown': 1, 'skipped': 0}, stats
+    assert lastEntry(unknownPath)['result'] == CardMigration.RESULT_UNKNOWN
+
+    conf = server.configure(newConfig())
+    stats = CardMigration(conf, unknownPath, backoff=0).migrate([newCard('card-lost')])
+    assert stats == {'stored': 0, 'failed': 0, 'unknown': 0, 'skipped': 1}, stats
+    stats = CardMigration(conf, unknownPath, backoff=0, retryUnknown=True).migrate([newCard('card-lost')])
+    assert stats == {'stored': 1, 'failed': 0, 'unknown': 0, 'skipped': 0}, stats
+    assert list(CardMigration(conf, unknownPath).readJournal()) == ['card-lost']
+
+print('OK')
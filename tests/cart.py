@@ -0,0 +1,37 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# Cart regression checks, no network is used.
+
+from decimal import Decimal
+
+from IPC.Cart import Cart
+from IPC.IPC_Exception import IPC_Exception
+
+# items belong to one cart, not to the class
+first = Cart()
+first.add('Item', 1, 9.99)
+first.add('Delivery', 1, 5.00, Cart.ITEM_TYPE_DELIVERY)
+second = Cart()
+assert second.getItemsCount() == 0, 'New cart must be empty'
+second.add('Other', 2, 1.50)
+assert first.getItemsCount() == 2, f'Expected 2 items, got {first.getItemsCount()}'
+assert second.getItemsCount() == 1, f'Expected 1 item, got {second.getItemsCount()}'
+assert [item['name'] for item in first.getCart()] == ['Item', 'Delivery']
+
+# price with trailing garbage passes the amount pattern but is not a number
+for price in ('5abc', '1.2.3', '3e'):
+    try:
+        Cart().add('Item', 1, price)
+        raise AssertionError(f'Price {price!r} must be rejected')
+    except IPC_Exception as ex:
+        assert str(ex) == 'Invalid cart item price', ex
+try:
+    Cart().addMany([('Item', 1, '9.99'), ('Bad', 1, '5abc')])
+    raise AssertionError('Invalid price in addMany must be rejected')
+except IPC_Exception:
+    pass
+assert Cart().add('Item', 2, '9.99').getTotal() == Decimal('19.98')
+
+print('OK')
@@ -0,0 +1,88 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# Stress test: build and sign thousands of mixed requests on N threads
+# and verify that every request carries only its own params and a valid
+# signature. No network is used.
+
+import random
+import uuid
+from base64 import b64encode, b64decode
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl
+
+from IPC import Crypto
+from IPC.Config import Config
+from IPC.Defines import Defines
+from IPC.GetTxnStatus import GetTxnStatus
+from IPC.GetPaymentStatus import GetPaymentStatus
+from IPC.Refund import Refund
+from IPC.Reversal import Reversal
+from IPC.Helper import Helper
+
+THREADS = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+REQUESTS = int(sys.argv[2]) if len(sys.argv) > 2 else 4000
+
+conf = Config()
+conf.setIpcURL('https://www.mypos.eu/vmp/checkout-test')
+conf.setPrivateKeyPath(pt + '/keys/test.store_private_key.pem')
+conf.setLang('EN')
+conf.setSid('000000000000010')
+conf.setWallet('61938166610')
+conf.setKeyIndex(1)
+
+publicKey = conf.getPrivateKeyObject().publickey()
+
+
+def build(n: int):
+    orderID = f'{uuid.uuid4()}&<{n}>'
+    kind = n % 4
+    if kind == 0:
+        req = GetTxnStatus(conf)
+        req.setOrderID(orderID)
+        expected = {'IPCmethod': 'IPCGetTxnStatus', 'OrderID': orderID}
+    elif kind == 1:
+        req = GetPaymentStatus(conf)
+        req.setOrderID(orderID)
+        expected = {'IPCmethod': 'IPCGetPaymentStatus', 'OrderID': orderID}
+    elif kind == 2:
+        req = Refund(conf)
+        req.setOrderID(orderID)
+        req.setTrnref(str(n))
+        req.setAmount(round(random.uniform(1, 100), 2))
+        expected = {'IPCmethod': 'IPCRefund', 'OrderID': orderID, 'IPC_Trnref': str(n), 'Amount': str(req.getAmount())}
+    else:
+        req = Reversal(conf)
+        req.setTrnref(orderID)
+        expected = {'IPCmethod': 'IPCReversal', 'IPC_Trnref': orderID}
+
+    # build the same request twice, params of the first one must not leak into the second
+    for _ in range(2):
+        req._prepare()
+        raw = b''.join(req._buildPostRequest())
+
+    return expected, raw
+
+
+def check(expected, raw):
+    body = raw.split(b'\r\n\r\n', 1)[1].decode('utf-8')
+    params = parse_qsl(body, keep_blank_values=True)
+    names = [k for k, v in params]
+    assert len(names) == len(set(names)), f'Duplicated params: {names}'
+    assert names[-1] == 'Signature', 'Signature must be the last param'
+    values = dict(params)
+    for k, v in expected.items():
+        assert Helper.unescape(values[k]) == v, f'{k}: {values[k]} != {v}'
+
+    signData = b64encode('-'.join(Helper.unescape(v) for k, v in params[:-1]).encode('utf-8'))
+    assert Crypto.verify(signData, b64decode(values['Signature']), publicKey, Defines.SIGNATURE_ALGO), 'Signature check failed'
+
+
+with ThreadPoolExecutor(max_workers=THREADS) as executor:
+    results = list(executor.map(build, range(REQUESTS)))
+
+for expected, raw in results:
+    check(expected, raw)
+
+print(f'OK: {REQUESTS} requests signed and verified on {THREADS} threads')
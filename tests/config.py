@@ -0,0 +1,69 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# Config revision: request details invalidate the validation memo and cached header params, runtime settings keep them.
+# No network is used.
+
+import threading
+
+from IPC.Config import Config
+from IPC.GetTxnStatus import GetTxnStatus
+from IPC.IPC_Exception import IPC_Exception
+from IPC.Tracer import Tracer
+
+conf = Config()
+conf.setIpcURL('https://www.mypos.eu/vmp/checkout-test')
+conf.setPrivateKeyPath(pt + '/keys/test.store_private_key.pem')
+conf.setLang('EN')
+conf.setSid('000000000000010')
+conf.setWallet('61938166610')
+conf.setKeyIndex(1)
+
+calls = []
+getPrivateKeyObject = conf.getPrivateKeyObject
+conf.getPrivateKeyObject = lambda: calls.append(1) or getPrivateKeyObject()
+
+assert conf.validate() and conf.validate()
+assert len(calls) == 1, 'Validation must be remembered'
+header = GetTxnStatus._schema.getHeader(conf)
+
+# runtime settings keep the memo and the header
+revision = conf.getRevision()
+conf.setTracer(Tracer())
+conf.setSigner(None)
+conf.setSignatureCache(None)
+conf.setConnectionPoolSize(4)
+conf.setConnectionIdleTimeout(10.0)
+conf.setConnectionTimeout(5.0)
+assert conf.getRevision() == revision
+assert conf.validate() and len(calls) == 1
+assert GetTxnStatus._schema.getHeader(conf) is header
+
+# request details invalidate them
+conf.setSid('000000000000020')
+assert conf.getRevision() != revision
+assert conf.validate() and len(calls) == 2
+assert ('SID', ('000000000000020', '000000000000020')) in GetTxnStatus._schema.getHeader(conf)
+
+# no change is lost by setters running in parallel
+revision = conf.getRevision()
+threads = [threading.Thread(target=lambda: [conf.setLang('EN') for _ in range(1000)]) for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert conf.getRevision() == revision + 8000, conf.getRevision() - revision
+
+# frozen config rejects request details, runtime settings stay changeable
+conf.freeze()
+validations = len(calls)
+try:
+    conf.setSid('000000000000030')
+    raise AssertionError('Frozen config must not change')
+except IPC_Exception:
+    pass
+conf.setTracer(None)
+assert conf.validate() and len(calls) == validations
+
+print('OK')
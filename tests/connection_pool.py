@@ -0,0 +1,110 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+sys.path.insert(2, os.path.join(pt, 'benchmarks'))
+
+# ConnectionPool against the local MockServer: keep-alive reuse, retry of a reused connection that failed
+# before the request was written, no retry once it was written, and no socket leaked on other errors.
+
+from mock_server import MockServer
+
+from IPC.ConnectionPool import ConnectionPool
+from IPC.IPC_ConnectionException import IPC_ConnectionException
+from IPC.Tracer import Tracer
+
+
+class FakeConnection(object):
+    """
+    Idle connection put into the pool, failing as told
+    """
+    def __init__(self, sendError = None, responseError = None):
+        self.sendError = sendError
+        self.responseError = responseError
+        self.sent = False
+        self.closed = False
+
+    def isStale(self, idleTimeout):
+        return False
+
+    def touch(self):
+        pass
+
+    def send(self, data):
+        if self.sendError is not None:
+            raise self.sendError
+        self.sent = True
+
+    def hasSent(self):
+        return self.sent
+
+    def getResponse(self):
+        raise self.responseError
+
+    def close(self):
+        self.closed = True
+
+
+def request(path = '/vmp/checkout'):
+    body = b'IPCmethod=IPCGetTxnStatus'
+    head = f'POST {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Length: {len(body)}\r\nConnection: keep-alive\r\n\r\n'
+
+    return head.encode('ascii'), body
+
+
+with MockServer() as server:
+    pool = ConnectionPool(server.getURL(), 4, 30.0, 5.0)
+
+    # keep-alive connection is returned to the pool and reused
+    status, headers, body = pool.request(request())
+    assert status == 200 and body, (status, body)
+    conn, reused = pool.acquire()
+    assert reused
+    pool.release(conn)
+    stages = []
+    pool.request(request(), stages)
+    assert [stage for stage, start, end in stages] == [Tracer.STAGE_CONNECT, Tracer.STAGE_SEND, Tracer.STAGE_RECEIVE]
+    assert server.getRequestCount() == 2
+
+    # reused connection failing before any byte was written is dropped and the request is retried on a new one
+    pool.clear()
+    stale = FakeConnection(sendError=BrokenPipeError())
+    pool.release(stale)
+    status, headers, body = pool.request(request())
+    assert status == 200 and stale.closed
+    assert server.getRequestCount() == 3
+
+    # once written, the request is never repeated
+    pool.clear()
+    lost = FakeConnection(responseError=ConnectionResetError())
+    pool.release(lost)
+    try:
+        pool.request(request())
+        raise AssertionError('Lost connection must fail')
+    except IPC_ConnectionException as ex:
+        assert ex.isSent() and ex.getStage() == Tracer.STAGE_RECEIVE, (ex.isSent(), ex.getStage())
+    assert lost.closed
+    assert server.getRequestCount() == 3
+
+    # any other error closes the connection instead of leaking it
+    pool.clear()
+    broken = FakeConnection(responseError=KeyboardInterrupt())
+    pool.release(broken)
+    try:
+        pool.request(request())
+        raise AssertionError('KeyboardInterrupt must pass')
+    except KeyboardInterrupt:
+        pass
+    assert broken.closed
+    conn, reused = pool.acquire()
+    assert not reused
+    conn.close()
+
+# refused connection fails in connect stage, nothing was sent
+pool = ConnectionPool('http://127.0.0.1:1/vmp/checkout', 4, 30.0, 5.0)
+try:
+    pool.request(request())
+    raise AssertionError('Refused connection must fail')
+except IPC_ConnectionException as ex:
+    assert not ex.isSent() and ex.getStage() == Tracer.STAGE_CONNECT
+
+print('OK')
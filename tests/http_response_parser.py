@@ -0,0 +1,122 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# HttpResponseParser fed with Content-Length, chunked and read-until-close responses split at many sizes,
+# through feed() and through getBuffer()/bufferUpdated(), and with truncated or invalid input. No network is used.
+
+from IPC.HttpResponseParser import HttpResponseParser
+from IPC.IPC_ConnectionException import IPC_ConnectionException
+from IPC.IPC_Exception import IPC_Exception
+
+BODY = bytes(range(256)) * 300 + b'\r\n0\r\n\r\nend'
+
+
+def chunked(body: bytes, size: int):
+    out = b''
+    for i in range(0, len(body), size):
+        chunk = body[i:i + size]
+        out += b'%x;ext=1\r\n%s\r\n' % (len(chunk), chunk)
+
+    return out + b'0\r\nTrailer: x\r\n\r\n'
+
+
+RESPONSES = [
+    # raw response, expected status, body, keep-alive, whether the server closes the connection after it
+    (b'HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s' % (len(BODY), BODY), 200, BODY, True, False),
+    (b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n' + chunked(BODY, 1000), 200, BODY, True, False),
+    (b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\nConnection: close\r\n\r\n' + chunked(b'abc', 1), 200, b'abc', False, False),
+    (b'HTTP/1.0 200 OK\r\nContent-Type: text/plain\r\n\r\n' + BODY, 200, BODY, False, True),
+    (b'HTTP/1.1 500 Error\nContent-Length: 2\n\nok', 500, b'ok', True, False),
+    (b'HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n', 200, b'', True, False),
+    (b'HTTP/1.1 204 No Content\r\n\r\n', 204, b'', True, False),
+]
+SIZES = (1, 2, 3, 7, 64, 1000, 16384, 100000)
+
+
+def parseFed(raw: bytes, size: int, closed: bool):
+    parser = HttpResponseParser()
+    for i in range(0, len(raw), size):
+        assert not parser.isComplete()
+        parser.feed(raw[i:i + size])
+    if closed:
+        parser.feedEof()
+
+    return parser
+
+
+def parseBuffered(raw: bytes, size: int, closed: bool):
+    """
+    The way Connection.getResponse() receives with recv_into
+    """
+    parser = HttpResponseParser()
+    pos = 0
+    while not parser.isComplete():
+        if pos == len(raw):
+            parser.feedEof()
+            break
+        buf = parser.getBuffer()
+        n = min(size, len(buf), len(raw) - pos)
+        buf[:n] = raw[pos:pos + n]
+        del buf
+        parser.bufferUpdated(n)
+        pos += n
+
+    return parser
+
+
+for raw, status, body, keepAlive, closed in RESPONSES:
+    for size in SIZES:
+        for parse in (parseFed, parseBuffered):
+            parser = parse(raw, size, closed)
+            assert parser.isComplete(), (raw[:40], size, parse.__name__)
+            assert parser.getStatus() == status
+            assert bytes(parser.getBody()) == body, (raw[:40], size, parse.__name__)
+            assert parser.isKeepAlive() == keepAlive
+
+# parser is reused for the next response on the same connection
+parser = HttpResponseParser()
+for raw, status, body, keepAlive, closed in RESPONSES[:3]:
+    parser.reset()
+    parser.feed(raw)
+    assert parser.isComplete() and bytes(parser.getBody()) == body
+
+# announced Content-Length is not allocated before the data arrives
+parser = HttpResponseParser()
+parser.feed(b'HTTP/1.1 200 OK\r\nContent-Length: 1000000000000\r\n\r\nabc')
+assert len(parser.getBuffer()) <= HttpResponseParser.BODY_PREALLOC_SIZE
+
+# connection closed before and during the response
+try:
+    HttpResponseParser().feedEof()
+    raise AssertionError('Empty response must fail')
+except ConnectionError:
+    pass
+for raw in (b'HTTP/1.1 200 OK\r\nContent-Le', b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc',
+            b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\nab'):
+    parser = HttpResponseParser()
+    parser.feed(raw)
+    try:
+        parser.feedEof()
+        raise AssertionError(f'Truncated response must fail: {raw}')
+    except IPC_ConnectionException as ex:
+        assert ex.isSent()
+
+INVALID = [
+    b'garbage\r\n\r\n',
+    b'HTTP/1.1 OK\r\n\r\n',
+    b'HTTP/1.1 200 OK\r\nContent-Length: ten\r\n\r\n',
+    b'HTTP/1.1 200 OK\r\nContent-Length: -1\r\n\r\n',
+    b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n',
+    b'HTTP/1.1 200 OK\r\n' + b'X: ' + b'a' * (HttpResponseParser.MAX_LINE_SIZE + 10),
+]
+for raw in INVALID:
+    try:
+        parseFed(raw, 1000, False)
+        raise AssertionError(f'Invalid response must fail: {raw[:40]}')
+    except IPC_ConnectionException:
+        raise
+    except IPC_Exception:
+        pass
+
+print('OK')
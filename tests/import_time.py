@@ -0,0 +1,65 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# Cold-start test: import the package in a fresh interpreter with -X importtime and check that
+# "import IPC" loads no submodules nor optional dependencies, and that every scenario stays
+# within its time budget. Exits with status 1 on failure.
+
+import subprocess
+
+RUNS = 5
+"""
+ * Scenario => (statement, budget in ms of cumulative import time of the IPC package)
+"""
+SCENARIOS = {
+    'package': ('import IPC', 15),
+    'GetTxnStatus': ('from IPC import GetTxnStatus', 300),
+    'NotifyReceiver': ('from IPC import NotifyReceiver', 300),
+}
+"""
+ * Modules "import IPC" must not load
+"""
+DEFERRED = ('asyncio', 'ssl', 'Cryptodome', 'validators', 'multiprocessing', 'IPC.')
+
+
+def importTime(statement: str):
+    """
+    * Import statement in a fresh interpreter\n
+    * @param string statement\n
+    * @return tuple (float cumulative ms of top level imports from IPC on, list module names loaded from IPC on)
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], cwd=pt, capture_output=True,
+                            text=True, check=True)
+    total = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self, cumulative, name = line[len('import time:'):].split('|')
+        topLevel = not name.startswith('  ')
+        # Interpreter startup comes first. Submodules are imported after the package, on attribute access
+        if topLevel and name.strip().split('.')[0] == 'IPC' or modules:
+            modules.append(name.strip())
+            if topLevel:
+                total += int(cumulative) / 1000
+
+    return total, modules
+
+
+failed = False
+
+for scenario, (statement, budget) in SCENARIOS.items():
+    times = sorted(importTime(statement)[0] for i in range(RUNS))
+    median = times[RUNS // 2]
+    ok = median <= budget
+    failed = failed or not ok
+    print(f'{scenario:<16} {median:>8.1f} ms  budget {budget} ms  {"OK" if ok else "FAIL"}')
+
+modules = importTime('import IPC')[1]
+loaded = [name for name in modules if name.startswith(DEFERRED)]
+if loaded:
+    failed = True
+    print('import IPC loaded: ' + ', '.join(loaded))
+
+sys.exit(1 if failed else 0)
@@ -0,0 +1,102 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# MetricsRegistry outcomes of failed requests, classified by exception type, including errors raised by Response.
+# No network is used.
+
+import ssl
+from base64 import b64encode
+
+from IPC import Crypto
+from IPC.Config import Config
+from IPC.Defines import Defines
+from IPC.IPC_ConnectionException import IPC_ConnectionException
+from IPC.IPC_Exception import IPC_Exception
+from IPC.IPC_GeneralErrorException import IPC_GeneralErrorException
+from IPC.IPC_SignatureException import IPC_SignatureException
+from IPC.MetricsRegistry import MetricsRegistry
+from IPC.Response import Response
+from IPC.Trace import Trace
+from IPC.Tracer import Tracer
+
+
+def trace(error, stages):
+    t = Trace('json', 0)
+    for stage in stages:
+        t.addStage(stage, 0, 1)
+    if error is not None:
+        t.setError(error)
+    t.finish(1)
+
+    return t
+
+
+def connectionError(stage, cause):
+    try:
+        try:
+            raise cause
+        except OSError as ex:
+            raise IPC_ConnectionException(f'Error connecting IPC URL: {ex}', stage, stage != Tracer.STAGE_CONNECT) from ex
+    except IPC_ConnectionException as ex:
+        return ex
+
+
+def responseError(raw: str):
+    conf = Config()
+    conf.setAPIPublicKey(Crypto.newkeys(1024)[0].export_key().decode('ascii'))
+    try:
+        Response.getInstance(conf, raw, Defines.COMMUNICATION_FORMAT_JSON)
+    except Exception as ex:
+        return ex
+    raise AssertionError(f'Response must fail: {raw}')
+
+
+SENT = (Tracer.STAGE_PREPARE, Tracer.STAGE_SIGN, Tracer.STAGE_CONNECT, Tracer.STAGE_SEND)
+RECEIVED = SENT + (Tracer.STAGE_RECEIVE,)
+
+CASES = [
+    (None, RECEIVED + (Tracer.STAGE_PARSE, Tracer.STAGE_VERIFY), MetricsRegistry.OUTCOME_OK),
+    (IPC_Exception('Invalid Amount'), (), MetricsRegistry.OUTCOME_INVALID),
+    (connectionError(Tracer.STAGE_CONNECT, ConnectionRefusedError()), SENT[:2], MetricsRegistry.OUTCOME_CONNECT_ERROR),
+    (connectionError(Tracer.STAGE_CONNECT, ssl.SSLError()), SENT[:2], MetricsRegistry.OUTCOME_TLS_ERROR),
+    (connectionError(Tracer.STAGE_CONNECT, TimeoutError()), SENT[:2], MetricsRegistry.OUTCOME_TIMEOUT),
+    (connectionError(Tracer.STAGE_SEND, BrokenPipeError()), SENT[:3], MetricsRegistry.OUTCOME_RECEIVE_ERROR),
+    (connectionError(Tracer.STAGE_RECEIVE, ConnectionError('Connection closed by IPC host')), SENT, MetricsRegistry.OUTCOME_RECEIVE_ERROR),
+    (connectionError(Tracer.STAGE_RECEIVE, TimeoutError()), SENT, MetricsRegistry.OUTCOME_TIMEOUT),
+    (IPC_ConnectionException('Incomplete IPC response', Tracer.STAGE_RECEIVE, True), SENT, MetricsRegistry.OUTCOME_RECEIVE_ERROR),
+    (IPC_Exception('Invalid IPC response status line'), SENT, MetricsRegistry.OUTCOME_BAD_RESPONSE),
+    (IPC_SignatureException('Signature check failed!'), RECEIVED, MetricsRegistry.OUTCOME_BAD_SIGNATURE),
+    (IPC_SignatureException('Missing request signature!'), RECEIVED, MetricsRegistry.OUTCOME_BAD_SIGNATURE),
+    (responseError('{"Status": "0", "Signature": "abc"}'), RECEIVED, MetricsRegistry.OUTCOME_BAD_SIGNATURE),
+    (responseError('{"Status": "0", "Signature": "c2ln"}'), RECEIVED, MetricsRegistry.OUTCOME_BAD_SIGNATURE),
+    (responseError('{"Status": "0"}'), RECEIVED, MetricsRegistry.OUTCOME_BAD_SIGNATURE),
+    (responseError('{"Status": "3"}'), RECEIVED, MetricsRegistry.OUTCOME_IPC_ERROR),
+    (responseError('{"Status": '), RECEIVED, MetricsRegistry.OUTCOME_BAD_RESPONSE),
+    (IPC_GeneralErrorException('IPC Response - General Error!'), RECEIVED, MetricsRegistry.OUTCOME_IPC_ERROR),
+    (IPC_Exception('Invalid JSON response'), RECEIVED, MetricsRegistry.OUTCOME_BAD_RESPONSE),
+    (ValueError(), RECEIVED, MetricsRegistry.OUTCOME_ERROR),
+]
+
+registry = MetricsRegistry()
+for error, stages, outcome in CASES:
+    got = registry.getOutcome(trace(error, stages))
+    assert got == outcome, f'{error!r}: {got} != {outcome}'
+
+# parse and verify timings of a response are separate stages
+public, private = Crypto.newkeys(1024)
+conf = Config()
+conf.setAPIPublicKey(public.export_key().decode('ascii'))
+signature = b64encode(Crypto.sign(b64encode(b'0-OK'), private, Defines.SIGNATURE_ALGO)).decode('ascii')
+stages = []
+Response.getInstance(conf, '{"Status": "0", "StatusMsg": "OK", "Signature": "%s"}' % signature, Defines.COMMUNICATION_FORMAT_JSON, stages)
+assert [stage for stage, start, end in stages] == [Tracer.STAGE_PARSE, Tracer.STAGE_VERIFY], stages
+assert stages[0][2] == stages[1][1] and all(start <= end for stage, start, end in stages)
+stages = []
+try:
+    Response.getInstance(conf, '{"Status": "0", "StatusMsg": "OK", "Signature": "c2ln"}', Defines.COMMUNICATION_FORMAT_JSON, stages)
+    raise AssertionError('Response must fail')
+except IPC_SignatureException:
+    assert stages == [], stages
+
+print('OK')
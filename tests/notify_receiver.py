@@ -0,0 +1,67 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# NotifyReceiver with valid, unsigned and malformed notification bodies. No network is used.
+
+import io
+from base64 import b64encode
+from urllib.parse import urlencode
+
+from IPC import Crypto
+from IPC.Config import Config
+from IPC.NotifyReceiver import NotifyReceiver
+
+public, private = Crypto.newkeys(1024)
+conf = Config()
+conf.setAPIPublicKey(public.export_key().decode('ascii'))
+
+
+def notification(trnref: str, signature = None):
+    params = {'IPCmethod': 'IPCPurchaseNotify', 'SID': '000000000000010', 'Amount': '10.00', 'Currency': 'EUR',
+              'OrderID': 'order-1', 'IPC_Trnref': trnref}
+    if signature is None:
+        data = b64encode('-'.join(params.values()).encode('utf-8'))
+        signature = b64encode(Crypto.sign(data, private)).decode('ascii')
+    if signature:
+        params['Signature'] = signature
+
+    return urlencode(params).encode('utf-8')
+
+
+delivered = []
+receiver = NotifyReceiver(conf, delivered.append)
+
+assert receiver.handle(notification('1')) == (200, NotifyReceiver.OK)
+assert len(delivered) == 1 and delivered[0].getTrnref() == '1'
+# repeated notification is acknowledged, not delivered again
+assert receiver.handle(notification('1')) == (200, NotifyReceiver.OK)
+assert len(delivered) == 1
+
+MALFORMED = [
+    notification('2', ''),              # unsigned
+    notification('2', 'abc'),           # not base64
+    notification('2', '!!!!'),
+    notification('2', 'c2lné'),    # non-ASCII
+    notification('2', b64encode(b'x' * 128).decode('ascii')),  # well formed, wrong signature
+    b'Signature=abc',
+    b'\xff\xfe',
+    b'',
+]
+for body in MALFORMED:
+    status, reply = receiver.handle(body)
+    assert status == 400, (body, status, reply)
+assert len(delivered) == 1
+
+replies = []
+body = notification('3', 'abc')
+result = receiver.wsgi({'REQUEST_METHOD': 'POST', 'CONTENT_LENGTH': str(len(body)), 'wsgi.input': io.BytesIO(body)},
+                       lambda status, headers: replies.append(status))
+assert replies == ['400 Bad Request'] and result == [b'Invalid notification'], (replies, result)
+
+assert receiver.handle(b'x' * 100000)[0] == 413
+
+stats = receiver.getStats()
+assert stats['accepted'] == 1 and stats['duplicates'] == 1 and stats['rejected'] == len(MALFORMED) + 2, stats
+
+print('OK')
@@ -0,0 +1,89 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# ParamSchema encoding of optional card details and cached Config params of several Configs, no network is used.
+
+import datetime
+from urllib.parse import parse_qsl
+
+from IPC.Card import Card
+from IPC.Config import Config
+from IPC.GetTxnStatus import GetTxnStatus
+from IPC.IAStoreCard import IAStoreCard
+from IPC.IAStoredCardUpdate import IAStoredCardUpdate
+
+
+def newConfig(sid: str):
+    conf = Config()
+    conf.setIpcURL('https://www.mypos.eu/vmp/checkout-test')
+    conf.setPrivateKeyPath(pt + '/keys/test.store_private_key.pem')
+    conf.setEncryptPublicKeyPath(pt + '/keys/test.encrypt_key.pem')
+    conf.setLang('EN')
+    conf.setSid(sid)
+    conf.setWallet('61938166610')
+    conf.setKeyIndex(1)
+
+    return conf
+
+
+def sentParams(req):
+    req._prepare()
+    body = bytes(req._signPostParams(req._detachPostParams()).encodeBody())
+
+    return dict(parse_qsl(body.decode('ascii'), keep_blank_values=True))
+
+
+conf = newConfig('000000000000010')
+year = str(datetime.datetime.today().year + 1)
+
+# card without holder name and 3-D Secure details sends them empty, not as 'None'
+card = Card()
+card.setCardType(Card.CARD_TYPE_VISA)
+card.setCardNumber('4111111111111111')
+card.setExpMM('12')
+card.setExpYY(year)
+card.setCvc('123')
+req = IAStoreCard(conf)
+req.setCardVerification(IAStoreCard.CARD_VERIFICATION_NO)
+req.setCard(card)
+params = sentParams(req)
+for name in ('CardholderName', 'ECI', 'AVV', 'XID'):
+    assert params[name] == '', f'{name}={params[name]!r}'
+assert 'None' not in params.values()
+assert params['CVC'] not in ('', '123'), 'set CVC must be sent encrypted'
+
+# set details are sent as before
+card.setCardHolder('John Doe')
+card.setEci('05')
+card.setAvv('AAABBBCCC')
+card.setXid('xid-1')
+params = sentParams(req)
+assert (params['CardholderName'], params['ECI'], params['AVV'], params['XID']) == ('John Doe', '05', 'AAABBBCCC', 'xid-1')
+
+# stored card update by token leaves out CVC when it is not known
+card = Card()
+card.setCardType(Card.CARD_TYPE_VISA)
+card.setCardToken('token-1')
+card.setExpMM('12')
+card.setExpYY(year)
+req = IAStoredCardUpdate(conf)
+req.setCardVerification(IAStoredCardUpdate.CARD_VERIFICATION_NO)
+req.setCard(card)
+params = sentParams(req)
+assert params['CVC'] == '' and 'None' not in params.values(), params
+
+# Config params of alternating Configs stay cached for each of them
+other = newConfig('000000000000020')
+schema = GetTxnStatus._schema
+header = schema.getHeader(conf)
+otherHeader = schema.getHeader(other)
+for i in range(3):
+    assert schema.getHeader(conf) is header
+    assert schema.getHeader(other) is otherHeader
+assert ('SID', ('000000000000020', '000000000000020')) in otherHeader
+other.setSid('000000000000030')
+assert schema.getHeader(other) is not otherHeader
+assert schema.getHeader(conf) is header
+
+print('OK')
@@ -0,0 +1,48 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# PostParams.encodeBody() against urllib.parse.urlencode of the same params, no network is used.
+
+from urllib.parse import urlencode, parse_qsl
+
+from IPC.Config import Config
+from IPC.PostParams import PostParams
+from IPC.Refund import Refund
+
+VALUES = [
+    '', 'plain', 'with space', 'a+b=c&d', '100%', '/path?q=1#frag', ";:@$,!*'()[]{}|\\^`\"<>",
+    '~._-', 'tab\tnew\nline\r', 'Müller', 'Ελληνικά', '日本語', '😀', '&amp;', '\x00\x7f', ' leading and trailing ',
+]
+
+params = PostParams()
+for i, value in enumerate(VALUES):
+    params.set(f'Name_{i}', value, value)
+params.set('ünïcode name&=', 'x', 'x')
+assert bytes(params.encodeBody()) == urlencode(list(params.items())).encode('ascii')
+assert PostParams().encodeBody() == b''
+
+# signed request, values escaped by the SDK as they are sent
+conf = Config()
+conf.setIpcURL('https://www.mypos.eu/vmp/checkout-test')
+conf.setPrivateKeyPath(pt + '/keys/test.store_private_key.pem')
+conf.setLang('EN')
+conf.setSid('000000000000010')
+conf.setWallet('61938166610')
+conf.setKeyIndex(1)
+
+for value in VALUES[1:]:
+    req = Refund(conf)
+    req.setAmount(10.5)
+    req.setCurrency('EUR')
+    req.setOrderID(value)
+    req.setTrnref('trnref-1')
+    req._prepare()
+    signed = req._signPostParams(req._detachPostParams())
+    body = bytes(signed.encodeBody())
+    assert body == urlencode(list(signed.items())).encode('ascii'), value
+    assert parse_qsl(body.decode('ascii'), keep_blank_values=True) == list(signed.items())
+    head, sent = req._encodePostRequest(signed)
+    assert bytes(sent) == body
+
+print('OK')
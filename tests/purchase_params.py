@@ -0,0 +1,64 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# Checks the params collected for IPCPurchase, no network is used.
+
+from IPC.Cart import Cart
+from IPC.Config import Config
+from IPC.Customer import Customer
+from IPC.Purchase import Purchase
+
+conf = Config()
+conf.setIpcURL('https://www.mypos.eu/vmp/checkout-test')
+conf.setPrivateKeyPath(pt + '/keys/test.store_private_key.pem')
+conf.setLang('EN')
+conf.setSid('000000000000010')
+conf.setWallet('61938166610')
+conf.setKeyIndex(1)
+
+
+def newPurchase(cardTokenRequest):
+    customer = Customer()
+    customer.setEmail('name@website.com')
+    customer.setFirstName('John')
+    customer.setLastName('Smith')
+    customer.setPhone('+23568956958')
+    customer.setCountry('DEU')
+    customer.setCity('Hamburg')
+    customer.setZip('20095')
+    customer.setAddress('Kleine Bahnstr. 41')
+
+    cart = Cart()
+    cart.add('Article', 2, 10.00)
+    cart.add('Delivery', 1, 5.00, Cart.ITEM_TYPE_DELIVERY)
+
+    req = Purchase(conf)
+    req.setCurrency('EUR')
+    req.setOrderID('order-1')
+    req.setUrlOk('https://www.example.com/ok')
+    req.setUrlCancel('https://www.example.com/cancel')
+    req.setUrlNotify('https://www.example.com/notify')
+    req.setNote('Note')
+    req.setCardTokenRequest(cardTokenRequest)
+    req.setPaymentParametersRequired(Purchase.PURCHASE_TYPE_FULL)
+    req.setCustomer(customer)
+    req.setCart(cart)
+    req._prepare()
+
+    return dict(req._detachPostParams().items())
+
+
+# purchase with payment sends the amount and cart items, Delivery only for delivery items
+params = newPurchase(Purchase.CARD_TOKEN_REQUEST_NONE)
+assert float(params['Amount']) == 25.0, params.get('Amount')
+assert params['CartItems'] == '2'
+assert params['Article_1'] == 'Article' and params['Article_2'] == 'Delivery'
+assert 'Delivery_1' not in params
+assert params['Delivery_2'] == '1'
+
+# request only storing the card sends no amount nor cart
+params = newPurchase(Purchase.CARD_TOKEN_REQUEST_ONLY_STORE)
+assert 'Amount' not in params and 'CartItems' not in params and 'Article_1' not in params
+
+print('OK')
@@ -0,0 +1,74 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# PurchaseTemplate builds the same signed params as a Purchase built by hand, no network is used.
+
+from IPC.Cart import Cart
+from IPC.Config import Config
+from IPC.Customer import Customer
+from IPC.Purchase import Purchase
+from IPC.PurchaseTemplate import PurchaseTemplate
+
+conf = Config()
+conf.setIpcURL('https://www.mypos.eu/vmp/checkout-test')
+conf.setPrivateKeyPath(pt + '/keys/test.store_private_key.pem')
+conf.setLang('EN')
+conf.setSid('000000000000010')
+conf.setWallet('61938166610')
+conf.setKeyIndex(1)
+
+customer = Customer()
+customer.setEmail('name@website.com')
+customer.setFirstName('John')
+customer.setLastName('Smith & Sons')
+customer.setPhone('+23568956958')
+customer.setCountry('DEU')
+customer.setCity('Hamburg')
+customer.setZip('20095')
+customer.setAddress('Kleine Bahnstr. 41 <b>')
+
+cart = Cart()
+cart.add('Article "A"', 2, 10.00)
+cart.add('Delivery', 1, 5.00, Cart.ITEM_TYPE_DELIVERY)
+
+
+def newPurchase(purchaseType: int, cardTokenRequest: int):
+    req = Purchase(conf)
+    req.setCurrency('EUR')
+    req.setUrlOk('https://www.example.com/ok?a=1&b=2')
+    req.setUrlCancel('https://www.example.com/cancel')
+    req.setUrlNotify('https://www.example.com/notify')
+    req.setCardTokenRequest(cardTokenRequest)
+    req.setPaymentParametersRequired(purchaseType)
+
+    return req
+
+
+def handBuilt(purchaseType: int, cardTokenRequest: int, orderID: str, note: str):
+    req = newPurchase(purchaseType, cardTokenRequest)
+    req.setOrderID(orderID)
+    req.setNote(note)
+    req.setCart(cart)
+    req.setCustomer(customer)
+    req._prepare()
+
+    return list(req._signPostParams(req._detachPostParams()).items())
+
+
+for purchaseType in (Purchase.PURCHASE_TYPE_FULL, Purchase.PURCHASE_TYPE_SIMPLIFIED_CALL, Purchase.PURCHASE_TYPE_SIMPLIFIED_PAYMENT_PAGE):
+    for cardTokenRequest in (Purchase.CARD_TOKEN_REQUEST_NONE, Purchase.CARD_TOKEN_REQUEST_ONLY_STORE, Purchase.CARD_TOKEN_REQUEST_PAY_AND_STORE):
+        template = PurchaseTemplate(newPurchase(purchaseType, cardTokenRequest))
+        for n in range(3):
+            orderID, note = f'order-{n}&<x>', f'Note ü {n}'
+            expected = handBuilt(purchaseType, cardTokenRequest, orderID, note)
+            assert list(template.prepare(orderID, cart, customer, note).items()) == expected, (purchaseType, cardTokenRequest, n)
+
+# Config changed after the template was created is followed
+template = PurchaseTemplate(newPurchase(Purchase.PURCHASE_TYPE_FULL, Purchase.CARD_TOKEN_REQUEST_NONE))
+conf.setLang('DE')
+params = list(template.prepare('order-de', cart, customer, 'note').items())
+assert ('IPCLanguage', 'DE') in params
+assert params == handBuilt(Purchase.PURCHASE_TYPE_FULL, Purchase.CARD_TOKEN_REQUEST_NONE, 'order-de', 'note')
+
+print('OK')
@@ -0,0 +1,63 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# ResponseDecoder against the xmltodict decoding it replaced, no network is used.
+# xmltodict is listed in requirements_dev.txt.
+
+import json
+
+import xmltodict
+
+from IPC.Helper import Helper
+from IPC.ResponseDecoder import ResponseDecoder
+
+XML_RESPONSES = [
+    '<?xml version="1.0" encoding="UTF-8"?><Response><Status>0</Status><StatusMsg>Success</StatusMsg>'
+    '<OrderID>order-1</OrderID><Signature>c2ln</Signature></Response>',
+    # attributes on root, on containers and on leaves with and without text
+    '<?xml version="1.0" encoding="UTF-8"?>\n<Response version="1.4" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">\n'
+    '  <Status>0</Status>\n  <StatusMsg lang="en">Success</StatusMsg>\n'
+    '  <Amount currency="EUR">10.50</Amount>\n  <Flag set="1"/>\n'
+    '  <Log count="2">\n    <Item id="1"><OrderID>a</OrderID><Amount>1.00</Amount></Item>\n'
+    '    <Item id="2"><OrderID>b</OrderID><Amount>2.00</Amount></Item>\n  </Log>\n'
+    '  <Note>  padded &amp; escaped  </Note>\n  <Empty></Empty>\n  <Blank>   </Blank>\n'
+    '  <Signature>c2ln</Signature>\n</Response>',
+    # repeated top-level elements, mixed text and a single list item
+    '<Response><Status>0</Status><Card>1111</Card><Card>2222</Card>'
+    '<Mixed>text<Child>c</Child></Mixed><List><Item>only</Item></List><Signature>c2ln</Signature></Response>',
+]
+
+
+def expected(raw: str):
+    """
+    Old decoding: xmltodict output of the root content without root attributes and top-level Signature,
+    signed values are all values of that data in order
+    """
+    root = next(iter(xmltodict.parse(raw).values()))
+    data = json.loads(json.dumps(root))
+    data = {k: v for k, v in data.items() if not k.startswith('@')}
+    signature = data.pop('Signature', None)
+
+    return data, Helper.getValuesFromMultiDimensionalArray(data), signature
+
+
+for raw in XML_RESPONSES:
+    old = expected(raw)
+    for source in (raw, raw.encode('utf-8')):
+        new = ResponseDecoder.decodeXml(source)
+        assert type(new[0]) is dict, f'Expected dict, got {type(new[0])}'
+        assert new == old, f'\n{new}\n!=\n{old}'
+
+raw = '{"Status": "0", "StatusMsg": "Success", "Log": [{"OrderID": "a", "Amount": 1.5}, {}], "Empty": null, "Signature": "c2ln"}'
+data = json.loads(raw)
+signature = data.pop('Signature')
+assert ResponseDecoder.decodeJson(raw) == (data, Helper.getValuesFromMultiDimensionalArray(data), signature)
+
+try:
+    ResponseDecoder.decodeXml('<Response><Status>0</Response>')
+    raise AssertionError('Malformed XML must fail')
+except Exception as ex:
+    assert type(ex).__name__ == 'IPC_Exception', type(ex)
+
+print('OK')
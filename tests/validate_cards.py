@@ -0,0 +1,81 @@
+import sys, os
+pt = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, pt)
+
+# Helper.validateCards() must agree with Card.validate() on every card, with and without NumPy.
+
+import datetime
+import importlib
+
+from IPC.Card import Card
+from IPC.Helper import Helper
+from IPC.IPC_Exception import IPC_Exception
+
+helperModule = importlib.import_module('IPC.Helper')
+year = str(datetime.datetime.today().year + 1)
+numbers = ['4111111111111111', '4111 1111 1111 1111', '5555555555554444', '378282246310005', '4111111111111112',
+           '411111111111', '41111111111111111111', '4111-1111-1111-1111', '４１１１１１１１１１１１１１１１', '', None, 4111111111111111]
+cards = []
+for i in range(300):
+    number = numbers[i % len(numbers)]
+    cvc = ['123', '12', '1234', 'abc', None, 123][i % 6]
+    expMM = ['01', '12', '00', '13', 'x', None, 1][i % 7]
+    expYY = [year, '2000', None, 'yy'][i % 4]
+    cards.append((number, cvc, expMM, expYY))
+
+
+def cardValidate(number, cvc, expMM, expYY):
+    card = Card()
+    card.setCardNumber(number)
+    card.setCvc(cvc)
+    card.setExpMM(expMM)
+    card.setExpYY(expYY)
+    try:
+        card.validate()
+    except (IPC_Exception, AttributeError):
+        # Card.validate() expects string expire dates
+        return False
+    return True
+
+
+expected = [cardValidate(*card) for card in cards]
+expectedNumbers = [isinstance(number, str) and Helper.isValidCardNumber(number) for number, cvc, expMM, expYY in cards]
+assert any(expected) and not all(expected)
+
+
+def check(label):
+    # generators are accepted as well as lists
+    result = Helper.validateCards((c[0] for c in cards), (c[1] for c in cards), ((c[2], c[3]) for c in cards))
+    assert result == expected, f'{label}: validateCards() differs from Card.validate()'
+    assert Helper.validateCards([c[0] for c in cards]) == expectedNumbers, f'{label}: card numbers differ'
+    assert Helper.validateCards([]) == []
+
+
+# pure Python path
+numpy = helperModule.numpy
+helperModule.numpy = None
+try:
+    check('pure Python')
+finally:
+    helperModule.numpy = numpy
+
+# NumPy path, when installed
+if numpy is not None:
+    vectorizeMin = Helper.VECTORIZE_MIN
+    Helper.VECTORIZE_MIN = 1
+    try:
+        check('NumPy')
+    finally:
+        Helper.VECTORIZE_MIN = vectorizeMin
+
+# non-string CVC is invalid, not an error
+assert Helper.isValidCVC(123) is False
+assert Helper.isValidCVC(None) is False
+
+try:
+    Helper.validateCards(['4111111111111111'], ['123', '456'])
+    raise AssertionError('count mismatch must raise')
+except IPC_Exception:
+    pass
+
+print('OK')